@@ -0,0 +1,86 @@
+import numpy as np
+
+from BatchSimulation import BatchSimulation
+from Player import Player
+from Rules import Rules
+from Strategy import Strategy
+
+
+class BankrollSimulation:
+    """
+    Follows the bankrolls of many players through a session at once to measure how long their money lasts.
+    Every path is one player alone at a table with their own shoe, and every step plays one round on all of
+    the paths together with BatchSimulation. Wagers follow Game: a player with less than the minimum bet has
+    to bet everything they have left, otherwise the bet is held between the minimum and maximum bets and the
+    player's money, and insurance and doubling down are held to what the player can afford. Like
+    Game.distributeWinnings, a player is out once their money reaches 0. Each shoe is reshuffled when it
+    reaches the cut card, like Game.endRound.
+    The bet policy is a function from every path's money (an array) to the wagers it wants to make
+    (the minimum bet by default).
+    """
+
+    # Percentiles reported for the final bankroll and the round a player went broke in
+    PERCENTILES = (5, 25, 50, 75, 95)
+
+    def __init__(self, strategy: Strategy = None, bet=None, num_paths: int = 10000,
+                 starting_funds: int = Player.STARTINGFUNDS, rules: Rules = None, seed: int = None):
+        self.batch = BatchSimulation(strategy, num_paths, seed, rules)
+        self.rules = self.batch.rules
+        self.bet = bet
+        self.num_paths = num_paths
+        self.money = np.full(num_paths, starting_funds, dtype=np.int64)
+        self.shoes = self.batch.shuffledShoes(num_paths)
+        self.cursor = np.zeros(num_paths, dtype=np.intp)
+
+        # The round each path went broke in (0 while it's still playing)
+        self.ruin_round = np.zeros(num_paths, dtype=np.int64)
+        self.rounds = 0
+
+    # Returns the wager every path makes this round (0 for the paths that are out)
+    def wagers(self) -> np.ndarray:
+        if self.bet is None:
+            wanted = np.full(self.num_paths, self.rules.min_bet, dtype=np.int64)
+        else:
+            wanted = np.asarray(self.bet(self.money.copy()), dtype=np.int64)
+        wagers = np.minimum(np.clip(wanted, self.rules.min_bet, self.rules.max_bet), self.money)
+        return np.where(self.money > 0, wagers, 0)
+
+    # Plays one round on every path that isn't out yet
+    def step(self) -> None:
+        playing = self.money > 0
+        self.money += self.batch.playRound(self.shoes, self.cursor, playing, self.wagers(), self.money)
+        self.rounds += 1
+        self.ruin_round[playing & (self.money <= 0)] = self.rounds
+
+        spent = (self.shoes.shape[1] - self.cursor) <= self.batch.when_to_shuffle
+        if spent.any():
+            self.shoes[spent] = self.batch.shuffledShoes(int(spent.sum()))
+            self.cursor[spent] = 0
+
+    # Plays up to the given number of rounds (stopping early once every path is out) and returns the results
+    def run(self, rounds: int) -> dict:
+        for _ in range(rounds):
+            if not (self.money > 0).any():
+                break
+            self.step()
+        return self.results()
+
+    # Returns every path's money
+    def getMoney(self) -> np.ndarray:
+        return self.money
+
+    # Returns the round each path went broke in (0 for the paths that haven't)
+    def getRuinRounds(self) -> np.ndarray:
+        return self.ruin_round
+
+    # Returns the share of paths that went broke, the percentiles of the final bankroll, the percentiles of the
+    # round the broke paths went broke in (empty if none did), and the average number of rounds a path played
+    def results(self) -> dict:
+        ruined = self.ruin_round > 0
+        time_to_ruin = {}
+        if ruined.any():
+            time_to_ruin = dict(zip(self.PERCENTILES, np.percentile(self.ruin_round[ruined], self.PERCENTILES).tolist()))
+        return {'paths': self.num_paths, 'rounds': self.rounds, 'risk_of_ruin': float(ruined.mean()),
+                'final_bankroll': dict(zip(self.PERCENTILES, np.percentile(self.money, self.PERCENTILES).tolist())),
+                'time_to_ruin': time_to_ruin,
+                'session_length': float(np.where(ruined, self.ruin_round, self.rounds).mean())}
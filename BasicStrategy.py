@@ -0,0 +1,160 @@
+import json
+import os
+from functools import lru_cache
+
+from DealerOdds import DealerOdds
+from Game import Game
+from Rules import Rules
+from Strategy import Strategy
+
+
+class BasicStrategy:
+    """
+    Generates basic strategy (the best total-dependent play) for the Rules the game is played with (Game.RULES
+    by default): the number of decks, the BlackJack payout, whether the dealer hits soft 17, and which two card
+    hands may double down, before and after a split. There's no hole card peek (a dealer BlackJack takes doubled
+    wagers too), and a split hand that makes 21 with two cards is paid like a BlackJack (like Game.determineWinnings does).
+    Every card is assumed to come from a full shoe minus the dealer's upcard. Re-splitting isn't
+    considered when valuing a split, and pairs are never split if the rules don't allow a second hand.
+    The tables are saved in CACHEDIR the first time they're built and loaded from there afterwards, keyed by the
+    rules' digest and FORMATVERSION (bumped whenever the way the tables are built changes).
+    """
+
+    CACHEDIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'strategy_cache')
+    FORMATVERSION = 2
+
+    # Strategies already loaded in this process, by cache file
+    _LOADED = {}
+
+    # num_decks and payout_str change those rules of the given Rules (Game.RULES by default)
+    def __init__(self, num_decks: int = None, payout_str: str = None, rules: Rules = None):
+        rules = rules if rules is not None else Game.RULES
+        changes = {name: value for name, value in (('num_decks', num_decks), ('payout_str', payout_str)) if value is not None}
+        self.rules = rules.replace(**changes) if changes else rules
+        self.num_decks = self.rules.num_decks
+        self.payout_str = self.rules.payout_str
+        self.payout = self.rules.payout
+
+    # Returns the file the strategy for these rules is cached in
+    def cachePath(self) -> str:
+        return os.path.join(self.CACHEDIR, f'basic_v{self.FORMATVERSION}_{self.rules.digest()}.json')
+
+    # Returns the strategy for these rules, building and caching it the first time
+    def load(self) -> Strategy:
+        path = self.cachePath()
+        if path not in self._LOADED:
+            if os.path.exists(path):
+                with open(path) as f:
+                    tables = json.load(f)
+                strategy = Strategy(tables['hard'], tables['soft'], tables['pairs'])
+            else:
+                strategy = self.build()
+                self.save(strategy)
+            self._LOADED[path] = strategy
+        return self._LOADED[path]
+
+    # Writes the strategy's tables to the cache
+    def save(self, strategy: Strategy) -> None:
+        os.makedirs(self.CACHEDIR, exist_ok=True)
+        with open(self.cachePath(), 'w') as f:
+            json.dump({'rules': repr(self.rules), 'hard': strategy.hard, 'soft': strategy.soft, 'pairs': strategy.pairs}, f)
+
+    # Builds the hard, soft and pair tables against every dealer upcard
+    def build(self) -> Strategy:
+        strategy = Strategy()
+        for upcard in range(1, Strategy.MAXCARD+1):
+            ev = _UpcardEV(self.rules, upcard)
+            for total in range(Strategy.MAXTOTAL+1):
+                strategy.hard[total][upcard] = ev.bestAction(total, False)
+                strategy.soft[total][upcard] = ev.bestAction(total - 10, True) if 12 <= total <= 21 else Strategy.STAND
+            for card in range(1, Strategy.MAXCARD+1):
+                strategy.pairs[card][upcard] = self.rules.max_hands > 1 and ev.splitEV(card) > ev.bestEV(card * 2, card == 1)
+        return strategy
+
+
+class _UpcardEV:
+    """
+    Expected values (in units of the original wager) of every play against a single dealer upcard.
+    Hands are described by their hard total (aces counted as 1) and whether they hold an ace.
+    """
+
+    def __init__(self, rules: Rules, upcard: int):
+        counts = [4 * rules.num_decks] * 9 + [16 * rules.num_decks]
+        counts[upcard-1] -= 1
+        self.rules = rules
+        self.probs = [count / sum(counts) for count in counts]
+        self.dealer = DealerOdds(dealer_hits_soft_17=rules.dealer_hits_soft_17).finalTotals(counts, upcard)
+        self.payout = rules.payout
+        self.hitEV = lru_cache(maxsize=None)(self._hitEV)
+
+    # Returns the score of a hand
+    def _score(self, hard_total: int, has_ace: bool) -> int:
+        return hard_total + 10 if has_ace and hard_total + 10 <= 21 else hard_total
+
+    # Standing loses to a dealer BlackJack, and otherwise compares totals unless the dealer busts
+    def standEV(self, hard_total: int, has_ace: bool) -> float:
+        score = self._score(hard_total, has_ace)
+        if score > 21:
+            return -1.0
+        ev = self.dealer['bust'] - self.dealer['blackjack']
+        for dealer_score in (17, 18, 19, 20, 21):
+            if score > dealer_score:
+                ev += self.dealer[dealer_score]
+            elif score < dealer_score:
+                ev -= self.dealer[dealer_score]
+        return ev
+
+    # Takes one more card and then keeps playing the best way. A bust loses no matter what the dealer gets.
+    def _hitEV(self, hard_total: int, has_ace: bool) -> float:
+        ev = 0.0
+        for value, p in enumerate(self.probs, start=1):
+            new_total = hard_total + value
+            if new_total > 21:
+                ev -= p
+            else:
+                ev += p * self.playEV(new_total, has_ace or value == 1)
+        return ev
+
+    # Best of standing and hitting (a hand of 21 can't hit anymore, like in Game.dealPlayerCards)
+    def playEV(self, hard_total: int, has_ace: bool) -> float:
+        if self._score(hard_total, has_ace) >= 21:
+            return self.standEV(hard_total, has_ace)
+        return max(self.standEV(hard_total, has_ace), self.hitEV(hard_total, has_ace))
+
+    # Doubles the wager for exactly one more card
+    def doubleEV(self, hard_total: int, has_ace: bool) -> float:
+        ev = 0.0
+        for value, p in enumerate(self.probs, start=1):
+            ev += p * 2 * self.standEV(hard_total + value, has_ace or value == 1)
+        return ev
+
+    # Returns whether the rules let a two card hand double down
+    def canDoubleDown(self, hard_total: int, has_ace: bool, after_split: bool = False) -> bool:
+        return self.rules.canDoubleDown(self._score(hard_total, has_ace), after_split)
+
+    # Best of standing, hitting and doubling down (where the rules allow it) for a two card hand
+    def bestEV(self, hard_total: int, has_ace: bool, after_split: bool = False) -> float:
+        if not self.canDoubleDown(hard_total, has_ace, after_split):
+            return self.playEV(hard_total, has_ace)
+        return max(self.playEV(hard_total, has_ace), self.doubleEV(hard_total, has_ace))
+
+    # Value of both hands after splitting a pair. Each hand gets a second card and is then played the best way.
+    def splitEV(self, card: int) -> float:
+        ev = 0.0
+        for value, p in enumerate(self.probs, start=1):
+            if {card, value} == {1, 10}:
+                ev += p * (1 - self.dealer['blackjack']) * self.payout
+            else:
+                ev += p * self.bestEV(card + value, card == 1 or value == 1, after_split=True)
+        return 2 * ev
+
+    # Returns the table action for a hand
+    def bestAction(self, hard_total: int, has_ace: bool) -> int:
+        if self._score(hard_total, has_ace) >= 21:
+            return Strategy.STAND
+
+        stand = self.standEV(hard_total, has_ace)
+        hit = self.hitEV(hard_total, has_ace)
+        if self.canDoubleDown(hard_total, has_ace) and self.doubleEV(hard_total, has_ace) > max(stand, hit):
+            return Strategy.DOUBLE if hit > stand else Strategy.DOUBLESTAND
+        return Strategy.HIT if hit > stand else Strategy.STAND
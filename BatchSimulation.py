@@ -0,0 +1,172 @@
+import numpy as np
+
+from Card import Card
+from Game import Game
+from Rules import Rules
+from Settlement import Settlement
+from Strategy import Strategy
+
+
+class BatchSimulation:
+    """
+    Monte Carlo simulator that plays thousands of shoes at once with NumPy instead of looping over Game.
+    Each row of the shoe array is an independent shoe of card values (an ace counts as 1), and every
+    round is played on all shoes together until they reach the WHENTOSHUFFLE cut card.
+    The rules mirror Game played with the given Rules (Game.RULES by default): one player hand per round,
+    the dealer hits on 16 or less (and soft 17 under H17), and hands are settled like determineWinnings
+    (payout bonus and insurance included). Doubling down comes from the strategy's tables where the rules
+    allow it; splits aren't simulated, so pairs are played as totals.
+    Results are counted in units of the original wager.
+    """
+
+    # Card values of a single deck, in the same order as Cards deals them from a fresh deck
+    DECKVALUES = np.array(Card.VALUES, dtype=np.int8)
+
+    def __init__(self, strategy: Strategy = None, num_shoes: int = 1000, seed: int = None, rules: Rules = None):
+        self.strategy = strategy if strategy is not None else Strategy()
+        self.num_shoes = num_shoes
+        self.rng = np.random.default_rng(seed)
+        self.rules = rules if rules is not None else Game.RULES
+        self.num_decks = self.rules.num_decks
+        self.when_to_shuffle = self.rules.when_to_shuffle
+        self.settlement = Settlement(self.rules.payout)
+
+        self.hard_table = np.array(self.strategy.hard, dtype=np.int8)
+        self.soft_table = np.array(self.strategy.soft, dtype=np.int8)
+
+        self.rounds = 0
+        self.wins = 0
+        self.losses = 0
+        self.pushes = 0
+        self.blackjacks = 0
+        self.net = 0.0
+
+    # Returns num_shoes freshly shuffled shoes as a (num_shoes, cards per shoe) array of card values
+    def shuffledShoes(self, num_shoes: int) -> np.ndarray:
+        shoe = np.tile(self.DECKVALUES, self.num_decks)
+        return self.rng.permuted(np.broadcast_to(shoe, (num_shoes, shoe.size)), axis=1)
+
+    # Deals the next card of every shoe, but only moves past it for the shoes in the mask.
+    # A shoe in the mask that has run out of cards raises an IndexError, like Cards.getCard.
+    def _draw(self, shoes: np.ndarray, cursor: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        if (mask & (cursor >= shoes.shape[1])).any():
+            raise IndexError('A shoe ran out of cards in the middle of a round')
+        cards = shoes[np.arange(shoes.shape[0]), np.minimum(cursor, shoes.shape[1]-1)]
+        cursor += mask
+        return np.where(mask, cards, 0)
+
+    # Returns the scores and soft flags for hands with the given hard totals and ace counts
+    def _score(self, hard: np.ndarray, aces: np.ndarray) -> (np.ndarray, np.ndarray):
+        soft = (aces > 0) & (hard + 10 <= 21)
+        return np.where(soft, hard + 10, hard), soft
+
+    # Looks up the strategy's action for every hand
+    def _actions(self, score: np.ndarray, soft: np.ndarray, upcard: np.ndarray) -> np.ndarray:
+        score = np.minimum(score, Strategy.MAXTOTAL)
+        return np.where(soft, self.soft_table[score, upcard], self.hard_table[score, upcard])
+
+    # Plays one round on every shoe in the mask and returns each shoe's winnings (0 for shoes not playing).
+    # Every round is played for one unit unless it's given each shoe's (integer) wager and the money behind it,
+    # in which case insurance and doubling down are held to what the player can afford, like Game.
+    def playRound(self, shoes: np.ndarray, cursor: np.ndarray, playing: np.ndarray, wagers: np.ndarray = None,
+                  money: np.ndarray = None) -> np.ndarray:
+        # One card to the player and the dealer, and then a second card to each
+        player_first = self._draw(shoes, cursor, playing)
+        dealer_first = self._draw(shoes, cursor, playing)
+        player_second = self._draw(shoes, cursor, playing)
+        dealer_second = self._draw(shoes, cursor, playing)
+
+        player_hard = (player_first + player_second).astype(np.int16)
+        player_aces = (player_first == 1).astype(np.int8) + (player_second == 1)
+        dealer_hard = (dealer_first + dealer_second).astype(np.int16)
+        dealer_aces = (dealer_first == 1).astype(np.int8) + (dealer_second == 1)
+        upcard = dealer_first
+
+        player_score, player_soft = self._score(player_hard, player_aces)
+        dealer_score, _ = self._score(dealer_hard, dealer_aces)
+        player_blackjack = player_score == 21
+        dealer_blackjack = dealer_score == 21
+        player_size = np.full(shoes.shape[0], 2, dtype=np.int16)
+        dealer_size = player_size.copy()
+
+        insuring = playing & (upcard == 1) & self.strategy.takesInsurance()
+        if wagers is None:
+            wagers = np.ones(shoes.shape[0])
+            insurance = np.where(insuring, 0.5, 0.0)
+        else:
+            insurance = np.where(insuring & (money > wagers), np.minimum(wagers // 2, money - wagers), 0)
+
+        # A double down gets exactly one more card. A player can't double down on a BlackJack.
+        turn = playing & ~player_blackjack
+        actions = self._actions(player_score, player_soft, upcard)
+        doubling = turn & ((actions == Strategy.DOUBLE) | (actions == Strategy.DOUBLESTAND))
+        if self.rules.double_totals is not None:
+            doubling &= np.isin(player_score, self.rules.double_totals)
+        if money is not None:
+            doubling &= wagers * 2 + insurance <= money
+        card = self._draw(shoes, cursor, doubling)
+        player_hard += card
+        player_size += doubling
+        player_aces += card == 1
+        turn &= ~doubling
+
+        # Players keep hitting until the strategy stands, they reach 21, or they bust
+        while True:
+            player_score, player_soft = self._score(player_hard, player_aces)
+            actions = self._actions(player_score, player_soft, upcard)
+            turn &= (player_score < 21) & ((actions == Strategy.HIT) | (actions == Strategy.DOUBLE))
+            if not turn.any():
+                break
+            card = self._draw(shoes, cursor, turn)
+            player_hard += card
+            player_aces += card == 1
+            player_size += turn
+        player_score, _ = self._score(player_hard, player_aces)
+
+        # The dealer plays out their hand unless they have a BlackJack
+        dealer_turn = playing & ~dealer_blackjack
+        while True:
+            dealer_score, dealer_soft = self._score(dealer_hard, dealer_aces)
+            dealer_turn &= (dealer_score <= 16) | ((dealer_score == 17) & dealer_soft & self.rules.dealer_hits_soft_17)
+            if not dealer_turn.any():
+                break
+            card = self._draw(shoes, cursor, dealer_turn)
+            dealer_hard += card
+            dealer_aces += card == 1
+            dealer_size += dealer_turn
+
+        # Settled like Game.determineWinnings
+        winnings, outcomes = self.settlement.settle(player_score, player_size, wagers, insurance, doubling, dealer_score,
+                                                    dealer_size)
+        winnings[~playing] = 0
+        outcomes = outcomes[playing]
+
+        self.rounds += int(playing.sum())
+        self.wins += int(((outcomes == Settlement.WIN) | (outcomes == Settlement.BLACKJACK)).sum())
+        self.losses += int(((outcomes == Settlement.LOSS) | (outcomes == Settlement.BUST)).sum())
+        self.pushes += int((outcomes == Settlement.PUSH).sum())
+        self.blackjacks += int((playing & player_blackjack).sum())
+        self.net += float(winnings.sum())
+        return winnings
+
+    # Plays every given shoe round by round until each one reaches the cut card, like Game.endRound
+    def playShoes(self, shoes: np.ndarray) -> dict:
+        cursor = np.zeros(shoes.shape[0], dtype=np.intp)
+        playing = np.ones(shoes.shape[0], dtype=bool)
+        while playing.any():
+            self.playRound(shoes, cursor, playing)
+            playing &= (shoes.shape[1] - cursor) > self.when_to_shuffle
+        return self.results()
+
+    # Plays at least the given number of rounds, num_shoes shoes at a time, and returns the totals
+    def run(self, rounds: int) -> dict:
+        target = self.rounds + rounds
+        while self.rounds < target:
+            self.playShoes(self.shuffledShoes(self.num_shoes))
+        return self.results()
+
+    # Returns the totals so far. 'net' is from the player's point of view, in units of the original wager
+    # (or in money for rounds played with wagers).
+    def results(self) -> dict:
+        return {'rounds': self.rounds, 'wins': self.wins, 'losses': self.losses, 'pushes': self.pushes,
+                'blackjacks': self.blackjacks, 'net': self.net}
@@ -0,0 +1,153 @@
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from Card import Card
+from Cards import Cards
+from Player import Player
+from Scoring import Scoring
+from Simulation import Simulation
+
+
+class Benchmark:
+    """
+    Times the game's hot paths and reports operations per second (the best of REPEATS timings, like timeit)
+    and the peak memory allocated while running a single call of each case.
+    Results can be saved as a baseline file and later runs are compared against it: any case that got
+    slower (or allocates more) than the baseline by more than the threshold is flagged as a regression.
+    Run it with: python Benchmark.py [--save] [--baseline FILE] [--threshold 0.1]
+    """
+
+    BASELINEFILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+    THRESHOLD = 0.10
+
+    # Minimum time (in seconds) of each timing and how many timings are taken per case
+    MINTIME = 0.1
+    REPEATS = 5
+
+    # Representative hands for Scoring.totalScore: hard, soft, multi-ace, busted and split-sized hands
+    HANDS = [[Card.code(name) for name in hand] for hand in (
+        ['10 of spades', '7 of hearts'], ['A of clubs', '6 of diamonds'], ['A of spades', 'A of hearts', '9 of clubs'],
+        ['5 of clubs', '4 of hearts', '3 of spades', '2 of diamonds', 'A of clubs'], ['K of hearts', '6 of clubs', '9 of spades'],
+        ['8 of hearts'], ['A of spades', 'K of spades'], ['2 of clubs', '3 of hearts', '4 of diamonds', '5 of spades', '6 of clubs'])]
+
+    def __init__(self, min_time: float = MINTIME):
+        self.min_time = min_time
+
+    # Returns every benchmark case as (name, function, operations per call)
+    def cases(self) -> [(str, callable, int)]:
+        cards = Cards()
+        scoring = Scoring()
+        player = Player('Benchmark')
+        sim = Simulation(num_players=3, seed=0)
+
+        def getCard():
+            cards.shuffle()
+            for _ in range(100):
+                cards.getCard()
+
+        def totalScore():
+            for hand in self.HANDS:
+                scoring.totalScore(hand)
+
+        def splitAndDouble():
+            player.resetPlayer()
+            player.setWager(20)
+            player.addCard(Card.code('8 of spades'))
+            player.addCard(Card.code('8 of hearts'))
+            player.split()
+            player.addCard(Card.code('3 of clubs'))
+            player.addCard(Card.code('2 of clubs'), 2)
+            player.doubleDown()
+            player.doubleDown(2)
+
+        return [('Cards.getCard', getCard, 100),
+                ('Cards.shuffle', cards.shuffle, 1),
+                ('Scoring.totalScore', totalScore, len(self.HANDS)),
+                ('Player.split/doubleDown', splitAndDouble, 1),
+                ('Game round (3 players)', sim.playRound, 1)]
+
+    # Returns how long the given number of calls take
+    def _time(self, func: callable, calls: int) -> float:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        return time.perf_counter() - start
+
+    # Times a single case and measures the memory it allocates
+    def measure(self, func: callable, ops_per_call: int) -> dict:
+        # Warm up and find how many calls take at least min_time
+        calls = 1
+        while self._time(func, calls) < self.min_time:
+            calls *= 2
+        elapsed = min(self._time(func, calls) for _ in range(self.REPEATS))
+
+        peak_bytes = 0
+        tracemalloc.start()
+        for _ in range(self.REPEATS):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            func()
+            peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1] - before)
+        tracemalloc.stop()
+
+        return {'ops_per_sec': calls * ops_per_call / elapsed, 'peak_bytes': peak_bytes}
+
+    # Runs every case
+    def run(self) -> dict:
+        return {name: self.measure(func, ops) for name, func, ops in self.cases()}
+
+    # Returns the cases that regressed past the threshold compared to the baseline
+    def compare(self, results: dict, baseline: dict, threshold: float = THRESHOLD) -> [str]:
+        regressions = []
+        for name, result in results.items():
+            if name not in baseline:
+                continue
+            if result['ops_per_sec'] < baseline[name]['ops_per_sec'] * (1 - threshold):
+                regressions.append(f'{name}: {result["ops_per_sec"]:,.0f} ops/sec (baseline {baseline[name]["ops_per_sec"]:,.0f})')
+            # A few hundred bytes is within tracemalloc's own noise
+            if result['peak_bytes'] > max(baseline[name]['peak_bytes'] * (1 + threshold), baseline[name]['peak_bytes'] + 256):
+                regressions.append(f'{name}: {result["peak_bytes"]:,} peak bytes (baseline {baseline[name]["peak_bytes"]:,})')
+        return regressions
+
+    # Reads a baseline file (an empty baseline if it doesn't exist yet)
+    def loadBaseline(self, path: str = BASELINEFILE) -> dict:
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    # Writes the results as the new baseline
+    def saveBaseline(self, results: dict, path: str = BASELINEFILE) -> None:
+        with open(path, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the game\'s hot paths')
+    parser.add_argument('--baseline', default=Benchmark.BASELINEFILE, help='baseline file to compare against')
+    parser.add_argument('--threshold', type=float, default=Benchmark.THRESHOLD, help='allowed slowdown before flagging (0.1 = 10%%)')
+    parser.add_argument('--save', action='store_true', help='save these results as the new baseline')
+    args = parser.parse_args()
+
+    b = Benchmark()
+    results = b.run()
+    baseline = b.loadBaseline(args.baseline)
+    for name, result in results.items():
+        change = ''
+        if name in baseline:
+            change = f'  ({result["ops_per_sec"] / baseline[name]["ops_per_sec"] - 1:+.1%} vs baseline)'
+        print(f'{name:<26}{result["ops_per_sec"]:>16,.0f} ops/sec{result["peak_bytes"]:>12,} peak bytes{change}')
+
+    if args.save:
+        b.saveBaseline(results, args.baseline)
+        print(f'Saved baseline to {args.baseline}')
+    else:
+        regressions = b.compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        sys.exit(1 if regressions else 0)
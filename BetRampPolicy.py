@@ -0,0 +1,42 @@
+from Policy import Policy
+
+
+class BetRampPolicy(Policy):
+    """
+    Policy that sizes each wager from the shoe's true count (see Cards.trueCount) and leaves every other
+    decision to another policy. The ramp maps a true count (rounded down) to a number of minimum bets:
+    counts below the lowest key bet the lowest key's units and counts above the highest key bet the highest
+    key's units. Game still keeps the wager within the min/max bet and the player's money.
+    """
+
+    # Default ramp for Hi-Lo: 1 unit up to a true count of 1, then 2, 4, 6 and 8 units at true counts 2, 3, 4
+    # and 5 or more
+    DEFAULTRAMP = {1: 1, 2: 2, 3: 4, 4: 6, 5: 8}
+
+    def __init__(self, ramp: dict = None, play_policy: Policy = None):
+        self.ramp = ramp if ramp is not None else self.DEFAULTRAMP
+        self.play_policy = play_policy if play_policy is not None else Policy()
+        self.min_count = min(self.ramp)
+        self.max_count = max(self.ramp)
+
+    # Returns the number of minimum bets to wager at the given true count
+    def units(self, true_count: float) -> int:
+        count = min(max(int(true_count // 1), self.min_count), self.max_count)
+        while count not in self.ramp:
+            count -= 1
+        return self.ramp[count]
+
+    def wager(self, player, game) -> int:
+        return self.units(game.CARDS.trueCount()) * game.getMinBet()
+
+    def insurance(self, player, game) -> int:
+        return self.play_policy.insurance(player, game)
+
+    def doubleDown(self, player, hand_num: int, game) -> bool:
+        return self.play_policy.doubleDown(player, hand_num, game)
+
+    def split(self, player, hand_num: int, game) -> bool:
+        return self.play_policy.split(player, hand_num, game)
+
+    def hit(self, player, hand_num: int, game) -> bool:
+        return self.play_policy.hit(player, hand_num, game)
@@ -0,0 +1,50 @@
+_RANKNAMES = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+_SUITS = ('spades', 'clubs', 'diamonds', 'hearts')
+_RANKVALUES = (2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 1)
+
+# Every card of a single deck. A card's code is its index in this tuple.
+_NAMES = tuple(f'{rank} of {suit}' for rank in _RANKNAMES for suit in _SUITS)
+_RANKS = tuple(code // len(_SUITS) for code in range(len(_NAMES)))
+
+
+class Card:
+    """
+    The card model used everywhere cards are dealt, held and scored: a card is an int code from 0 to 51,
+    its index in NAMES (ranks 2 to A, each in the four SUITS), so cards are compared and scored with
+    table lookups instead of string handling. Every code has a precomputed rank, BlackJack value (an ace
+    counts as 1), ace flag and display string. Cards only become text when they're shown to a player,
+    with NAMES, code() and handStr().
+    """
+
+    RANKNAMES = _RANKNAMES
+    SUITS = _SUITS
+    RANKVALUES = _RANKVALUES
+
+    # Every card of a single deck in code order, and each card's code
+    NAMES = _NAMES
+    CODES = {name: code for code, name in enumerate(_NAMES)}
+
+    # Lookup tables by card code: rank (index into RANKNAMES), BlackJack value, whether it's an ace,
+    # and how the card is shown in a hand
+    RANKS = _RANKS
+    VALUES = tuple(_RANKVALUES[rank] for rank in _RANKS)
+    ISACE = tuple(_RANKNAMES[rank] == 'A' for rank in _RANKS)
+    DISPLAY = tuple(repr(name) for name in _NAMES)
+
+    # Shown in place of the dealer's face-down card
+    HIDDEN = repr('?')
+
+    # Returns the code of a card given its name, e.g. code('10 of hearts')
+    @staticmethod
+    def code(name: str) -> int:
+        return Card.CODES[name]
+
+    # Returns the name of a card, e.g. '10 of hearts'
+    @staticmethod
+    def name(code: int) -> str:
+        return Card.NAMES[code]
+
+    # Returns a hand the way it's shown to the players, e.g. ['10 of hearts', 'A of spades']
+    @staticmethod
+    def handStr(hand: [int]) -> str:
+        return '[' + ', '.join([Card.DISPLAY[code] for code in hand]) + ']'
@@ -1,38 +1,233 @@
 import random
+from array import array
+from collections import deque
+from Card import Card
+from CountSystem import CountSystem
 
-_VALUES = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-_SUITS = ['spades', 'clubs', 'diamonds', 'hearts']
+# Frozen shoe templates shared by every shoe with the same number of decks: the full deck's card codes
+# as a tuple and as bytes. Each is built the first time a shoe of that size is made.
+_SHOETEMPLATES = {}
+
+# Tags of a shoe that isn't being counted
+_NOTAGS = (0,) * len(Card.NAMES)
+
+# Random number generator of the shoes that weren't given their own
+_SHAREDRNG = random.Random()
+
+
+# Returns the (card codes, card code bytes) template of a shoe with the given number of decks
+def _shoeTemplate(num_decks: int) -> (tuple, bytes):
+    if num_decks not in _SHOETEMPLATES:
+        _SHOETEMPLATES[num_decks] = (tuple(range(len(Card.NAMES))) * num_decks, bytes(range(len(Card.NAMES))) * num_decks)
+    return _SHOETEMPLATES[num_decks]
 
 class Cards:
 
     # Const for the deck and how many full decks should be used
-    FULLDECK = []
     NUMDECKS = 4
+    FULLDECK = _shoeTemplate(NUMDECKS)[0]
+
+    # How many discarded cards a continuous shuffling machine holds back before mixing them in again
+    CSMBUFFER = 20
+
+    # Every card of a single deck in code order, and each card's code (see Card)
+    CARDNAMES = Card.NAMES
+    CARDCODES = Card.CODES
+
+    # A shoe can be given its own random number generator so independent shoes (e.g. one per
+    # simulation worker) can be seeded separately; otherwise it shares one with every other unseeded shoe.
+    # A shoe can also keep a running count for a card counting system as cards are dealt,
+    # and be given the table's Rules to take its number of decks and its shuffling (shoe or CSM) from.
+    def __init__(self, rng: random.Random = None, count_system: CountSystem = None, rules=None):
+        if rules is not None:
+            self.NUMDECKS = rules.num_decks
+        # The full deck is the frozen template shared by every shoe of this size, so it's never copied
+        self.FULLDECK, codes = _shoeTemplate(self.NUMDECKS)
+        self.rng = rng if rng is not None else _SHAREDRNG
 
-    def __init__(self):
-        for value in _VALUES:
-            for suit in _SUITS:
-                self.FULLDECK.append(f'{value} of {suit}')
+        # The shoe holds one byte-sized card code per card. Cards before the cursor have been dealt
+        # and cards from the cursor onwards are still in the shoe. It's the only thing a new shoe allocates.
+        self.shoe = array('B', codes)
+        self.cursor = 0
 
-        self.FULLDECK = self.FULLDECK * self.NUMDECKS
-        self.currDeck = self.FULLDECK[:]
+        # Where the current round started dealing: the cards dealt before it are the discards (see startRound)
+        self.round_start = 0
+        self.setCountSystem(count_system)
+        self.buffer = None
+        self.buffer_size = 0
+        if rules is not None and rules.continuous_shuffle:
+            self.setContinuous(rules.csm_buffer)
 
     # Picks a random card from the current deck, removes it,
-    # and returns which card was picked
-    def getCard(self) -> str:
-        cardPicked = random.choice(self.currDeck)
-        self.currDeck.remove(cardPicked)
-        return cardPicked
-
-    # Shuffles the cards by simply reassigning the current deck
-    # to the full deck
+    # and returns which card was picked (as a Card code).
+    # This is one step of a Fisher-Yates shuffle: a random card left in the shoe is swapped
+    # to the cursor and the cursor moves past it, so every draw is O(1).
+    # A shoe that runs out in the middle of a round has its discards shuffled back in (see reshuffleDiscards).
+    def getCard(self) -> int:
+        shoe = self.shoe
+        cursor = self.cursor
+        picked = cursor + int(self.rng.random() * (len(shoe) - cursor))
+        try:
+            code = shoe[picked]
+        except IndexError:
+            self.reshuffleDiscards()
+            return self.getCard()
+        shoe[picked] = shoe[cursor]
+        shoe[cursor] = code
+        self.cursor = cursor + 1
+        self.running_count += self.tags[code]
+        return code
+
+    # Shuffles the cards by putting every dealt card back in the shoe.
+    # The shoe isn't copied since each draw already picks a random card from what's left.
+    # A continuous shuffler's dealt cards aren't kept in order, so it starts again from a full shoe.
     def shuffle(self) -> None:
-        self.currDeck = self.FULLDECK[:]
+        if self.buffer is not None:
+            self.shoe = array('B', _shoeTemplate(self.NUMDECKS)[1])
+            self.buffer.clear()
+        self.cursor = 0
+        self.running_count = self.initial_count
+
+    # Marks the start of a round (Game does it when a round is announced): every card dealt before it is a discard
+    def startRound(self) -> None:
+        self.round_start = self.cursor
+
+    # Puts the discards back into a shoe that ran out in the middle of a round, like a dealer shuffling the discard
+    # tray, while the cards of the round stay out on the table. The running count starts over from those cards.
+    # A continuous shuffler mixes in every card held back in its buffer instead.
+    # Raises an IndexError if there are no discards to put back.
+    def reshuffleDiscards(self) -> None:
+        shoe = self.shoe
+        if self.buffer is not None:
+            buffer = self.buffer
+            if not buffer:
+                raise IndexError('The shuffling machine ran out of cards in the middle of a round')
+            while buffer:
+                code = buffer.popleft()
+                self.cursor -= 1
+                shoe[self.cursor] = code
+                self.running_count -= self.tags[code]
+            return
+
+        if self.round_start == 0:
+            raise IndexError('The shoe ran out of cards in the middle of a round')
+        table = shoe[self.round_start:self.cursor]
+        shoe[:self.cursor] = table + shoe[:self.round_start]
+        self.cursor = len(table)
+        self.round_start = 0
+        self.running_count = self.initial_count + sum(self.tags[code] for code in table)
+
+    # Turns the shoe into a continuous shuffling machine (CSM) that holds back the given number of discarded
+    # cards before mixing them in again (None turns it back into a shoe, which starts full again).
+    # A CSM is only reshuffled wholesale if its buffer holds so many cards that the shoe reaches the cut card.
+    def setContinuous(self, buffer_size: int = CSMBUFFER) -> None:
+        if buffer_size is None:
+            if self.buffer is not None:
+                self.shuffle()
+            self.buffer = None
+            self.buffer_size = 0
+        else:
+            if self.buffer is None:
+                self.buffer = deque()
+            self.buffer_size = buffer_size
+
+    # Returns whether the cards are dealt from a continuous shuffling machine
+    def isContinuous(self) -> bool:
+        return self.buffer is not None
+
+    # Puts the cards of a finished round into a continuous shuffler. They wait in its buffer, and every card
+    # pushed out of the buffer goes back into the shoe in O(1): the dealt part of the shoe isn't needed by a CSM,
+    # so the card simply takes the last dealt slot. Does nothing for a shoe, which is only refilled by shuffle().
+    # Raises a ValueError if more cards come back than are out on the table (dealt and not discarded yet).
+    def discard(self, cards: [int]) -> None:
+        buffer = self.buffer
+        if buffer is None:
+            return
+        cards = list(cards)
+        if len(cards) > self.cursor - len(buffer):
+            raise ValueError(f'Can\'t discard {len(cards)} cards when only {self.cursor - len(buffer)} are out on the table')
+        buffer.extend(cards)
+
+        shoe = self.shoe
+        tags = self.tags
+        while len(buffer) > self.buffer_size:
+            code = buffer.popleft()
+            self.cursor -= 1
+            shoe[self.cursor] = code
+            self.running_count -= tags[code]
+
+    # Returns everything that decides which cards are dealt next: the shoe, the cursor, the random number
+    # generator, the running count and a continuous shuffler's buffer. Cards given the same state deal the
+    # same cards, which lets several tables branch off one shoe (see Tournament).
+    def getState(self) -> tuple:
+        buffer = tuple(self.buffer) if self.buffer is not None else None
+        return bytes(self.shoe), self.cursor, self.rng.getstate(), self.running_count, buffer
+
+    # Puts the cards back in a state returned by getState()
+    def setState(self, state: tuple) -> None:
+        shoe, self.cursor, rng_state, self.running_count, buffer = state
+        self.shoe = array('B', shoe)
+        self.rng.setstate(rng_state)
+        if self.buffer is not None:
+            self.buffer = deque(buffer if buffer is not None else ())
+
+    # Returns how many discarded cards are waiting in a continuous shuffler's buffer
+    def bufferedCards(self) -> int:
+        return len(self.buffer) if self.buffer is not None else 0
+
+    # Sets the counting system the running count is kept for (None to stop counting).
+    # The running count is caught up with the cards that aren't in the shoe.
+    def setCountSystem(self, count_system: CountSystem) -> None:
+        self.count_system = count_system
+        if count_system is None:
+            self.tags = _NOTAGS
+            self.initial_count = 0
+        else:
+            self.tags = [count_system.tag(value) for value in Card.VALUES]
+            self.initial_count = count_system.initialCount(self.NUMDECKS)
+        self.running_count = self.initial_count + sum(self.tags) * self.NUMDECKS - sum(self.tags[code] for code in self.shoe[self.cursor:])
+
+    # Returns the counting system being used (None if the shoe isn't being counted)
+    def getCountSystem(self) -> CountSystem:
+        return self.count_system
+
+    # Returns the running count of every card dealt since the last shuffle
+    def runningCount(self) -> int:
+        return self.running_count
+
+    # Returns how many decks are left in the current deck
+    def decksRemaining(self) -> float:
+        return self.deckSize() / len(Card.NAMES)
+
+    # Returns the running count per deck left in the current deck
+    def trueCount(self) -> float:
+        return self.running_count / max(self.decksRemaining(), 1 / len(Card.NAMES))
+
+    # Returns the cards left in the current deck. Their order in the shoe doesn't matter
+    # (draws are random), so they're listed in the same order as a full deck.
+    @property
+    def currDeck(self) -> [int]:
+        counts = [0] * len(Card.NAMES)
+        for code in self.shoe[self.cursor:]:
+            counts[code] += 1
+
+        cards = []
+        for deck in range(max(counts)):
+            cards.extend(code for code in range(len(Card.NAMES)) if counts[code] > deck)
+        return cards
+
+    # Returns how many cards of each value are left in the current deck.
+    # Index 0 holds the aces (worth 1) and indexes 1-9 hold the cards worth 2-10.
+    def valueCounts(self) -> [int]:
+        counts = [0] * 10
+        for code in self.shoe[self.cursor:]:
+            counts[Card.VALUES[code]-1] += 1
+        return counts
 
     # Returns the size of the current deck
     def deckSize(self) -> int:
-        return len(self.currDeck)
+        return len(self.shoe) - self.cursor
 
     # Returns number of full decks being used
     def getNumDecks(self) -> int:
-        return self.NUMDECKS
\ No newline at end of file
+        return self.NUMDECKS
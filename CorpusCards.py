@@ -0,0 +1,61 @@
+from Cards import Cards
+from CountSystem import CountSystem
+
+
+class CorpusCards(Cards):
+    """
+    Cards that deals the pre-shuffled shoes of a ShoeCorpus in order instead of shuffling its own.
+    The current shoe is a view into the corpus file, so dealing never copies or allocates a shoe.
+    Every shuffle moves on to the next shoe of its range, starting over from the first one after the
+    last. Give each worker or table its own range (see ShoeCorpus.partition) and none of them share a shoe.
+    """
+
+    def __init__(self, corpus, shoes: range = None, count_system: CountSystem = None):
+        self.corpus = corpus
+        self.shoes = shoes if shoes is not None else range(corpus.numShoes())
+        if len(self.shoes) == 0:
+            raise ValueError('CorpusCards needs at least one shoe')
+        self.NUMDECKS = corpus.getNumDecks()
+        super().__init__(count_system=count_system)
+        self.shoe_index = 0
+        self.shoe = corpus.shoe(self.shoes[0])
+
+    # Deals the next card of the current shoe
+    def getCard(self) -> int:
+        try:
+            code = self.shoe[self.cursor]
+        except IndexError:
+            self.reshuffleDiscards()
+        self.cursor += 1
+        self.running_count += self.tags[code]
+        return code
+
+    # The corpus' shoes are read-only, so they can't take discards back in a continuous shuffling machine.
+    # Raises a ValueError when asked to be one (None is fine: the cards are already dealt like a shoe).
+    def setContinuous(self, buffer_size: int = Cards.CSMBUFFER) -> None:
+        if buffer_size is not None:
+            raise ValueError('A shoe corpus\' shoes are read-only, so they can\'t be dealt from a continuous shuffling machine')
+        super().setContinuous(None)
+
+    # The corpus' shoes are read-only and dealt in a fixed order, so a shoe that runs out in the middle of a round
+    # can't take its discards back. Raises an IndexError: deal the corpus with a cut card that leaves enough cards.
+    def reshuffleDiscards(self) -> None:
+        raise IndexError(f'Shoe {self.getShoeNum()} of the corpus ran out of cards in the middle of a round')
+
+    # Moves on to the next shoe
+    def shuffle(self) -> None:
+        self.shoe_index = (self.shoe_index + 1) % len(self.shoes)
+        self.shoe = self.corpus.shoe(self.shoes[self.shoe_index])
+        super().shuffle()
+
+    # The corpus decides the order of the cards, so the state is just where in it the cards are
+    def getState(self) -> tuple:
+        return self.shoe_index, self.cursor, self.running_count
+
+    def setState(self, state: tuple) -> None:
+        self.shoe_index, self.cursor, self.running_count = state
+        self.shoe = self.corpus.shoe(self.shoes[self.shoe_index])
+
+    # Returns the number of the shoe being dealt in the corpus
+    def getShoeNum(self) -> int:
+        return self.shoes[self.shoe_index]
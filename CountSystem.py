@@ -0,0 +1,30 @@
+class CountSystem:
+    """
+    A card counting system: the tag added to the running count for each card value (an ace counts as 1)
+    and the running count a fresh shoe starts at. Balanced systems start at 0. Unbalanced systems like KO
+    start lower so that their key count lands on the same value no matter how many decks are used.
+    """
+
+    def __init__(self, name: str, tags: [int], initial_per_deck: int = 0, initial_offset: int = 0):
+        self.name = name
+        self.tags = tags
+        self.initial_per_deck = initial_per_deck
+        self.initial_offset = initial_offset
+
+    # Returns the system's name
+    def getName(self) -> str:
+        return self.name
+
+    # Returns the tag of a card value (an ace counts as 1)
+    def tag(self, value: int) -> int:
+        return self.tags[value-1]
+
+    # Returns the running count at the start of a shoe with the given number of decks
+    def initialCount(self, num_decks: int) -> int:
+        return self.initial_per_deck * num_decks + self.initial_offset
+
+
+# Tags are listed for card values A, 2, 3, 4, 5, 6, 7, 8, 9, 10
+CountSystem.HILO = CountSystem('Hi-Lo', [-1, 1, 1, 1, 1, 1, 0, 0, 0, -1])
+CountSystem.KO = CountSystem('KO', [-1, 1, 1, 1, 1, 1, 1, 0, 0, -1], initial_per_deck=-4, initial_offset=4)
+CountSystem.OMEGAII = CountSystem('Omega II', [0, 1, 1, 2, 2, 2, 1, 0, -1, -2])
@@ -1,8 +1,20 @@
+from Card import Card
+from Scoring import Scoring
+
+# Value of every card code, looked up for each card added to a hand
+_CARDVALUES = Card.VALUES
+
 class Dealer:
+    SCORING = Scoring()
+
+    # Slotted and reset in place, like Player
+    __slots__ = ('hand', 'totalScore', 'hard_total', 'aces', 'turn')
 
     def __init__(self):
         self.hand = []
         self.totalScore = 0
+        self.hard_total = 0
+        self.aces = 0
         self.turn = False
 
     # Return whether or not it's the dealer's turn
@@ -14,7 +26,7 @@ class Dealer:
         self.turn = is_turn
 
     # Return the dealer's current hand
-    def getHand(self) -> [str]:
+    def getHand(self) -> [int]:
         return self.hand
 
     # Sets the dealer's total score of the dealer's hand
@@ -25,15 +37,27 @@ class Dealer:
     def getTotalScore(self) -> int:
         return self.totalScore
 
-    # Adds a card to the dealer's hand
-    def addCard(self, card: str) -> None:
+    # Returns whether the dealer's hand has an ace counted as 11
+    def isSoft(self) -> bool:
+        return self.SCORING.isSoft(self.hard_total, self.aces)
+
+    # Adds a card to the dealer's hand.
+    # The hard total and ace count are kept up to date so the score never has to be recounted.
+    def addCard(self, card: int) -> None:
+        value = _CARDVALUES[card]
         self.hand.append(card)
+        self.hard_total += value
+        if value == 1:
+            self.aces += 1
+        self.totalScore = self.SCORING.handScore(self.hard_total, self.aces)
 
     # Returns the dealer's current hand size
     def handSize(self) -> int:
         return len(self.hand)
 
-    # Resets the necessary attributes after the round is over
+    # Resets the necessary attributes after the round is over, in place
     def resetDealer(self) -> None:
-        self.hand = []
-        self.totalScore = 0
\ No newline at end of file
+        self.hand.clear()
+        self.totalScore = 0
+        self.hard_total = 0
+        self.aces = 0
@@ -0,0 +1,85 @@
+from functools import lru_cache
+
+from Cards import Cards
+
+
+class DealerOdds:
+    """
+    Exact probabilities of the dealer's final hand for a given upcard and the cards left in the shoe.
+    The dealer follows the same rule as Game.dealDealerCards: hit on 16 or less and stand on 17 or more,
+    except for a soft 17 when the dealer hits soft 17 (H17, see Rules).
+    Shoe compositions are given as value counts (see Cards.valueCounts) that no longer include the upcard.
+    Every dealer hand reached along the way is memoized in a bounded LRU cache, so asking again about
+    the same shoe (or one the recursion already went through) is nearly free.
+    """
+
+    STANDSCORE = 17
+    CACHESIZE = 1 << 16
+
+    # Final hands in the order of the probability tuples used internally
+    OUTCOMES = (17, 18, 19, 20, 21, 'bust')
+
+    def __init__(self, cache_size: int = CACHESIZE, dealer_hits_soft_17: bool = False):
+        self.dealer_hits_soft_17 = dealer_hits_soft_17
+        self._play = lru_cache(maxsize=cache_size)(self._playHand)
+
+    # Returns the probability of each final hand for a dealer that has to keep playing the given hand.
+    # counts is a tuple indexed like Cards.valueCounts.
+    def _playHand(self, hard_total: int, has_ace: bool, counts: (int,)) -> (float,):
+        soft = has_ace and hard_total + 10 <= 21
+        score = hard_total + 10 if soft else hard_total
+        if score > 21:
+            return (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+        if score >= self.STANDSCORE and not (score == self.STANDSCORE and soft and self.dealer_hits_soft_17):
+            return tuple(1.0 if score == outcome else 0.0 for outcome in self.OUTCOMES)
+
+        cards_left = sum(counts)
+        if cards_left == 0:
+            raise ValueError('The shoe ran out of cards before the dealer finished their hand')
+
+        odds = [0.0] * len(self.OUTCOMES)
+        for index, count in enumerate(counts):
+            if count == 0:
+                continue
+            remaining = counts[:index] + (count - 1,) + counts[index+1:]
+            value = index + 1
+            for i, p in enumerate(self._play(hard_total + value, has_ace or value == 1, remaining)):
+                odds[i] += p * count / cards_left
+        return tuple(odds)
+
+    # Returns the probability of each of the dealer's final hands: 17 to 21, 'bust', and 'blackjack'
+    # (a natural 21, which isn't included in 21). upcard is a card value where an ace counts as 1.
+    def finalTotals(self, counts: [int], upcard: int) -> dict:
+        counts = tuple(counts)
+        cards_left = sum(counts)
+        if cards_left == 0:
+            raise ValueError('The shoe has no cards left for the dealer\'s hole card')
+
+        odds = [0.0] * len(self.OUTCOMES)
+        blackjack = 0.0
+        for index, count in enumerate(counts):
+            if count == 0:
+                continue
+            hole = index + 1
+            if {upcard, hole} == {1, 10}:
+                blackjack += count / cards_left
+                continue
+            remaining = counts[:index] + (count - 1,) + counts[index+1:]
+            for i, p in enumerate(self._play(upcard + hole, upcard == 1 or hole == 1, remaining)):
+                odds[i] += p * count / cards_left
+
+        totals = dict(zip(self.OUTCOMES, odds))
+        totals['blackjack'] = blackjack
+        return totals
+
+    # Returns the dealer's final hand probabilities for the cards left in the given shoe
+    def fromCards(self, cards: Cards, upcard: int) -> dict:
+        return self.finalTotals(cards.valueCounts(), upcard)
+
+    # Returns the probability that the dealer busts
+    def bustProbability(self, counts: [int], upcard: int) -> float:
+        return self.finalTotals(counts, upcard)['bust']
+
+    # Empties the memoized dealer hands (e.g. after the shoe is reshuffled)
+    def clearCache(self) -> None:
+        self._play.cache_clear()
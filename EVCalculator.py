@@ -0,0 +1,188 @@
+from functools import lru_cache
+
+from Card import Card
+from DealerOdds import DealerOdds
+from Game import Game
+from Player import Player
+from Rules import Rules
+from Scoring import Scoring
+
+
+class EVCalculator:
+    """
+    Expected value (in units of the hand's original wager) of standing, hitting, doubling down and splitting,
+    given the player's hand, the dealer's upcard and the exact cards left in the shoe.
+    Play follows Game and the Rules it's played with (Game.RULES by default): the BlackJack payout, whether the
+    dealer hits soft 17, no hole card peek (a dealer BlackJack takes doubled wagers too), which two card totals
+    may double down, before and after a split (Game._canDoubleDown), a double down gets exactly one more card
+    (Player.doubleDown), a player can't hit on 21, and a pair can be split up to the
+    rules' max_hands hands (Player.split) with a two card 21 on a split hand paid like a BlackJack. Like Game._canSplit,
+    only two cards of the same rank are a pair, so a ten drawn to a split 10, J, Q or K only splits again if it's
+    the same rank. The shoe only holds card values, so the tens left are taken to be spread evenly over TENRANKS.
+    The odds of every card the player draws come from the exact shoe, with each drawn card taken out.
+    The dealer's final hand odds are computed exactly (DealerOdds) for the shoe at the time of the decision,
+    but aren't recomputed for every card the player might draw after it, which would take seconds instead of
+    milliseconds. Split hands are valued one at a time (the cards drawn to the other hands aren't taken out
+    of the shoe). Both are the usual approximations of a composition-dependent calculator. Game deals to the
+    first split hand first, so re-splits are credited to the first of the two hands.
+    Hands are memoized by shoe composition and the dealer odds they're valued against, so the hands one decision's
+    recursion reaches are shared by all of its plays (stand, hit, double down and split), and asking about the same
+    decision again is free. Every new decision in a shoe has new dealer odds, so it's valued from scratch: keying
+    the hands on the shoe alone would need the dealer's odds for every shoe the player's draws lead to, which
+    makes a split take seconds.
+    """
+
+    # Ranks worth 10 (10, J, Q and K)
+    TENRANKS = Card.RANKVALUES.count(10)
+    CACHESIZE = 1 << 18
+    SCORING = Scoring()
+
+    # payout and dealer_hits_soft_17 change those rules of the given Rules, and so do dealer odds the calculator is given
+    def __init__(self, payout: float = None, dealer_odds: DealerOdds = None, cache_size: int = CACHESIZE,
+                 dealer_hits_soft_17: bool = None, rules: Rules = None):
+        rules = rules if rules is not None else Game.RULES
+        if dealer_odds is not None:
+            dealer_hits_soft_17 = dealer_odds.dealer_hits_soft_17
+        if dealer_hits_soft_17 is not None:
+            rules = rules.replace(dealer_hits_soft_17=dealer_hits_soft_17)
+        self.rules = rules
+        self.payout = payout if payout is not None else rules.payout
+        self.max_hands = rules.max_hands
+        self.dealer_odds = dealer_odds if dealer_odds is not None else DealerOdds(dealer_hits_soft_17=rules.dealer_hits_soft_17)
+        self.standEV = lru_cache(maxsize=cache_size)(self._standEV)
+        self.playEV = lru_cache(maxsize=cache_size)(self._playEV)
+        self.splitHandEV = lru_cache(maxsize=cache_size)(self._splitHandEV)
+
+    # Returns the shoe with one card of the given value taken out
+    def _remove(self, counts: (int,), value: int) -> (int,):
+        return counts[:value-1] + (counts[value-1] - 1,) + counts[value:]
+
+    # Returns the value of every card that can be drawn from the shoe with its probability and the shoe left after it
+    def _draws(self, counts: (int,)) -> [(int, float, (int,))]:
+        cards_left = sum(counts)
+        return [(index + 1, count / cards_left, self._remove(counts, index + 1))
+                for index, count in enumerate(counts) if count > 0]
+
+    # Returns the dealer's final hand odds as a tuple: 17 to 21, bust, and BlackJack
+    def dealerOdds(self, upcard: int, counts: (int,)) -> (float,):
+        totals = self.dealer_odds.finalTotals(counts, upcard)
+        return tuple(totals[outcome] for outcome in DealerOdds.OUTCOMES) + (totals['blackjack'],)
+
+    # Standing loses to a dealer BlackJack, and otherwise compares totals unless the dealer busts
+    def _standEV(self, hard_total: int, has_ace: bool, dealer: (float,)) -> float:
+        score = self.SCORING.handScore(hard_total, 1 if has_ace else 0)
+        if score > 21:
+            return -1.0
+
+        ev = dealer[5] - dealer[6]
+        for dealer_score, p in zip(DealerOdds.OUTCOMES[:5], dealer):
+            if score > dealer_score:
+                ev += p
+            elif score < dealer_score:
+                ev -= p
+        return ev
+
+    # Takes one more card and then keeps playing the best way. A bust loses no matter what the dealer gets.
+    def hitEV(self, hard_total: int, has_ace: bool, counts: (int,), dealer: (float,)) -> float:
+        ev = 0.0
+        for value, p, remaining in self._draws(counts):
+            if hard_total + value > 21:
+                ev -= p
+            else:
+                ev += p * self.playEV(hard_total + value, has_ace or value == 1, remaining, dealer)
+        return ev
+
+    # Best of standing and hitting (a hand of 21 can't hit anymore, like in Game.dealPlayerCards)
+    def _playEV(self, hard_total: int, has_ace: bool, counts: (int,), dealer: (float,)) -> float:
+        stand = self.standEV(hard_total, has_ace, dealer)
+        if self.SCORING.handScore(hard_total, 1 if has_ace else 0) >= 21:
+            return stand
+        return max(stand, self.hitEV(hard_total, has_ace, counts, dealer))
+
+    # Doubles the wager for exactly one more card
+    def doubleEV(self, hard_total: int, has_ace: bool, counts: (int,), dealer: (float,)) -> float:
+        ev = 0.0
+        for value, p, _ in self._draws(counts):
+            ev += p * 2 * self.standEV(hard_total + value, has_ace or value == 1, dealer)
+        return ev
+
+    # Value of one hand started with the given card after a split, which may still split into up to
+    # `resplits` more hands. The hand gets its second card and is then played the best way (split again,
+    # double down, hit or stand).
+    def _splitHandEV(self, card: int, resplits: int, counts: (int,), dealer: (float,)) -> float:
+        ev = 0.0
+        for value, p, remaining in self._draws(counts):
+            if {card, value} == {1, 10}:
+                ev += p * (1 - dealer[6]) * self.payout
+                continue
+
+            has_ace = card == 1 or value == 1
+            best = self.playEV(card + value, has_ace, remaining, dealer)
+            if self.rules.canDoubleDown(self.SCORING.handScore(card + value, 1 if has_ace else 0), True):
+                best = max(best, self.doubleEV(card + value, has_ace, remaining, dealer))
+            if value == card and resplits > 0:
+                resplit = max(best, self.splitHandEV(card, resplits - 1, remaining, dealer)
+                              + self.splitHandEV(card, 0, remaining, dealer))
+                same_rank = 1 / self.TENRANKS if card == 10 else 1
+                best = same_rank * resplit + (1 - same_rank) * best
+            ev += p * best
+        return ev
+
+    # Returns the value of splitting a pair of the given card when the player has the given number of hands
+    def splitEV(self, card: int, hands: int, counts: (int,), dealer: (float,)) -> float:
+        resplits = self.max_hands - hands - 1
+        return self.splitHandEV(card, resplits, counts, dealer) + self.splitHandEV(card, 0, counts, dealer)
+
+    # Returns the EV of every play for a hand. hand holds card values (an ace counts as 1), counts is the
+    # shoe (see Cards.valueCounts) without the player's cards or the upcard, and num_hands is how many hands
+    # the player has. same_rank says whether two cards of the same value are also the same rank, which Game
+    # needs to split them (e.g. 10 and K aren't). 'double' and 'split' are None when the play isn't allowed.
+    def analyze(self, hand: [int], upcard: int, counts: [int], num_hands: int = 1, same_rank: bool = True) -> dict:
+        counts = tuple(counts)
+        dealer = self.dealerOdds(upcard, counts)
+        hard_total = sum(hand)
+        has_ace = 1 in hand
+        score = self.SCORING.handScore(hard_total, 1 if has_ace else 0)
+
+        evs = {'stand': self.standEV(hard_total, has_ace, dealer), 'hit': None, 'double': None, 'split': None}
+        if score < 21:
+            evs['hit'] = self.hitEV(hard_total, has_ace, counts, dealer)
+        if len(hand) == 2 and evs['hit'] is not None and self.rules.canDoubleDown(score, num_hands > 1):
+            evs['double'] = self.doubleEV(hard_total, has_ace, counts, dealer)
+        if len(hand) == 2 and hand[0] == hand[1] and same_rank and num_hands < self.max_hands:
+            evs['split'] = self.splitEV(hand[0], num_hands, counts, dealer)
+        return evs
+
+    # Returns the best play for a hand and its EV
+    def bestPlay(self, hand: [int], upcard: int, counts: [int], num_hands: int = 1, same_rank: bool = True) -> (str, float):
+        evs = self.analyze(hand, upcard, counts, num_hands, same_rank)
+        return max(((play, ev) for play, ev in evs.items() if ev is not None), key=lambda item: item[1])
+
+    # Analyzes a player's hand in a game that's being played. The dealer's hole card hasn't been seen,
+    # so it's counted as still being in the shoe. Raises a ValueError if the game isn't played with the
+    # calculator's rules (make one with EVCalculator(rules=game.getRules())).
+    def fromGame(self, game: Game, player: Player, hand_num: int = 1) -> dict:
+        if not self.playsBy(game.getRules()):
+            raise ValueError(f'The game is played with {game.getRules()!r}, not the calculator\'s {self.rules!r}')
+
+        counts = game.CARDS.valueCounts()
+        for card in game.DEALER.getHand()[1:]:
+            counts[self.SCORING.cardValue(card)-1] += 1
+
+        cards = player.getHand(hand_num)
+        hand = [self.SCORING.cardValue(card) for card in cards]
+        upcard = self.SCORING.cardValue(game.getDealerUpCard())
+        same_rank = len(cards) == 2 and Card.RANKS[cards[0]] == Card.RANKS[cards[1]]
+        return self.analyze(hand, upcard, counts, player.getNumHands(), same_rank)
+
+    # Returns whether the given Rules would be valued the same way as the calculator's
+    def playsBy(self, rules: Rules) -> bool:
+        return (rules.payout, rules.dealer_hits_soft_17, rules.max_hands, rules.double_totals, rules.double_after_split) == \
+            (self.payout, self.rules.dealer_hits_soft_17, self.max_hands, self.rules.double_totals, self.rules.double_after_split)
+
+    # Empties every memoized hand (e.g. after the shoe is reshuffled)
+    def clearCache(self) -> None:
+        self.standEV.cache_clear()
+        self.playEV.cache_clear()
+        self.splitHandEV.cache_clear()
+        self.dealer_odds.clearCache()
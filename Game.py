@@ -1,25 +1,106 @@
+from Card import Card
 from Player import Player
 from Dealer import Dealer
 from Cards import Cards
 from Scoring import Scoring
+from Policy import Policy
+from Instrumentation import Instrumentation
+from HandHistory import HandHistory
+from HandHistoryWriter import HandHistoryWriter
+from Statistics import Statistics
+from Rules import Rules
 
 class Game:
 
-    # Constants for min bet, max bet, payout as a string, payout as a float, and when to shuffle
-    MINBET = 20
-    MAXBET = 500
-    BLACKJACKPAYOUTSTR = '3:2'
-    BLACKJACKPAYOUT = int(BLACKJACKPAYOUTSTR.split(':')[0]) / int(BLACKJACKPAYOUTSTR.split(':')[1])
-    DEALER = Dealer()
-    CARDS = Cards()
+    # The default rules, and the constants for min bet, max bet, payout as a string, payout as a float, and when to
+    # shuffle that come from them. A game played with other rules has its own copy of these constants.
+    RULES = Rules()
+    MINBET = RULES.min_bet
+    MAXBET = RULES.max_bet
+    BLACKJACKPAYOUTSTR = RULES.payout_str
+    BLACKJACKPAYOUT = RULES.payout
     SCORING = Scoring()
-    WHENTOSHUFFLE = (CARDS.getNumDecks() * 52) // 3
+    WHENTOSHUFFLE = RULES.when_to_shuffle
     # WHENTOSHUFFLE is a const int that indicates how many cards need to be left before reshuffling the deck
 
-    def __init__(self):
+    # Policy used in headless mode for players that weren't given their own decision policy
+    DEFAULTPOLICY = Policy()
+
+    def __init__(self, headless: bool = False, output=None, cards: Cards = None, dealer: Dealer = None,
+                 instrumentation: Instrumentation = None, history: HandHistoryWriter = None, statistics: Statistics = None,
+                 rules: Rules = None):
+        """
+        A headless game never blocks on input(): every decision is made by the player's policy
+        (or DEFAULTPOLICY) and all messages go to the output sink, which is any callable taking
+        a str (None discards them). An interactive game prints to the console unless given a sink.
+        Every game deals from its own shoe (CARDS) to its own dealer (DEALER) unless it's given
+        them. A game can also be given optional instrumentation that records per-phase timings and counters, a
+        HandHistoryWriter that records every round, and Statistics that every settled hand
+        is added to (so long runs don't need to keep each round's winnings).
+        A game is played with RULES unless it's given other Rules, which its own shoe is then made with too.
+        """
+        if rules is not None:
+            self.RULES = rules
+            self.MINBET = rules.min_bet
+            self.MAXBET = rules.max_bet
+            self.BLACKJACKPAYOUTSTR = rules.payout_str
+            self.BLACKJACKPAYOUT = rules.payout
+            self.WHENTOSHUFFLE = rules.when_to_shuffle
+        self.CARDS = cards if cards is not None else Cards(rules=rules)
+        self.DEALER = dealer if dealer is not None else Dealer()
         self.players = []
         self.roundOver = True
         self.winnings = []
+        self.lastWinnings = []
+        self.headless = headless
+        self.output = output
+        self.instrumentation = None
+        self.setInstrumentation(instrumentation)
+        self.history = None
+        self.setHistory(history)
+        self.statistics = statistics
+
+    def _print(self, message: str = '') -> None:
+        """
+        Private helper function that sends a message to the output sink, or the console if there isn't one
+        """
+        if self.output is not None:
+            self.output(message)
+        elif not self.headless:
+            print(message)
+
+    def _pause(self) -> None:
+        """
+        Private helper function that waits for the player to press Enter (skipped in headless mode)
+        """
+        if not self.headless:
+            input('')
+
+    def _askYesNo(self, prompt: str) -> bool:
+        """
+        Private helper function that keeps prompting the player until they answer Y or N
+        """
+        answer = input(prompt)
+        while (answer.upper() != 'Y') and (answer.upper() != 'N'):
+            answer = input(prompt)
+        return answer.upper() == 'Y'
+
+    def _recordAction(self, player: Player, hand_num: int, action: int) -> None:
+        """
+        Private helper function that adds a player's decision (one of HandHistory's actions) to the hand history
+        """
+        if self.history is not None:
+            self.history.recordAction(player, hand_num, action)
+
+    def _getPolicy(self, player: Player) -> Policy:
+        """
+        Private helper function that returns the policy making the player's decisions.
+        None means the player gets prompted with input() instead.
+        """
+        policy = player.getPolicy()
+        if policy is None and self.headless:
+            policy = self.DEFAULTPOLICY
+        return policy
 
     def _determineWager(self, player: Player) -> int:
         """
@@ -28,6 +109,7 @@ class Game:
         have left
         """
         player_money = player.getMoney()
+        policy = self._getPolicy(player)
         wager_is_int = False
 
         # Accounting for user error of inputting anything other than an int for the wager.
@@ -35,29 +117,33 @@ class Game:
             try:
                 # Covering the edge case of a player have less money left than the minimum bet.
                 if player_money < self.MINBET:
-                    print()
-                    print(f'Since you currently have less money than the minimum bet (${self.MINBET}), you\'ll have to bet all your money!')
-                    breakpoint = input('')
+                    self._print()
+                    self._print(f'Since you currently have less money than the minimum bet (${self.MINBET}), you\'ll have to bet all your money!')
+                    self._pause()
                     wager = player_money
 
+                # A policy can't be prompted again, so its wager is kept within the valid range instead.
+                elif policy is not None:
+                    wager = max(self.MINBET, min(policy.wager(player, self), self.MAXBET, player_money))
+
                 # Makes sure player bets within the range of the preset min and max bet.
                 # Also, the player must have enough money left to make the bet.
                 else:
                     wager = int(input(f'Please make a wager from ${self.MINBET} to ${self.MAXBET}: '))
                     while (wager < self.MINBET) or (wager > self.MAXBET) or (wager > player_money):
                         if wager < self.MINBET:
-                            print(f'Sorry, you must bet at least ${self.MINBET}.')
+                            self._print(f'Sorry, you must bet at least ${self.MINBET}.')
                         elif wager > self.MAXBET:
-                            print(f'Sorry, you can\'t bet more than ${self.MAXBET}.')
+                            self._print(f'Sorry, you can\'t bet more than ${self.MAXBET}.')
                         elif wager > player_money:
-                            print('You don\'t have enough money to make that bet!')
-                        print()
+                            self._print('You don\'t have enough money to make that bet!')
+                        self._print()
                         wager = int(input(f'Please make a wager from ${self.MINBET} to ${self.MAXBET}: '))
                 wager_is_int = True
 
             except ValueError:
-                print('Must give an int for your wager.')
-                print()
+                self._print('Must give an int for your wager.')
+                self._print()
 
         return wager
 
@@ -68,8 +154,8 @@ class Game:
         cannot be more than the amount of money the player has left (after their wage is deducted)
         """
         insurance_wager_is_int = False
-        print(f'Total money left (after your wager of ${player.getWager()}): ${player.getMoney()-player.getWager()}')
-        breakpoint = input('')
+        self._print(f'Total money left (after your wager of ${player.getWager()}): ${player.getMoney()-player.getWager()}')
+        self._pause()
 
         # Accounting for user error of inputting anything other than an int for the wager.
         while not insurance_wager_is_int:
@@ -77,18 +163,18 @@ class Game:
                 insurance_wager = int(input(f'Please make an insurance wager from $1 to ${player.getWager() // 2} '))
                 while (insurance_wager < 1) or (insurance_wager > player.getWager() // 2) or (player.getMoney() - player.getWager() - insurance_wager < 0):
                     if insurance_wager < 1:
-                        print('Sorry, you can\'t wager anything less than $1.')
+                        self._print('Sorry, you can\'t wager anything less than $1.')
                     elif insurance_wager > player.getWager() // 2:
-                        print(f'Sorry, you can\'t wager anything more than ${player.getWager() // 2}.')
+                        self._print(f'Sorry, you can\'t wager anything more than ${player.getWager() // 2}.')
                     else:
-                        print('You don\'t have enough money to make that bet!')
-                    print()
+                        self._print('You don\'t have enough money to make that bet!')
+                    self._print()
                     insurance_wager = int(input(f'Please make an insurance wager from $1 to ${player.getWager() // 2} '))
                 insurance_wager_is_int = True
 
             except ValueError:
-                print('Insurance wager must be an int.')
-                print()
+                self._print('Insurance wager must be an int.')
+                self._print()
 
         return insurance_wager
 
@@ -120,9 +206,9 @@ class Game:
     def determineWinnings(self) -> None:
         dealer_hand = self.DEALER.getHand()
         dealer_score = self.DEALER.getTotalScore()
-        print('~~~~~~~~~~~~~~~Final Standings~~~~~~~~~~~~~~~')
-        print(f'Dealer\'s final hand: {dealer_hand} === {dealer_score} points')
-        breakpoint = input('')
+        self._print('~~~~~~~~~~~~~~~Final Standings~~~~~~~~~~~~~~~')
+        self._print(f'Dealer\'s final hand: {Card.handStr(dealer_hand)} === {dealer_score} points')
+        self._pause()
 
         for player in self.players:
             for hand_num in range(1, player.getNumHands()+1):
@@ -133,36 +219,47 @@ class Game:
 
                 # If dealer gets a BlackJack, the player loses their wager unless they also have a BlackJack.
                 # Also, they win twice their insurance wager if they chose to make one at the beginning of the round.
+                insurance_won = False
                 if dealer_score == 21 and self.DEALER.handSize() == 2:
+                    insurance_won = insurance_wager > 0
                     if player_score == 21 and player.handSize(hand_num) == 2:
                         winning = 0 + (insurance_wager * 2)
+                        outcome = Statistics.PUSH
                     else:
                         winning = (wager * -1) + (insurance_wager * 2)
+                        outcome = Statistics.LOSS
 
                 # Payout for a BlackJack is based on the preset amount
                 elif player_score == 21 and player.handSize(hand_num) == 2:
                     winning = int(wager * self.BLACKJACKPAYOUT) + (insurance_wager * -1)
+                    outcome = Statistics.BLACKJACK
 
                 # If player busts, they lose their wager regardless of what hand the dealer has (even if dealer busts)
                 elif player_score > 21:
                     winning = (wager * -1) + (insurance_wager * -1)
+                    outcome = Statistics.BUST
 
                 # If the dealer busts or the player has a higher score than the dealer, they win their wager back
                 elif dealer_score > 21 or player_score > dealer_score:
                     winning = wager + (insurance_wager * -1)
+                    outcome = Statistics.WIN
 
                 # If neither the player nor dealer busts, but the player has a lower score than the dealer,
                 # the player loses their wager.
                 elif player_score < dealer_score:
                     winning = (wager * -1) + (insurance_wager * -1)
+                    outcome = Statistics.LOSS
 
                 # The last case is where the player has the same score as the dealer.
                 else:
                     winning = 0 + (insurance_wager * -1)
+                    outcome = Statistics.PUSH
 
-                print(f'<{player.getName()}> Hand #{hand_num}: {player_hand} === {player_score} points | Winnings: {winning}')
+                self._print(f'<{player.getName()}> Hand #{hand_num}: {Card.handStr(player_hand)} === {player_score} points | Winnings: {winning}')
                 self.winnings.append((player, winning))
-                breakpoint = input('')
+                if self.statistics is not None:
+                    self.statistics.add(winning, outcome, player.getName(), wager, insurance_won)
+                self._pause()
         self.distributeWinnings()
 
     # Distributes all the winnings (or losings) back to the players and
@@ -174,9 +271,9 @@ class Game:
         # Kick a player out of the round if they're out of money
         for player in self.players[:]:
             if player.getMoney() <= 0:
-                print(f'Sorry, {player.getName()}! You\'re out of money :( Thanks for playing!')
+                self._print(f'Sorry, {player.getName()}! You\'re out of money :( Thanks for playing!')
                 self.removePlayer(player)
-                breakpoint = input('')
+                self._pause()
 
         self.endRound()
 
@@ -184,52 +281,80 @@ class Game:
     # New players are not allowed to join until the round is over.
     # Also, a round can't be started if there's no players in the game yet.
     def newRound(self) -> None:
-        self.roundOver = False
-
-        print()
-        print('~~~~~~~~~~Welcome Challengers!~~~~~~~~~~')
-        print(f'For this round we\'re using {self.CARDS.getNumDecks()} full decks and we have {len(self.players)} challengers playing.')
-        print(f'The current number of cards left in the deck is {self.CARDS.deckSize()}')
-        print(f'The deck will be reshuffled after {self.CARDS.deckSize() - self.WHENTOSHUFFLE} more cards are drawn')
+        self._announceRound()
 
         # For each player, print their name and total money, and then ask them to make a wager
         for player in self.players:
-            print()
-            print(f'Player: {player.getName()}')
-            print(f'Total Money: ${player.getMoney()}')
+            self._print()
+            self._print(f'Player: {player.getName()}')
+            self._print(f'Total Money: ${player.getMoney()}')
 
             player.setWager(self._determineWager(player))
 
-        print()
-        print('~~~~~~~~~~Let the round begin. Good luck!~~~~~~~~~~')
-        print()
+        self._print()
+        self._print('~~~~~~~~~~Let the round begin. Good luck!~~~~~~~~~~')
+        self._print()
         self.dealInitialCards()
 
+    def _announceRound(self) -> None:
+        """
+        Private helper function that marks the round as started and welcomes the players
+        """
+        self.roundOver = False
+        self.CARDS.startRound()
+        if self.history is not None:
+            self.history.startRound(self)
+
+        self._print()
+        self._print('~~~~~~~~~~Welcome Challengers!~~~~~~~~~~')
+        self._print(f'For this round we\'re using {self.CARDS.getNumDecks()} full decks and we have {len(self.players)} challengers playing.')
+        self._print(f'The current number of cards left in the deck is {self.CARDS.deckSize()}')
+        self._print(f'The deck will be reshuffled after {self.CARDS.deckSize() - self.WHENTOSHUFFLE} more cards are drawn')
+
     # Ends the round, clearing all of the hands and previous winnings
     def endRound(self) -> None:
+        if self.history is not None:
+            self.history.endRound(self)
         self.roundOver = True
+        self.lastWinnings = self.winnings
         self.winnings = []
+        if self.CARDS.isContinuous():
+            self._discardCards()
 
         # Shuffles the cards if necessary
         if self.CARDS.deckSize() <= self.WHENTOSHUFFLE:
             self.CARDS.shuffle()
-            print('Shuffling cards...')
-            breakpoint = input('')
+            self._print('Shuffling cards...')
+            self._pause()
 
         # Accounts for edge case that all the players lose their money and get kicked out of the game
         if self.getNumPlayers() > 0:
-            print('~~~~~~~~~~~~~~~Everyone\'s Total Money~~~~~~~~~~~~~~~')
+            self._print('~~~~~~~~~~~~~~~Everyone\'s Total Money~~~~~~~~~~~~~~~')
             for player in self.players:
                 player.resetPlayer()
-                print(f'{player.getName()}: ${player.getMoney()}')
+                self._print(f'{player.getName()}: ${player.getMoney()}')
         else:
-            print('There\'s no more players left! Everyone ran out of money :(')
+            self._print('There\'s no more players left! Everyone ran out of money :(')
 
         self.DEALER.resetDealer()
 
-        print()
-        print('The round is over! Good game everyone!')
-        breakpoint = input('')
+        self._print()
+        self._print('The round is over! Good game everyone!')
+        self._pause()
+
+    # Abandons a round that couldn't be finished (e.g. one that raised): no hand is settled, so everyone keeps the
+    # money they had before it, and every hand is cleared so the next round starts from an empty table
+    def abortRound(self) -> None:
+        if self.CARDS.isContinuous():
+            for player in self.players:
+                for hand_num in range(1, player.getNumHands()+1):
+                    self.CARDS.discard(player.getHand(hand_num))
+            self.CARDS.discard(self.DEALER.getHand())
+        for player in self.players:
+            player.resetPlayer()
+        self.DEALER.resetDealer()
+        self.winnings = []
+        self.roundOver = True
 
     # Deals two cards to each player and then the dealer. Note that one
     # card is dealt to everyone before the second card is dealt.
@@ -239,7 +364,7 @@ class Game:
         self._dealDealerInitialCards()
 
         # All players have the option of making an insurance bet only if the dealer's first card is an Ace.
-        if self.DEALER.getHand()[0][0] == 'A':
+        if Card.ISACE[self.DEALER.getHand()[0]]:
             self._insuranceBetting()
 
         self._dealPlayerInitialCards()
@@ -259,35 +384,42 @@ class Game:
                     if player.handSize(hand_num) != 2:
                         player.addCard(self.CARDS.getCard(), hand_num)
                         player_hand = player.getHand(hand_num)
-                        player_score = self.SCORING.totalScore(player_hand)
-                        print(f'<{player.getName()}> Hand #{hand_num}: {player_hand} === {player_score} points')
+                        player_score = player.getTotalScore(hand_num)
+                        self._print(f'<{player.getName()}> Hand #{hand_num}: {Card.handStr(player_hand)} === {player_score} points')
 
                         # Check to see if player wants to double down or split, but only if they have enough money to do so.
                         # Note, player cannot double down on a BlackJack.
                         if (player.handSize(hand_num) == 2) and (player.getWager(hand_num) + player.totalWager() <= player.getMoney()) and (player_score != 21):
-                            print()
-                            is_doubling_down = input('Want to double down? (Y/N) ')
-                            while (is_doubling_down.upper() != 'Y') and (is_doubling_down.upper() != 'N'):
-                                is_doubling_down = input('Want to double down? (Y/N) ')
-                            print()
-
-                            if is_doubling_down.upper() == 'Y':
+                            policy = self._getPolicy(player)
+                            self._print()
+                            is_doubling_down = False
+                            if self._canDoubleDown(player, hand_num):
+                                if policy is None:
+                                    is_doubling_down = self._askYesNo('Want to double down? (Y/N) ')
+                                else:
+                                    is_doubling_down = policy.doubleDown(player, hand_num, self)
+                                self._recordAction(player, hand_num, HandHistory.DOUBLE if is_doubling_down else HandHistory.NODOUBLE)
+                                self._print()
+
+                            if is_doubling_down:
                                 player.doubleDown(hand_num)
-                                print('Doubling down...')
-                                breakpoint = input('')
+                                self._print('Doubling down...')
+                                self._pause()
 
                             # If player's two cards are identical, give them the choice to split.
-                            # Note that the player cannot split to make more than 4 hands.
-                            elif player_hand[0][0] == player_hand[1][0] and player.getNumHands() < 4:
-                                is_splitting = input('Want to split? (Y/N) ')
-                                while (is_splitting.upper() != 'Y') and (is_splitting.upper() != 'N'):
-                                    is_splitting = input('Want to split? (Y/N) ')
-                                print()
-
-                                if is_splitting.upper() == 'Y':
+                            # Note that the player cannot split to make more hands than the rules allow.
+                            elif self._canSplit(player, hand_num):
+                                if policy is None:
+                                    is_splitting = self._askYesNo('Want to split? (Y/N) ')
+                                else:
+                                    is_splitting = policy.split(player, hand_num, self)
+                                self._recordAction(player, hand_num, HandHistory.SPLIT if is_splitting else HandHistory.NOSPLIT)
+                                self._print()
+
+                                if is_splitting:
                                     player.split(hand_num)
-                                    print('Splitting hand...')
-                                    breakpoint = input('')
+                                    self._print('Splitting hand...')
+                                    self._pause()
 
                             if hand_num == player.getNumHands():
                                 still_dealing = False
@@ -295,14 +427,12 @@ class Game:
                         # Only stop dealing if we've successfully dealt two cards to all the hands.
                         elif hand_num == player.getNumHands():
                             still_dealing = False
-                            breakpoint = input('')
+                            self._pause()
 
                         # This is solely for printing purposes in the edge case that the user cannot split or double
                         # down due to lack of funds, and still has cards left to be dealt to their other hands.
                         elif player.handSize(hand_num) == 2:
-                            breakpoint = input('')
-
-                        player.setTotalScore(player_score, hand_num)
+                            self._pause()
 
     # Helper function that deals one of the two initial cards to the dealer at the start of the round.
     def _dealDealerInitialCards(self) -> None:
@@ -311,38 +441,39 @@ class Game:
         # Want to show only dealer's first card face up.
         if self.DEALER.handSize() == 1:
             dealer_hand = self.DEALER.getHand()
-            dealer_score = self.SCORING.totalScore(dealer_hand)
-            print(f'Dealer\'s hand: {dealer_hand} === {dealer_score} points')
+            self._print(f'Dealer\'s hand: {Card.handStr(dealer_hand)} === {self.DEALER.getTotalScore()} points')
         else:
-            dealer_hand = [self.DEALER.getHand()[0], '?']
-            dealer_score = self.SCORING.totalScore(self.DEALER.getHand())
-            print(f'Dealer\'s hand: {dealer_hand} <= {self.SCORING.totalScore( [dealer_hand[0]] )} points')
+            upcard = self.DEALER.getHand()[0]
+            self._print(f'Dealer\'s hand: [{Card.DISPLAY[upcard]}, {Card.HIDDEN}] <= {self.SCORING.totalScore( [upcard] )} points')
 
-        self.DEALER.setTotalScore(dealer_score)
-        breakpoint = input('')
+        self._pause()
 
     # Helper function that asks players if they want to make an insurance bet.
     def _insuranceBetting(self) -> None:
         for player in self.players:
             # Accounts for edge case that player bet all their money and don't have any left for the insurance bet
             if player.getMoney() - player.getWager() == 0:
-                print(f'Sorry, {player.getName()}! You don\'t have anymore money left to make an insurance bet :(')
-                breakpoint = input('')
+                self._print(f'Sorry, {player.getName()}! You don\'t have anymore money left to make an insurance bet :(')
+                self._pause()
+            elif self._getPolicy(player) is not None:
+                # Same limits as the prompt: no more than half the wager or the money the player has left.
+                max_insurance = min(player.getWager() // 2, player.getMoney() - player.getWager())
+                insurance_wager = min(self._getPolicy(player).insurance(player, self), max_insurance)
+                if insurance_wager >= 1:
+                    player.setInsuranceWager(insurance_wager)
             else:
-                insurance = input(f'{player.getName()}, care to make an insurance bet? (Y/N) ')
-                while (insurance.upper() != 'Y') and (insurance.upper() != 'N'):
-                    insurance = input(f'{player.getName()}, care to make an insurance bet? (Y/N) ')
-                print()
+                is_insuring = self._askYesNo(f'{player.getName()}, care to make an insurance bet? (Y/N) ')
+                self._print()
 
-                if insurance.upper() == 'Y':
+                if is_insuring:
                     player.setInsuranceWager(self._determineInsuranceWager(player))
 
     # Deals the rest of the cards to the players (depending on whether they choose
     # to hit or stand) and then to the dealer
     def dealPlayerCards(self) -> None:
         for player in self.players:
-            print(f'~~~~~~~~~~~~~~~~{player.getName()}\'s Turn~~~~~~~~~~~~~~~~')
-            print()
+            self._print(f'~~~~~~~~~~~~~~~~{player.getName()}\'s Turn~~~~~~~~~~~~~~~~')
+            self._print()
 
             for hand_num in range(1, player.getNumHands()+1):
                 player_hand = player.getHand(hand_num)
@@ -350,106 +481,178 @@ class Game:
 
                 # Check to see if the player has a BlackJack. Otherwise, proceed with their turn.
                 if hand_score == 21:
-                    print(f'Hand #{hand_num}: {player_hand} === {hand_score} points')
-                    print()
-                    print(f'Congrats, {player.getName()}! You got a BlackJack!')
-                    breakpoint = input('')
+                    self._print(f'Hand #{hand_num}: {Card.handStr(player_hand)} === {hand_score} points')
+                    self._print()
+                    self._print(f'Congrats, {player.getName()}! You got a BlackJack!')
+                    self._pause()
 
                 # If player doubled down on this hand, they only get one more card.
                 elif player.hasDoubledDown(hand_num):
                     player.addCard(self.CARDS.getCard(), hand_num)
                     player_hand = player.getHand(hand_num)
-                    hand_score = self.SCORING.totalScore(player_hand)
+                    hand_score = player.getTotalScore(hand_num)
 
-                    print('Since you doubled down on this hand, you only get one more card.')
-                    breakpoint = input('')
-                    print(f'Hand #{hand_num}: {player_hand} === {hand_score} points')
-                    breakpoint = input('')
+                    self._print('Since you doubled down on this hand, you only get one more card.')
+                    self._pause()
+                    self._print(f'Hand #{hand_num}: {Card.handStr(player_hand)} === {hand_score} points')
+                    self._pause()
 
                     if hand_score > 21:
-                        print(f'Sorry, {player.getName()}, this hand a bust!')
-                        breakpoint = input('')
+                        self._print(f'Sorry, {player.getName()}, this hand a bust!')
+                        self._pause()
 
                 else:
                     player.setTurn(True)
 
                 while player.isTurn():
                     player_hand = player.getHand(hand_num)
-                    hand_score = self.SCORING.totalScore(player_hand)
-                    print(f'Hand #{hand_num}: {player_hand} === {hand_score} points')
-                    print()
+                    hand_score = player.getTotalScore(hand_num)
+                    self._print(f'Hand #{hand_num}: {Card.handStr(player_hand)} === {hand_score} points')
+                    self._print()
 
                     # If player busts, their turn is over.
                     if hand_score > 21:
-                        print(f'Sorry, {player.getName()}, this hand is a bust!')
+                        self._print(f'Sorry, {player.getName()}, this hand is a bust!')
                         player.setTurn(False)
-                        breakpoint = input('')
+                        self._pause()
 
                     # Player cannot hit anymore when their hand gets to a score of 21.
                     elif hand_score == 21:
-                        print(f'This hand is equal to 21, so you can\'t hit anymore')
+                        self._print(f'This hand is equal to 21, so you can\'t hit anymore')
                         player.setTurn(False)
-                        breakpoint = input('')
+                        self._pause()
 
                     else:
-                        hit_or_stand = input('Would you like to hit or stand? ')
-
-                        while (hit_or_stand.lower() != 'hit') and (hit_or_stand.lower() != 'stand'):
-                            print('Must choose hit or stand.')
-                            print()
+                        policy = self._getPolicy(player)
+                        if policy is None:
                             hit_or_stand = input('Would you like to hit or stand? ')
 
+                            while (hit_or_stand.lower() != 'hit') and (hit_or_stand.lower() != 'stand'):
+                                self._print('Must choose hit or stand.')
+                                self._print()
+                                hit_or_stand = input('Would you like to hit or stand? ')
+                        else:
+                            hit_or_stand = 'hit' if policy.hit(player, hand_num, self) else 'stand'
+
                         if hit_or_stand.lower() == 'hit':
+                            self._recordAction(player, hand_num, HandHistory.HIT)
                             player.addCard(self.CARDS.getCard(), hand_num)
                             
                         else:
+                            self._recordAction(player, hand_num, HandHistory.STAND)
                             player.setTurn(False)
                             
-                        print()
+                        self._print()
                         
-                player.setTotalScore(hand_score, hand_num)
         self.dealDealerCards()
 
     # Dealer has their own set of rules for hitting and standing. Their decisions
     # are essentially made automatically: If the dealer's hand is 16 or less points, they
     # must hit. If their hand is 17 or more points, they must stand.
     def dealDealerCards(self) -> None:
-        print('~~~~~~~~~~~~~~~~Dealer\'s Turn~~~~~~~~~~~~~~~~')
-        print()
+        self._playDealerHand()
+        self.determineWinnings()
+
+    def _playDealerHand(self) -> None:
+        """
+        Private helper function that plays the dealer's hand out by the dealer's rules
+        """
+        self._print('~~~~~~~~~~~~~~~~Dealer\'s Turn~~~~~~~~~~~~~~~~')
+        self._print()
 
         dealer_hand = self.DEALER.getHand()
         dealer_score = self.DEALER.getTotalScore()
 
         if dealer_score == 21:
-            print(f'Dealer\'s hand: {dealer_hand} === {dealer_score}')
-            print()
-            print(f'The dealer got a BlackJack!')
-            breakpoint = input('')
+            self._print(f'Dealer\'s hand: {Card.handStr(dealer_hand)} === {dealer_score}')
+            self._print()
+            self._print(f'The dealer got a BlackJack!')
+            self._pause()
         else:
             self.DEALER.setTurn(True)
 
         while self.DEALER.isTurn():
             dealer_hand = self.DEALER.getHand()
-            dealer_score = self.SCORING.totalScore(dealer_hand)
-            print(f'Dealer\'s hand: {dealer_hand} === {dealer_score}')
-            breakpoint = input('')
+            dealer_score = self.DEALER.getTotalScore()
+            self._print(f'Dealer\'s hand: {Card.handStr(dealer_hand)} === {dealer_score}')
+            self._pause()
 
             if dealer_score > 21:
-                print('The dealer\'s hand is a bust!')
+                self._print('The dealer\'s hand is a bust!')
                 self.DEALER.setTurn(False)
                 
-            elif dealer_score <= 16:
-                print('The dealer chose to hit.')
+            elif self.RULES.dealerHits(dealer_score, self.DEALER.isSoft()):
+                self._print('The dealer chose to hit.')
                 self.DEALER.addCard(self.CARDS.getCard())
                 
             else:
-                print('The dealer chose to stand.')
+                self._print('The dealer chose to stand.')
                 self.DEALER.setTurn(False)
                 
-            breakpoint = input('')
+            self._pause()
 
-        self.DEALER.setTotalScore(dealer_score)
-        self.determineWinnings()
+    def _discardCards(self) -> None:
+        """
+        Private helper function that puts every card of the finished round into the continuous shuffler,
+        including the hands of players that just went broke
+        """
+        for player in dict.fromkeys(player for player, _ in self.lastWinnings):
+            for hand_num in range(1, player.getNumHands()+1):
+                self.CARDS.discard(player.getHand(hand_num))
+        self.CARDS.discard(self.DEALER.getHand())
+
+    def _canDoubleDown(self, player: Player, hand_num: int) -> bool:
+        """
+        Private helper function that checks whether the rules let the player double down on a two card hand
+        """
+        return self.RULES.canDoubleDown(player.getTotalScore(hand_num), player.getNumHands() > 1)
+
+    def _canSplit(self, player: Player, hand_num: int) -> bool:
+        """
+        Private helper function that checks whether the rules let the player split a two card hand
+        """
+        player_hand = player.getHand(hand_num)
+        return Card.RANKS[player_hand[0]] == Card.RANKS[player_hand[1]] and player.getNumHands() < self.RULES.max_hands
+
+    # Sets the instrumentation recording this game's rounds (None turns it off)
+    def setInstrumentation(self, instrumentation: Instrumentation) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.detach(self)
+        self.instrumentation = instrumentation
+        if instrumentation is not None:
+            instrumentation.attach(self)
+
+    # Returns the instrumentation recording this game's rounds (None if it's turned off)
+    def getInstrumentation(self) -> Instrumentation:
+        return self.instrumentation
+
+    # Sets the HandHistoryWriter recording every round of this game (None turns it off)
+    def setHistory(self, history: HandHistoryWriter) -> None:
+        if self.history is not None:
+            self.history.detach(self)
+        self.history = history
+        if history is not None:
+            history.attach(self)
+
+    # Returns the HandHistoryWriter recording this game's rounds (None if it's turned off)
+    def getHistory(self) -> HandHistoryWriter:
+        return self.history
+
+    # Sets the Statistics every settled hand is added to (None turns it off)
+    def setStatistics(self, statistics: Statistics) -> None:
+        self.statistics = statistics
+
+    # Returns the Statistics every settled hand is added to (None if there isn't one)
+    def getStatistics(self) -> Statistics:
+        return self.statistics
+
+    # Returns the dealer's face-up card (the first card dealt to the dealer)
+    def getDealerUpCard(self) -> int:
+        return self.DEALER.getHand()[0]
+
+    # Returns the (player, winning) pairs of every hand settled in the last finished round
+    def getLastWinnings(self) -> [(Player, int)]:
+        return self.lastWinnings
 
     # Returns the list of players who had winning hands
     def getWinners(self) -> [Player]:
@@ -470,3 +673,7 @@ class Game:
     # Returns the present payout for getting a BlackJack as a str
     def getPayoutStr(self) -> str:
         return self.BLACKJACKPAYOUTSTR
+
+    # Returns the rules the game is played with
+    def getRules(self) -> Rules:
+        return self.RULES
@@ -0,0 +1,85 @@
+import struct
+import sys
+from array import array
+
+
+class HandHistory:
+    """
+    The binary hand-history format shared by HandHistoryWriter and HandHistoryReader.
+
+    A file starts with a header (MAGIC and the format VERSION) followed by any number of chunks. Each chunk
+    has a header (CHUNKMAGIC, its number of rounds, the size of its payload and the payload's CRC-32) so a
+    reader can check it and, if it's damaged or cut short, look for the next CHUNKMAGIC and carry on.
+    New chunks are only ever appended.
+
+    A chunk's payload is a table of player names used in the chunk followed by its rounds stored column by
+    column, in the order of COLUMNS. Every integer is little-endian.
+        round_seats, round_cards, round_actions, round_hands: per round, how many seats, cards dealt,
+            actions taken and hands settled it has
+        seat_names, seat_wagers, seat_insurance: per seat, the player's name (index in the name table),
+            their wager and their insurance wager
+        cards: per card dealt, its Card code, in the order it was dealt from the shoe
+        actions: per action, three numbers: seat, hand number and what the player did (STAND...NOSPLIT)
+        hands: per settled hand, two numbers: seat and hand number
+        winnings: per settled hand, the amount won (negative if lost)
+    A round can have up to MAXSEATS seats. Version 1 files (read with V1COLUMNS) kept seats, hands and the
+    round counts of seats and hands in single bytes, which held no more than 255 seats.
+    """
+
+    MAGIC = b'BJHH'
+    VERSION = 2
+    FILEHEADER = struct.Struct('<4sB3x')
+
+    # Magic, number of rounds, payload size and payload CRC-32
+    CHUNKMAGIC = b'BJCK'
+    CHUNKHEADER = struct.Struct('<4sIII')
+
+    # Actions a player can take
+    STAND = 0
+    HIT = 1
+    DOUBLE = 2
+    NODOUBLE = 3
+    SPLIT = 4
+    NOSPLIT = 5
+    ACTIONNAMES = ('stand', 'hit', 'double', 'no double', 'split', 'no split')
+
+    # Columns of a chunk's payload: the array type of each (B = 1 byte, H = 2, I and i = 4) and the round
+    # column holding how many entries each round has in it, times how many items make up an entry
+    COLUMNS = (('round_seats', 'I', None, 1), ('round_cards', 'I', None, 1), ('round_actions', 'I', None, 1),
+               ('round_hands', 'I', None, 1), ('seat_names', 'H', 'round_seats', 1), ('seat_wagers', 'I', 'round_seats', 1),
+               ('seat_insurance', 'I', 'round_seats', 1), ('cards', 'B', 'round_cards', 1), ('actions', 'H', 'round_actions', 3),
+               ('hands', 'H', 'round_hands', 2), ('winnings', 'i', 'round_hands', 1))
+    V1COLUMNS = (('round_seats', 'B', None, 1), ('round_cards', 'H', None, 1), ('round_actions', 'H', None, 1),
+                 ('round_hands', 'B', None, 1), ('seat_names', 'H', 'round_seats', 1), ('seat_wagers', 'I', 'round_seats', 1),
+                 ('seat_insurance', 'I', 'round_seats', 1), ('cards', 'B', 'round_cards', 1), ('actions', 'B', 'round_actions', 3),
+                 ('hands', 'B', 'round_hands', 2), ('winnings', 'i', 'round_hands', 1))
+
+    # The most seats a round can have (a seat is stored in 2 bytes)
+    MAXSEATS = 0xFFFF
+
+    # Name table: the number of names, then each name's length and UTF-8 bytes
+    NAMECOUNT = struct.Struct('<H')
+    NAMELENGTH = struct.Struct('<B')
+
+    # Returns empty columns for a new chunk
+    def newColumns(self) -> dict:
+        return {name: array(typecode) for name, typecode, _, _ in self.COLUMNS}
+
+    # Returns a column's bytes in the file's (little-endian) byte order
+    def columnBytes(self, column: array) -> bytes:
+        if sys.byteorder == 'big' and column.itemsize > 1:
+            column = array(column.typecode, column)
+            column.byteswap()
+        return column.tobytes()
+
+    # Returns a column read from the file's bytes
+    def readColumn(self, typecode: str, data: bytes) -> array:
+        column = array(typecode)
+        column.frombytes(data)
+        if sys.byteorder == 'big' and column.itemsize > 1:
+            column.byteswap()
+        return column
+
+
+# The format relies on these sizes, which every mainstream platform uses
+assert [array(typecode).itemsize for typecode in 'BHIi'] == [1, 2, 4, 4]
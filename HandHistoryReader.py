@@ -0,0 +1,137 @@
+import mmap
+import zlib
+from array import array
+
+from Card import Card
+from HandHistory import HandHistory
+
+
+class HandHistoryReader(HandHistory):
+    """
+    Reads a hand-history file written by HandHistoryWriter (see HandHistory for the format).
+    chunks() returns each chunk's columns as arrays, aggregate() totals a whole file from those columns
+    (cards and actions are counted straight from their arrays, without a Python object per card) and
+    rounds() replays the rounds one at a time. Damaged or cut-off chunks are skipped and counted in
+    skipped_chunks.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.skipped_chunks = 0
+
+    # Returns every intact chunk as (player names, columns)
+    def chunks(self):
+        self.skipped_chunks = 0
+        with open(self.path, 'rb') as f:
+            if f.seek(0, 2) < self.FILEHEADER.size:
+                raise ValueError(f'{self.path} isn\'t a hand-history file')
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                magic, version = self.FILEHEADER.unpack_from(data)
+                if magic != self.MAGIC:
+                    raise ValueError(f'{self.path} isn\'t a hand-history file')
+                if version > self.VERSION:
+                    raise ValueError(f'{self.path} uses hand-history version {version} (this reader supports up to {self.VERSION})')
+                layout = self.V1COLUMNS if version == 1 else self.COLUMNS
+
+                pos = self.FILEHEADER.size
+                while pos < len(data):
+                    chunk = self._readChunk(data, pos, layout)
+                    if chunk is None:
+                        # Damaged: carry on from the next chunk, if there is one
+                        self.skipped_chunks += 1
+                        pos = data.find(self.CHUNKMAGIC, pos + 1)
+                        if pos == -1:
+                            break
+                        continue
+                    pos, names, columns = chunk
+                    yield names, columns
+
+    def _readChunk(self, data, pos: int, layout: tuple):
+        """
+        Private helper function that returns (end of the chunk, names, columns), or None if it's damaged
+        """
+        if pos + self.CHUNKHEADER.size > len(data):
+            return None
+        magic, num_rounds, size, crc = self.CHUNKHEADER.unpack_from(data, pos)
+        start = pos + self.CHUNKHEADER.size
+        if magic != self.CHUNKMAGIC or start + size > len(data):
+            return None
+        payload = data[start:start+size]
+        if zlib.crc32(payload) != crc:
+            return None
+
+        try:
+            offset = self.NAMECOUNT.size
+            names = []
+            for _ in range(self.NAMECOUNT.unpack_from(payload)[0]):
+                length = self.NAMELENGTH.unpack_from(payload, offset)[0]
+                offset += self.NAMELENGTH.size
+                names.append(payload[offset:offset+length].decode())
+                offset += length
+
+            # The round columns come first and give the length of every other column
+            columns = {}
+            totals = {}
+            for name, typecode, per_round, items in layout:
+                if per_round is None:
+                    count = num_rounds
+                else:
+                    if per_round not in totals:
+                        totals[per_round] = sum(columns[per_round])
+                    count = totals[per_round] * items
+                end = offset + count * array(typecode).itemsize
+                columns[name] = self.readColumn(typecode, payload[offset:end])
+                offset = end
+        except (IndexError, KeyError, UnicodeDecodeError, ValueError):
+            return None
+        if offset != len(payload):
+            return None
+        return start + size, names, columns
+
+    # Returns totals over every round in the file
+    def aggregate(self) -> dict:
+        totals = {'rounds': 0, 'hands': 0, 'wagered': 0, 'insurance': 0, 'net': {},
+                  'cards': [0] * len(Card.NAMES), 'actions': dict.fromkeys(self.ACTIONNAMES, 0)}
+        net = totals['net']
+        for names, columns in self.chunks():
+            totals['rounds'] += len(columns['round_seats'])
+            totals['hands'] += len(columns['winnings'])
+            totals['wagered'] += sum(columns['seat_wagers'])
+            totals['insurance'] += sum(columns['seat_insurance'])
+
+            cards = columns['cards'].tobytes()
+            for code in range(len(Card.NAMES)):
+                totals['cards'][code] += cards.count(code.to_bytes(1, 'little'))
+            actions = columns['actions'][2::3]
+            for code, name in enumerate(self.ACTIONNAMES):
+                totals['actions'][name] += actions.count(code)
+
+            # Each settled hand's seat is relative to its round's first seat
+            seat_names, hand_seats, winnings = columns['seat_names'], columns['hands'], columns['winnings']
+            seat_base = hand = 0
+            for num_seats, num_hands in zip(columns['round_seats'], columns['round_hands']):
+                for i in range(hand, hand + num_hands):
+                    name = names[seat_names[seat_base + hand_seats[2*i]]]
+                    net[name] = net.get(name, 0) + winnings[i]
+                seat_base += num_seats
+                hand += num_hands
+        return totals
+
+    # Returns every round in the file, one at a time, as a dict of its seats (name, wager, insurance),
+    # the cards dealt in order, the actions taken (seat, hand number, action) and the winnings (seat, hand number, winning)
+    def rounds(self):
+        for names, columns in self.chunks():
+            seat = card = action = hand = 0
+            for num_seats, num_cards, num_actions, num_hands in zip(columns['round_seats'], columns['round_cards'],
+                                                                    columns['round_actions'], columns['round_hands']):
+                actions = columns['actions'][3*action:3*(action+num_actions)]
+                hands = columns['hands'][2*hand:2*(hand+num_hands)]
+                yield {'seats': [(names[columns['seat_names'][i]], columns['seat_wagers'][i], columns['seat_insurance'][i])
+                                 for i in range(seat, seat + num_seats)],
+                       'cards': list(columns['cards'][card:card+num_cards]),
+                       'actions': [tuple(actions[i:i+3]) for i in range(0, len(actions), 3)],
+                       'winnings': [(hands[2*i], hands[2*i+1], columns['winnings'][hand+i]) for i in range(num_hands)]}
+                seat += num_seats
+                card += num_cards
+                action += num_actions
+                hand += num_hands
@@ -0,0 +1,161 @@
+import zlib
+
+from HandHistory import HandHistory
+
+
+class HandHistoryWriter(HandHistory):
+    """
+    Appends every round a Game plays to a hand-history file (see HandHistory for the format).
+    Rounds are buffered in memory column by column and written out a chunk of chunk_rounds rounds at a
+    time, so recording costs a few appends per card and decision. Give it to a game with
+    Game(history=writer) or game.setHistory(writer), and close() it (or use it in a with block) to write
+    the last chunk.
+    """
+
+    CHUNKROUNDS = 4096
+
+    def __init__(self, path: str, chunk_rounds: int = CHUNKROUNDS):
+        self.chunk_rounds = chunk_rounds
+        self.file = open(path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(self.FILEHEADER.pack(self.MAGIC, self.VERSION))
+        else:
+            # Chunks can only be appended to a file of the same version
+            with open(path, 'rb') as f:
+                header = f.read(self.FILEHEADER.size)
+            if len(header) < self.FILEHEADER.size or self.FILEHEADER.unpack(header) != (self.MAGIC, self.VERSION):
+                self.file.close()
+                raise ValueError(f'{path} isn\'t a version {self.VERSION} hand-history file, so rounds can\'t be appended to it')
+        self._newChunk()
+        self.seats = None
+        self.cards = None
+        self.previous_get_card = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _newChunk(self) -> None:
+        """
+        Private helper function that starts buffering a new chunk
+        """
+        self.columns = self.newColumns()
+        self.names = {}
+        self.num_rounds = 0
+
+    # Starts recording the given game's rounds: every card dealt from its shoe is recorded
+    def attach(self, game) -> None:
+        cards = game.CARDS
+        get_card = cards.getCard
+
+        def getCard() -> int:
+            card = get_card()
+            if self.seats is not None:
+                # Wagers are all in by the time the round's first card is dealt
+                if self.round_cards_start == len(self.columns['cards']):
+                    self._recordWagers()
+                self.columns['cards'].append(card)
+            return card
+
+        self.previous_get_card = cards.__dict__.get('getCard')
+        cards.getCard = getCard
+        self.cards = cards
+
+    # Stops recording the game's rounds
+    def detach(self, game) -> None:
+        if self.cards is not None:
+            if self.previous_get_card is None:
+                self.cards.__dict__.pop('getCard', None)
+            else:
+                self.cards.getCard = self.previous_get_card
+            self.cards = None
+
+    # Starts a round: the game's players take the seats in the order they play
+    def startRound(self, game) -> None:
+        if len(game.players) > self.MAXSEATS:
+            raise ValueError(f'A hand history can record up to {self.MAXSEATS} seats a round, not {len(game.players)}')
+        columns = self.columns
+        self.seats = {player: seat for seat, player in enumerate(game.players)}
+        self.seat_base = len(columns['seat_names'])
+        self.round_cards_start = len(columns['cards'])
+        self.round_actions_start = len(columns['actions'])
+        self.round_hands_start = len(columns['winnings'])
+
+        for player in game.players:
+            name = player.getName()
+            if name not in self.names:
+                self.names[name] = len(self.names)
+            columns['seat_names'].append(self.names[name])
+            columns['seat_wagers'].append(0)
+            columns['seat_insurance'].append(0)
+
+    def _recordWagers(self) -> None:
+        """
+        Private helper function that records every seat's wager
+        """
+        wagers = self.columns['seat_wagers']
+        for player, seat in self.seats.items():
+            wagers[self.seat_base + seat] = player.getWager()
+
+    # Records a player's decision (one of HandHistory's actions) for one of their hands
+    def recordAction(self, player, hand_num: int, action: int) -> None:
+        if self.seats is not None:
+            self.columns['actions'].extend((self.seats[player], hand_num, action))
+
+    # Finishes the round with the insurance wagers and the winnings of every hand, before the game clears them
+    def endRound(self, game) -> None:
+        if self.seats is None:
+            return
+        columns = self.columns
+        if self.round_cards_start == len(columns['cards']):
+            self._recordWagers()
+        for player, seat in self.seats.items():
+            columns['seat_insurance'][self.seat_base + seat] = player.getInsuranceWager()
+
+        # The game lists each player's hands in order
+        previous, hand_num = None, 0
+        for player, winning in game.winnings:
+            hand_num = hand_num + 1 if player is previous else 1
+            previous = player
+            columns['hands'].extend((self.seats[player], hand_num))
+            columns['winnings'].append(winning)
+
+        columns['round_seats'].append(len(self.seats))
+        columns['round_cards'].append(len(columns['cards']) - self.round_cards_start)
+        columns['round_actions'].append((len(columns['actions']) - self.round_actions_start) // 3)
+        columns['round_hands'].append(len(columns['winnings']) - self.round_hands_start)
+        self.seats = None
+        self.num_rounds += 1
+        if self.num_rounds >= self.chunk_rounds:
+            self._writeChunk()
+
+    def _writeChunk(self) -> None:
+        """
+        Private helper function that writes the buffered rounds as one chunk and starts a new one
+        """
+        if self.num_rounds == 0:
+            return
+        parts = [self.NAMECOUNT.pack(len(self.names))]
+        for name in self.names:
+            # Names are cut to 255 bytes without splitting a character
+            encoded = name.encode()[:255].decode(errors='ignore').encode()
+            parts.append(self.NAMELENGTH.pack(len(encoded)))
+            parts.append(encoded)
+        parts.extend(self.columnBytes(self.columns[name]) for name, _, _, _ in self.COLUMNS)
+        payload = b''.join(parts)
+
+        self.file.write(self.CHUNKHEADER.pack(self.CHUNKMAGIC, self.num_rounds, len(payload), zlib.crc32(payload)) + payload)
+        self._newChunk()
+
+    # Writes every finished round to the file
+    def flush(self) -> None:
+        self._writeChunk()
+        self.file.flush()
+
+    # Writes every finished round and closes the file
+    def close(self) -> None:
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
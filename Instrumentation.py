@@ -0,0 +1,108 @@
+import time
+
+
+class Instrumentation:
+    """
+    Opt-in timing and counters for the phases of a Game round.
+    attach() wraps the game's phase methods on that game instance only, so a game without instrumentation
+    runs exactly the same code as before and pays nothing. Phase times are exclusive: the time a phase
+    spends in the phases it calls (e.g. dealPlayerCards calling dealDealerCards) is only counted once.
+    Counters for cards drawn, splits and doubles are read off the game state at the phase boundaries.
+    Reshuffles are counted by also wrapping shuffle() on the game's shoe instance, since a continuous
+    shuffler taking back the round's cards grows the shoe just like a reshuffle does. Nothing in Cards or
+    Player has to be touched.
+    """
+
+    PHASES = ('newRound', 'dealInitialCards', 'dealPlayerCards', 'dealDealerCards',
+              'determineWinnings', 'distributeWinnings', 'endRound')
+
+    def __init__(self, dump_every: int = None, dump=None):
+        """
+        If dump_every is set, dump (any callable taking a dict, print by default) gets a snapshot every
+        dump_every rounds.
+        """
+        self.dump_every = dump_every
+        self.dump = dump if dump is not None else print
+        self._stack = []
+        self._cards_shuffle = None
+        self.reset()
+
+    # Clears every timing and counter
+    def reset(self) -> None:
+        self.calls = dict.fromkeys(self.PHASES, 0)
+        self.seconds = dict.fromkeys(self.PHASES, 0.0)
+        self.rounds = 0
+        self.cards_drawn = 0
+        self.reshuffles = 0
+        self.splits = 0
+        self.doubles = 0
+
+    # Wraps a phase method so its exclusive time and calls are recorded, with optional hooks around it
+    def _timed(self, phase: str, method, before=None, after=None):
+        def wrapper(*args, **kwargs):
+            if before is not None:
+                before()
+            self._stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                child_time = self._stack.pop()
+                self.seconds[phase] += elapsed - child_time
+                self.calls[phase] += 1
+                if self._stack:
+                    self._stack[-1] += elapsed
+                if after is not None:
+                    after()
+        return wrapper
+
+    # Starts recording the given game's rounds
+    def attach(self, game) -> None:
+        # Every card of the round is in a hand by the time the hands are settled (the shoe's size can't tell, since
+        # a shoe that runs out in the middle of a round takes its discards back)
+        def countRound():
+            self.cards_drawn += game.DEALER.handSize()
+            for player in game.players:
+                num_hands = player.getNumHands()
+                self.cards_drawn += sum(player.handSize(hand_num) for hand_num in range(1, num_hands+1))
+                self.splits += num_hands - 1
+                self.doubles += sum(player.hasDoubledDown(hand_num) for hand_num in range(1, num_hands+1))
+
+        def afterEndRound():
+            self.rounds += 1
+            if self.dump_every and self.rounds % self.dump_every == 0:
+                self.dump(self.snapshot())
+
+        hooks = {'determineWinnings': (countRound, None),
+                 'endRound': (None, afterEndRound)}
+        for phase in self.PHASES:
+            before, after = hooks.get(phase, (None, None))
+            setattr(game, phase, self._timed(phase, getattr(type(game), phase).__get__(game), before, after))
+
+        cards = game.CARDS
+        shuffle = cards.shuffle
+        self._cards_shuffle = cards.__dict__.get('shuffle')
+
+        def countedShuffle():
+            self.reshuffles += 1
+            shuffle()
+        cards.shuffle = countedShuffle
+
+    # Stops recording the given game's rounds and puts back its original methods
+    def detach(self, game) -> None:
+        for phase in self.PHASES:
+            game.__dict__.pop(phase, None)
+        if self._cards_shuffle is None:
+            game.CARDS.__dict__.pop('shuffle', None)
+        else:
+            game.CARDS.shuffle = self._cards_shuffle
+
+    # Returns every timing and counter recorded so far
+    def snapshot(self) -> dict:
+        return {'rounds': self.rounds,
+                'phases': {phase: {'calls': self.calls[phase], 'seconds': self.seconds[phase]} for phase in self.PHASES},
+                'cards_drawn': self.cards_drawn,
+                'reshuffles': self.reshuffles,
+                'splits': self.splits,
+                'doubles': self.doubles}
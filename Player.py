@@ -1,20 +1,47 @@
+from Card import Card
+from Scoring import Scoring
+
+# Value of every card code, looked up for each card added to a hand
+_CARDVALUES = Card.VALUES
+
 class Player:
     STARTINGFUNDS = 1000
+    SCORING = Scoring()
+
+    # The most hands a player can split into
+    MAXHANDS = 4
+
+    # Players are slotted and their per-hand state is allocated once for MAXHANDS hands and reset in place,
+    # so tables with thousands of seats don't allocate anything per round. Only the first num_hands are in play.
+    __slots__ = ('name', 'policy', 'money', 'wager', 'insurance_wager', 'hand', 'totalScore', 'hard_total', 'aces',
+                 'turn', 'double_down', 'num_hands')
 
-    def __init__(self, name):
+    def __init__(self, name, policy=None):
         self.name = name
+        self.policy = policy
         self.money = self.STARTINGFUNDS
-        self.wager = [0]
+        self.wager = [0] * self.MAXHANDS
         self.insurance_wager = 0
-        self.hand = [[]]
-        self.totalScore = [0]
+        self.hand = [[] for _ in range(self.MAXHANDS)]
+        self.totalScore = [0] * self.MAXHANDS
+        self.hard_total = [0] * self.MAXHANDS
+        self.aces = [0] * self.MAXHANDS
         self.turn = False
-        self.double_down = [False]
+        self.double_down = [False] * self.MAXHANDS
+        self.num_hands = 1
 
     # Returns player name
     def getName(self) -> str:
         return self.name
 
+    # Returns the player's decision policy (None if the player is prompted for every decision)
+    def getPolicy(self):
+        return self.policy
+
+    # Sets the player's decision policy (None to go back to prompting the player)
+    def setPolicy(self, policy) -> None:
+        self.policy = policy
+
     # Returns player money
     def getMoney(self) -> int:
         return self.money
@@ -27,7 +54,7 @@ class Player:
     def getWager(self, hand_num: int = 1) -> int:
         return self.wager[hand_num-1]
 
-    # Returns total amount of money the player wagered
+    # Returns total amount of money the player wagered (hands that aren't in play have no wager)
     def totalWager(self) -> int:
         return sum(self.wager) + self.insurance_wager
 
@@ -44,7 +71,7 @@ class Player:
         return self.insurance_wager
 
     # Returns the player's hand(s) (hands if player chose to split)
-    def getHand(self, hand_num: int = 1) -> [str]:
+    def getHand(self, hand_num: int = 1) -> [int]:
         return self.hand[hand_num-1]
 
     # Returns size of player's hand(s) (hands if player chose to split)
@@ -53,7 +80,7 @@ class Player:
 
     # Returns the number of hands the player currently has.
     def getNumHands(self) -> int:
-        return len(self.hand)
+        return self.num_hands
 
     # Sets the total score of the player's hand(s) (hands if player chose to split)
     def setTotalScore(self, score: int, hand_num: int = 1) -> None:
@@ -63,6 +90,10 @@ class Player:
     def getTotalScore(self, hand_num: int = 1) -> int:
         return self.totalScore[hand_num-1]
 
+    # Returns whether the player's hand(s) (hands if player chose to split) has an ace counted as 11
+    def isSoft(self, hand_num: int = 1) -> bool:
+        return self.SCORING.isSoft(self.hard_total[hand_num-1], self.aces[hand_num-1])
+
     # Sets the player's turn to true or false
     def setTurn(self, is_turn: bool) -> None:
         self.turn = is_turn
@@ -71,9 +102,16 @@ class Player:
     def isTurn(self) -> bool:
         return self.turn
 
-    # Adds a card to player's hand(s) (hands if player chose to split)
-    def addCard(self, card: str, hand_num: int = 1) -> None:
-        self.hand[hand_num-1].append(card)
+    # Adds a card to player's hand(s) (hands if player chose to split).
+    # The hand's hard total and ace count are kept up to date so its score never has to be recounted.
+    def addCard(self, card: int, hand_num: int = 1) -> None:
+        index = hand_num-1
+        value = _CARDVALUES[card]
+        self.hand[index].append(card)
+        self.hard_total[index] += value
+        if value == 1:
+            self.aces[index] += 1
+        self.totalScore[index] = self.SCORING.handScore(self.hard_total[index], self.aces[index])
 
     # Adds winnings (or subtracts losings) to player's total money
     def addMoney(self, money) -> None:
@@ -82,11 +120,24 @@ class Player:
     # Player can split into two hands if both original cards have identical values.
     # Note that the player can split to make up to four individual hands.
     def split(self, hand_num: int = 1) -> None:
-        card = self.hand[hand_num-1].pop(0)
-        self.hand.append([card])
-        self.wager.append(self.wager[hand_num-1])
-        self.totalScore.append(0)
-        self.double_down.append(False)
+        if self.num_hands == self.MAXHANDS:
+            raise ValueError(f'A player can\'t have more than {self.MAXHANDS} hands')
+        index = hand_num-1
+        new_index = self.num_hands
+        self.num_hands += 1
+        self.wager[new_index] = self.wager[index]
+        self.double_down[new_index] = False
+
+        # Both hands are now down to a single card, so their scores are rebuilt from scratch
+        card = self.hand[index].pop(0)
+        self.totalScore[index] = self.hard_total[index] = self.aces[index] = 0
+        for remaining_card in self.hand[index]:
+            value = _CARDVALUES[remaining_card]
+            self.hard_total[index] += value
+            if value == 1:
+                self.aces[index] += 1
+        self.totalScore[index] = self.SCORING.handScore(self.hard_total[index], self.aces[index])
+        self.addCard(card, new_index+1)
 
     # Some variations allow the player to double down when original two cards total up to 9, 10, or 11
     # I'm always allowing players to double down on their first two cards. However, when doubling down,
@@ -104,10 +155,11 @@ class Player:
     def getStartingFunds(self) -> int:
         return self.STARTINGFUNDS
 
-    # Resets the necessary attributes after the round is over
+    # Resets the necessary attributes after the round is over, in place
     def resetPlayer(self) -> None:
-        self.wager = [0]
+        for index in range(self.num_hands):
+            self.hand[index].clear()
+            self.wager[index] = self.totalScore[index] = self.hard_total[index] = self.aces[index] = 0
+            self.double_down[index] = False
         self.insurance_wager = 0
-        self.hand = [[]]
-        self.totalScore = [0]
-        self.double_down = [False]
+        self.num_hands = 1
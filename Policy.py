@@ -0,0 +1,31 @@
+class Policy:
+    """
+    Decision policy used by a player when the game runs headless (or whenever a player is given one).
+    Every decision point that would normally prompt the player with input() asks the policy instead.
+    This default policy plays like the dealer: always bets the minimum, never takes insurance,
+    never doubles down or splits, and hits until reaching 17 or more points.
+    Subclass it and override any of the methods below to plug in a different strategy.
+    """
+
+    # Points at which the default policy stops hitting (same as the dealer)
+    STANDSCORE = 17
+
+    # Returns the wager the player wants to make at the start of the round
+    def wager(self, player, game) -> int:
+        return game.getMinBet()
+
+    # Returns the insurance wager the player wants to make (0 means no insurance bet)
+    def insurance(self, player, game) -> int:
+        return 0
+
+    # Returns whether or not the player wants to double down on a given hand
+    def doubleDown(self, player, hand_num: int, game) -> bool:
+        return False
+
+    # Returns whether or not the player wants to split a given hand
+    def split(self, player, hand_num: int, game) -> bool:
+        return False
+
+    # Returns whether the player wants to hit (True) or stand (False) on a given hand
+    def hit(self, player, hand_num: int, game) -> bool:
+        return player.getTotalScore(hand_num) < self.STANDSCORE
@@ -0,0 +1,299 @@
+from Card import Card
+from HandHistory import HandHistory
+
+
+class Round:
+    """
+    One round of a headless Game played as an explicit state machine instead of a chain of blocking calls.
+    The round runs until it needs a player's decision and then stops. getPending() says which decision
+    (and whose hand) it is waiting for, and step(action) makes that decision and runs the round up to
+    the next one. Nothing blocks between decisions, so a single thread can interleave any number of rounds.
+    The rules, the order the cards are dealt in and the messages sent to the game's output sink are the
+    same as Game.newRound, with every decision kept within the same limits Game puts on a policy's.
+
+        round = Round(game)
+        pending = round.start()
+        while pending is not None:
+            decision, player, hand_num = pending
+            pending = round.step(answer)
+
+    Actions are what a Policy would return: an int for WAGER and INSURANCE (0 declines insurance)
+    and a bool for DOUBLE, SPLIT and HIT (False stands).
+    """
+
+    # States of the round
+    BETTING = 'betting'
+    INITIALDEAL = 'initial deal'
+    INSURANCE = 'insurance'
+    PLAYERTURN = 'player turn'
+    DEALERTURN = 'dealer turn'
+    SETTLEMENT = 'settlement'
+    OVER = 'over'
+
+    # Decisions a round can wait for
+    WAGER = 'wager'
+    INSURE = 'insurance'
+    DOUBLE = 'double'
+    SPLIT = 'split'
+    HIT = 'hit'
+
+    def __init__(self, game):
+        if not game.headless:
+            raise ValueError('Round can only play a headless game')
+        self.game = game
+        self.state = None
+        self.pending = None
+
+        # Position of the round: the player whose turn it is, their hand and which of the two initial cards is being dealt
+        self.player_index = 0
+        self.hand_num = 1
+        self.pass_hands = 0
+        self.deal_pass = 1
+        self.hand_started = False
+
+    # Starts the round and returns the first decision it's waiting for (None if it played out without any)
+    def start(self) -> (str, object, int):
+        if self.state is not None:
+            raise ValueError('Round has already started')
+        self.game._announceRound()
+        self._enter(self.BETTING)
+        return self._advance()
+
+    # Makes the pending decision and returns the next one (None once the round is over)
+    def step(self, action) -> (str, object, int):
+        if self.pending is None:
+            raise ValueError('Round isn\'t waiting for a decision')
+        decision, player, hand_num = self.pending
+
+        # Amounts are parsed before the decision is made, so a bad one leaves it pending
+        if decision == self.WAGER or decision == self.INSURE:
+            action = int(action)
+        self.pending = None
+        game = self.game
+
+        if decision == self.WAGER:
+            player.setWager(max(game.MINBET, min(action, game.MAXBET, player.getMoney())))
+            self.player_index += 1
+
+        elif decision == self.INSURE:
+            # Same limits as Game: no more than half the wager or the money the player has left
+            insurance_wager = min(action, player.getWager() // 2, player.getMoney() - player.getWager())
+            if insurance_wager >= 1:
+                player.setInsuranceWager(insurance_wager)
+            self.player_index += 1
+
+        elif decision == self.DOUBLE:
+            game._recordAction(player, hand_num, HandHistory.DOUBLE if action else HandHistory.NODOUBLE)
+            game._print()
+            if action:
+                player.doubleDown(hand_num)
+                game._print('Doubling down...')
+                self.hand_num += 1
+            elif game._canSplit(player, hand_num):
+                self.pending = (self.SPLIT, player, hand_num)
+                return self.pending
+            else:
+                self.hand_num += 1
+
+        elif decision == self.SPLIT:
+            game._recordAction(player, hand_num, HandHistory.SPLIT if action else HandHistory.NOSPLIT)
+            game._print()
+            if action:
+                player.split(hand_num)
+                game._print('Splitting hand...')
+            self.hand_num += 1
+
+        elif decision == self.HIT:
+            if action:
+                game._recordAction(player, hand_num, HandHistory.HIT)
+                player.addCard(game.CARDS.getCard(), hand_num)
+            else:
+                game._recordAction(player, hand_num, HandHistory.STAND)
+                player.setTurn(False)
+            game._print()
+
+        return self._advance()
+
+    # Returns the decision the round is waiting for as (decision, player, hand number), or None
+    def getPending(self) -> (str, object, int):
+        return self.pending
+
+    # Returns the state the round is in
+    def getState(self) -> str:
+        return self.state
+
+    # Returns whether the round has been played out
+    def isOver(self) -> bool:
+        return self.state == self.OVER
+
+    def _enter(self, state: str) -> None:
+        """
+        Private helper function that moves the round to a new state, starting from the first player
+        """
+        self.state = state
+        self.player_index = 0
+        self.hand_num = 1
+        self.hand_started = False
+        if self.game.players:
+            self.pass_hands = self.game.players[0].getNumHands()
+
+    def _advance(self) -> (str, object, int):
+        """
+        Private helper function that runs the round until it needs a decision or is over
+        """
+        handlers = {self.BETTING: self._betting, self.INITIALDEAL: self._initialDeal, self.INSURANCE: self._insurance,
+                    self.PLAYERTURN: self._playerTurn, self.DEALERTURN: self._dealerTurn, self.SETTLEMENT: self._settlement}
+        while self.pending is None and self.state != self.OVER:
+            handlers[self.state]()
+        return self.pending
+
+    def _betting(self) -> None:
+        game = self.game
+        if self.player_index < len(game.players):
+            player = game.players[self.player_index]
+            game._print()
+            game._print(f'Player: {player.getName()}')
+            game._print(f'Total Money: ${player.getMoney()}')
+
+            # A player with less money than the minimum bet has to bet all of it
+            if player.getMoney() < game.MINBET:
+                game._print()
+                game._print(f'Since you currently have less money than the minimum bet (${game.MINBET}), you\'ll have to bet all your money!')
+                player.setWager(player.getMoney())
+                self.player_index += 1
+            else:
+                self.pending = (self.WAGER, player, 1)
+        else:
+            game._print()
+            game._print('~~~~~~~~~~Let the round begin. Good luck!~~~~~~~~~~')
+            game._print()
+            self.deal_pass = 1
+            self._enter(self.INITIALDEAL)
+
+    def _initialDeal(self) -> None:
+        """
+        Deals one of the two initial cards to every hand, then to the dealer, the same way
+        Game._dealPlayerInitialCards does: hands made by a split are dealt to in another pass
+        """
+        game = self.game
+        if self.player_index < len(game.players):
+            player = game.players[self.player_index]
+
+            # End of a pass over the player's hands: go over them again if any were split
+            if self.hand_num > self.pass_hands:
+                self.hand_num = 1
+                if player.getNumHands() != self.pass_hands:
+                    self.pass_hands = player.getNumHands()
+                else:
+                    self.player_index += 1
+                    if self.player_index < len(game.players):
+                        self.pass_hands = game.players[self.player_index].getNumHands()
+                return
+
+            hand_num = self.hand_num
+            if player.handSize(hand_num) != 2:
+                player.addCard(game.CARDS.getCard(), hand_num)
+                player_score = player.getTotalScore(hand_num)
+                game._print(f'<{player.getName()}> Hand #{hand_num}: {Card.handStr(player.getHand(hand_num))} === {player_score} points')
+
+                # Player can double down or split if they have enough money to, but not on a BlackJack
+                if (player.handSize(hand_num) == 2) and (player.getWager(hand_num) + player.totalWager() <= player.getMoney()) and (player_score != 21):
+                    game._print()
+                    if game._canDoubleDown(player, hand_num):
+                        self.pending = (self.DOUBLE, player, hand_num)
+                        return
+                    if game._canSplit(player, hand_num):
+                        self.pending = (self.SPLIT, player, hand_num)
+                        return
+            self.hand_num += 1
+            return
+
+        game._dealDealerInitialCards()
+        if self.deal_pass == 1:
+            self.deal_pass = 2
+            if Card.ISACE[game.DEALER.getHand()[0]]:
+                self._enter(self.INSURANCE)
+            else:
+                self._enter(self.INITIALDEAL)
+        else:
+            self._enter(self.PLAYERTURN)
+
+    def _insurance(self) -> None:
+        game = self.game
+        if self.player_index < len(game.players):
+            player = game.players[self.player_index]
+            if player.getMoney() - player.getWager() == 0:
+                game._print(f'Sorry, {player.getName()}! You don\'t have anymore money left to make an insurance bet :(')
+                self.player_index += 1
+            else:
+                self.pending = (self.INSURE, player, 1)
+        else:
+            self._enter(self.INITIALDEAL)
+
+    def _playerTurn(self) -> None:
+        """
+        Plays every hand the same way Game.dealPlayerCards does
+        """
+        game = self.game
+        if self.player_index >= len(game.players):
+            self._enter(self.DEALERTURN)
+            return
+
+        player = game.players[self.player_index]
+        if self.hand_num == 1 and not self.hand_started:
+            game._print(f'~~~~~~~~~~~~~~~~{player.getName()}\'s Turn~~~~~~~~~~~~~~~~')
+            game._print()
+
+        if self.hand_num > player.getNumHands():
+            self.player_index += 1
+            self.hand_num = 1
+            self.hand_started = False
+            return
+
+        hand_num = self.hand_num
+        if not self.hand_started:
+            self.hand_started = True
+            hand_score = player.getTotalScore(hand_num)
+
+            if hand_score == 21:
+                game._print(f'Hand #{hand_num}: {Card.handStr(player.getHand(hand_num))} === {hand_score} points')
+                game._print()
+                game._print(f'Congrats, {player.getName()}! You got a BlackJack!')
+
+            # A hand that was doubled down on only gets one more card
+            elif player.hasDoubledDown(hand_num):
+                player.addCard(game.CARDS.getCard(), hand_num)
+                hand_score = player.getTotalScore(hand_num)
+                game._print('Since you doubled down on this hand, you only get one more card.')
+                game._print(f'Hand #{hand_num}: {Card.handStr(player.getHand(hand_num))} === {hand_score} points')
+                if hand_score > 21:
+                    game._print(f'Sorry, {player.getName()}, this hand a bust!')
+
+            else:
+                player.setTurn(True)
+
+        if player.isTurn():
+            hand_score = player.getTotalScore(hand_num)
+            game._print(f'Hand #{hand_num}: {Card.handStr(player.getHand(hand_num))} === {hand_score} points')
+            game._print()
+
+            if hand_score > 21:
+                game._print(f'Sorry, {player.getName()}, this hand is a bust!')
+                player.setTurn(False)
+            elif hand_score == 21:
+                game._print(f'This hand is equal to 21, so you can\'t hit anymore')
+                player.setTurn(False)
+            else:
+                self.pending = (self.HIT, player, hand_num)
+        else:
+            self.hand_num += 1
+            self.hand_started = False
+
+    def _dealerTurn(self) -> None:
+        self.game._playDealerHand()
+        self._enter(self.SETTLEMENT)
+
+    def _settlement(self) -> None:
+        # Settles every hand, pays out and ends the round (reshuffling if needed)
+        self.game.determineWinnings()
+        self.state = self.OVER
@@ -0,0 +1,92 @@
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from Policy import Policy
+from Rules import Rules
+from Simulation import Simulation
+
+
+# Plays the rounds of one rule set in a worker process and returns the simulation's results
+def _runRules(rules: Rules, policy: Policy, num_players: int, seed: str, rounds: int) -> dict:
+    return Simulation(policy, num_players, seed=seed, rules=rules).run(rounds)
+
+
+class RuleSweep:
+    """
+    Plays the same policy under every rule set of a grid, one rule set per worker process, to compare tables.
+    Results are cached by the rules' digest (and the number of rounds, players and the seed), in memory and,
+    given a cache directory, in one JSON file per rule set, so finished points of a sweep are never played
+    again, even by a later run that extends the grid. The cache doesn't know the policy, so sweeps of
+    different policies need different cache directories.
+    Every rule set is seeded from the sweep's seed and its digest, so the same sweep always gives the same results.
+    """
+
+    def __init__(self, policy: Policy = None, num_players: int = 1, rounds: int = 100000, workers: int = None,
+                 seed: int = 0, cache_dir: str = None):
+        self.policy = policy
+        self.num_players = num_players
+        self.rounds = rounds
+        self.workers = workers
+        self.seed = seed
+        self.cache_dir = cache_dir
+        self.results = {}
+        self.played = 0
+
+    # Returns every combination of the given options, e.g. grid(num_decks=[1, 6], payout_str=['3:2', '6:5']).
+    # Fields that aren't given come from the base rules (Game's default rules if there aren't any).
+    @staticmethod
+    def grid(base: Rules = None, **options) -> [Rules]:
+        base = base if base is not None else Rules()
+        names = list(options)
+        return [base.replace(**dict(zip(names, values))) for values in itertools.product(*options.values())]
+
+    # Returns the file the results of a rule set are cached in
+    def cachePath(self, rules: Rules) -> str:
+        return os.path.join(self.cache_dir, f'{rules.digest()}_{self.num_players}p_{self.rounds}r_{self.seed}.json')
+
+    # Plays every rule set that isn't cached yet over the worker pool and returns the results of each rule set
+    def run(self, rule_sets: [Rules]) -> {Rules: dict}:
+        todo = []
+        for rules in dict.fromkeys(rule_sets):
+            if rules not in self.results and not self._load(rules):
+                todo.append(rules)
+
+        if todo:
+            seeds = [f'{self.seed}:{rules.digest()}' for rules in todo]
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                for rules, results in zip(todo, pool.map(_runRules, todo, [self.policy] * len(todo),
+                                                         [self.num_players] * len(todo), seeds,
+                                                         [self.rounds] * len(todo))):
+                    self.results[rules] = results
+                    self.played += 1
+                    self._save(rules)
+        return {rules: self.results[rules] for rules in rule_sets}
+
+    # Returns the number of rule sets this sweep actually played (the rest came from the cache)
+    def getPlayed(self) -> int:
+        return self.played
+
+    def _load(self, rules: Rules) -> bool:
+        """
+        Private helper function that loads a rule set's results from the cache directory, if they're there
+        """
+        if self.cache_dir is None or not os.path.exists(self.cachePath(rules)):
+            return False
+        with open(self.cachePath(rules)) as f:
+            results = json.load(f)
+        del results['rules']
+        results['house_edge_interval'] = tuple(results['house_edge_interval'])
+        self.results[rules] = results
+        return True
+
+    def _save(self, rules: Rules) -> None:
+        """
+        Private helper function that writes a rule set's results to the cache directory
+        """
+        if self.cache_dir is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self.cachePath(rules), 'w') as f:
+            json.dump({'rules': repr(rules), **self.results[rules]}, f)
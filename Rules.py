@@ -0,0 +1,95 @@
+import hashlib
+import math
+from fractions import Fraction
+
+from Cards import Cards
+from Player import Player
+
+
+class Rules:
+    """
+    The rules a table is played with. A Rules object can't be changed once it's made (replace() makes a
+    changed copy), so one can be shared by any number of games, used as a dict key and cached by digest().
+    The defaults are the rules Game has always been played with: Cards.NUMDECKS decks, a BlackJack pays 3:2,
+    the dealer stands on every 17 (S17), the shoe is reshuffled once two thirds of it have been dealt
+    (a round that runs out of cards before then gets the discards shuffled back in, see Cards.reshuffleDiscards),
+    bets from $20 to $500, splitting up to Player.MAXHANDS hands, and doubling down on any two cards,
+    including after a split. A table can deal from a continuous shuffling machine (CSM) instead of a shoe,
+    which holds csm_buffer discards back before mixing them in again (see Cards.setContinuous).
+    """
+
+    FIELDS = ('num_decks', 'payout_str', 'dealer_hits_soft_17', 'penetration', 'min_bet', 'max_bet', 'max_hands',
+              'double_totals', 'double_after_split', 'continuous_shuffle', 'csm_buffer')
+
+    __slots__ = FIELDS + ('payout', 'when_to_shuffle')
+
+    # double_totals are the hand totals a player may double down on (None allows any two cards)
+    def __init__(self, num_decks: int = Cards.NUMDECKS, payout_str: str = '3:2', dealer_hits_soft_17: bool = False,
+                 penetration: float = 2/3, min_bet: int = 20, max_bet: int = 500, max_hands: int = Player.MAXHANDS,
+                 double_totals: tuple = None, double_after_split: bool = True, continuous_shuffle: bool = False,
+                 csm_buffer: int = Cards.CSMBUFFER):
+        if num_decks < 1:
+            raise ValueError('A shoe needs at least one deck')
+        if not 0 < penetration < 1:
+            raise ValueError('Penetration has to be between 0 and 1')
+        if not 0 < min_bet <= max_bet:
+            raise ValueError('The minimum bet has to be positive and no more than the maximum bet')
+        if not 1 <= max_hands <= Player.MAXHANDS:
+            raise ValueError(f'A player can have from 1 to {Player.MAXHANDS} hands')
+        if csm_buffer < 0:
+            raise ValueError('A shuffling machine can\'t hold back fewer than 0 cards')
+        numerator, _, denominator = payout_str.partition(':')
+        if not (numerator.isdigit() and denominator.isdigit() and int(denominator) > 0):
+            raise ValueError(f'A BlackJack payout looks like 3:2, not {payout_str}')
+
+        values = {'num_decks': num_decks, 'payout_str': payout_str, 'dealer_hits_soft_17': dealer_hits_soft_17,
+                  'penetration': penetration, 'min_bet': min_bet, 'max_bet': max_bet, 'max_hands': max_hands,
+                  'double_totals': tuple(sorted(double_totals)) if double_totals is not None else None,
+                  'double_after_split': double_after_split, 'continuous_shuffle': continuous_shuffle,
+                  'csm_buffer': csm_buffer,
+                  'payout': int(numerator) / int(denominator),
+
+                  # The number of cards left in the shoe when it's reshuffled (the cut card)
+                  'when_to_shuffle': math.floor(num_decks * 52 * (1 - Fraction(penetration).limit_denominator(1000)))}
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Rules can\'t be changed, use replace() to make a changed copy')
+
+    def __eq__(self, other):
+        return isinstance(other, Rules) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        return 'Rules(' + ', '.join(f'{name}={getattr(self, name)!r}' for name in self.FIELDS) + ')'
+
+    def __reduce__(self):
+        return Rules, self.key()
+
+    # Returns the rules as a tuple of every field, in FIELDS order
+    def key(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    # Returns a hash of the rules that's the same in every process and every run (hash() isn't), e.g. for cache files
+    def digest(self) -> str:
+        return hashlib.sha1(repr(self.key()).encode()).hexdigest()[:16]
+
+    # Returns a copy of the rules with the given fields changed
+    def replace(self, **changes) -> 'Rules':
+        unknown = set(changes) - set(self.FIELDS)
+        if unknown:
+            raise TypeError(f'Rules don\'t have {", ".join(sorted(unknown))}')
+        return Rules(**{**dict(zip(self.FIELDS, self.key())), **changes})
+
+    # Returns whether the dealer hits a hand with the given score
+    def dealerHits(self, score: int, soft: bool) -> bool:
+        return score <= 16 or (score == 17 and soft and self.dealer_hits_soft_17)
+
+    # Returns whether a player may double down on a two card hand with the given score
+    def canDoubleDown(self, score: int, after_split: bool) -> bool:
+        if after_split and not self.double_after_split:
+            return False
+        return self.double_totals is None or score in self.double_totals
@@ -1,31 +1,38 @@
+from Card import Card
+
+
 class Scoring:
-    VALUES = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, '10': 10, 'J': 10, 'Q': 10, 'K': 10}
+    VALUES = dict(zip(Card.RANKNAMES, Card.RANKVALUES))
+    CARDVALUES = Card.VALUES
 
     def __init__(self):
         pass
 
+    # Returns the value of a single card (a Card code), counting an ace as 1 point
+    def cardValue(self, card: int) -> int:
+        return self.CARDVALUES[card]
+
+    # Returns the best score for a hand given its hard total (every ace counted as 1) and its number of aces.
+    # Two aces counted as 11 would already be 22 points, so at most one ace can be upgraded to 11.
+    def handScore(self, hard_total: int, aces: int) -> int:
+        if self.isSoft(hard_total, aces):
+            return hard_total + 10
+        return hard_total
+
+    # Returns whether a hand with the given hard total and number of aces is soft (an ace is counted as 11)
+    def isSoft(self, hard_total: int, aces: int) -> bool:
+        return aces > 0 and hard_total + 10 <= 21
+
     # Calculates the total score of a given hand
-    def totalScore(self, hand: [str]) -> int:
+    def totalScore(self, hand: [int]) -> int:
         total = 0
         aces = 0
 
-        # Don't count the aces until after counting all other cards. After, look at
-        # the aces and decide whether to count them as 11 or 1
+        # Count every ace as 1 first. After, look at the aces and decide whether one of them can count as 11
         for card in hand:
-
-            # This is so we can ignore the suit of the card (i.e. '3 of hearts').
-            # I wanted the first two characters for the edge case of '10 of XXXX'.
-            # I used .strip() to take care of the white space for all the other values.
-            value = card[0:2].strip()
-            if value == 'A':
+            value = self.cardValue(card)
+            if value == 1:
                 aces += 1
-            else:
-                total += self.VALUES[value]
-
-        for _ in range(aces):
-            if total + 11 > 21:
-                total += 1
-            else:
-                total += 11
+            total += value
 
-        return total
\ No newline at end of file
+        return self.handScore(total, aces)
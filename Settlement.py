@@ -0,0 +1,80 @@
+import numpy as np
+
+from Game import Game
+from Statistics import Statistics
+
+
+class Settlement:
+    """
+    Settles a whole batch of hands in one vectorized pass with exactly the rules of Game.determineWinnings:
+    a dealer's BlackJack beats everything but a player's BlackJack and pays insurance 2:1, a BlackJack pays
+    the BLACKJACKPAYOUT bonus, a bust always loses, and otherwise the higher score wins (a tie is a push).
+    Every hand is one entry of the arrays, so split hands are separate entries that each carry their player's
+    insurance wager, like Game. The dealer's final score and hand size can be a single dealer for every hand
+    or one per hand, so hands from many tables can be settled together.
+    Outcomes are returned as indexes into Statistics.OUTCOMES.
+    """
+
+    BLACKJACK = Statistics.OUTCOMES.index(Statistics.BLACKJACK)
+    WIN = Statistics.OUTCOMES.index(Statistics.WIN)
+    PUSH = Statistics.OUTCOMES.index(Statistics.PUSH)
+    LOSS = Statistics.OUTCOMES.index(Statistics.LOSS)
+    BUST = Statistics.OUTCOMES.index(Statistics.BUST)
+
+    def __init__(self, payout: float = Game.BLACKJACKPAYOUT):
+        self.payout = payout
+
+    # Returns how every hand is settled (indexes into Statistics.OUTCOMES), in the same order of checks as Game
+    def outcomes(self, scores, hand_sizes, dealer_score, dealer_hand_size) -> np.ndarray:
+        scores = np.asarray(scores)
+        dealer_score = np.asarray(dealer_score)
+        blackjack = (scores == 21) & (np.asarray(hand_sizes) == 2)
+        dealer_blackjack = self._dealerBlackJack(dealer_score, dealer_hand_size)
+        return np.select(
+            [dealer_blackjack & blackjack, dealer_blackjack, blackjack, scores > 21,
+             (dealer_score > 21) | (scores > dealer_score), scores < dealer_score],
+            [self.PUSH, self.LOSS, self.BLACKJACK, self.BUST, self.WIN, self.LOSS],
+            self.PUSH).astype(np.int8)
+
+    # Returns every hand's winnings (or losings) and outcome. Wagers are what was bet before doubling down:
+    # a doubled hand wins or loses twice that. Integer wagers get integer winnings, with the BlackJack bonus
+    # rounded down like Game; float wagers (e.g. units of a wager) are paid exactly.
+    def settle(self, scores, hand_sizes, wagers, insurance_wagers, doubled, dealer_score,
+               dealer_hand_size) -> (np.ndarray, np.ndarray):
+        outcomes = self.outcomes(scores, hand_sizes, dealer_score, dealer_hand_size)
+        wagers = np.asarray(wagers)
+        wagers = np.where(doubled, wagers * 2, wagers)
+        bonus = wagers * self.payout
+        if np.issubdtype(wagers.dtype, np.integer):
+            bonus = bonus.astype(wagers.dtype)
+
+        insurance_wagers = np.asarray(insurance_wagers)
+        winnings = np.select(
+            [outcomes == self.BLACKJACK, outcomes == self.WIN, outcomes == self.PUSH],
+            [bonus, wagers, np.zeros_like(wagers)],
+            -wagers)
+        dealer_blackjack = self._dealerBlackJack(dealer_score, dealer_hand_size)
+        winnings = winnings + np.where(dealer_blackjack, insurance_wagers * 2, -insurance_wagers)
+        return winnings, outcomes
+
+    def _dealerBlackJack(self, dealer_score, dealer_hand_size) -> np.ndarray:
+        """
+        Private helper function that returns whether the dealer (or each dealer) has a BlackJack
+        """
+        return (np.asarray(dealer_score) == 21) & (np.asarray(dealer_hand_size) == 2)
+
+    # Settles every hand of a game whose dealer has finished their hand, without printing or paying anything.
+    # Returns the (player, hand number) of every hand with its winnings and outcome.
+    def settleGame(self, game: Game) -> ([tuple], np.ndarray, np.ndarray):
+        hands = [(player, hand_num) for player in game.players for hand_num in range(1, player.getNumHands()+1)]
+        doubled = np.array([player.hasDoubledDown(hand_num) for player, hand_num in hands], dtype=bool)
+        wagers = np.array([player.getWager(hand_num) for player, hand_num in hands], dtype=np.int64)
+        winnings, outcomes = self.settle(
+            np.array([player.getTotalScore(hand_num) for player, hand_num in hands], dtype=np.int16),
+            np.array([player.handSize(hand_num) for player, hand_num in hands], dtype=np.int16),
+            np.where(doubled, wagers // 2, wagers),
+            np.array([player.getInsuranceWager() for player, _ in hands], dtype=np.int64),
+            doubled,
+            game.DEALER.getTotalScore(),
+            game.DEALER.handSize())
+        return hands, winnings, outcomes
@@ -0,0 +1,107 @@
+import argparse
+import mmap
+import random
+import struct
+import weakref
+from array import array
+
+from Cards import Cards
+from CorpusCards import CorpusCards
+from CountSystem import CountSystem
+
+
+class ShoeCorpus:
+    """
+    A file of pre-shuffled shoes, so different runs (and different rules or strategies) can play exactly
+    the same cards. The file is a header (MAGIC, VERSION, decks per shoe, number of shoes) followed by
+    every shoe's card codes (see Card), one byte per card in the order they're dealt.
+    The file is memory-mapped and shoe() hands out views into it, so no shoe is ever copied. close()
+    releases every view still handed out, so they (and any Cards dealing from them) can't be used after it.
+    Write one with writeShoeCorpus or: python ShoeCorpus.py FILE --shoes N [--decks D] [--seed S]
+    """
+
+    MAGIC = b'BJSC'
+    VERSION = 1
+    HEADER = struct.Struct('<4sBBxxI')
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.map) < self.HEADER.size:
+            raise ValueError(f'{path} isn\'t a shoe corpus')
+        magic, version, self.num_decks, self.num_shoes = self.HEADER.unpack_from(self.map)
+        if magic != self.MAGIC:
+            raise ValueError(f'{path} isn\'t a shoe corpus')
+        if version > self.VERSION:
+            raise ValueError(f'{path} uses shoe corpus version {version} (this reader supports up to {self.VERSION})')
+        if len(self.map) != self.HEADER.size + self.num_shoes * self.shoeSize():
+            raise ValueError(f'{path} is cut short or has extra data')
+        self.view = memoryview(self.map)[self.HEADER.size:]
+        self.shoe_views = weakref.WeakSet()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Returns the number of shoes in the corpus
+    def numShoes(self) -> int:
+        return self.num_shoes
+
+    # Returns the number of decks in each shoe
+    def getNumDecks(self) -> int:
+        return self.num_decks
+
+    # Returns the number of cards in each shoe
+    def shoeSize(self) -> int:
+        return self.num_decks * len(Cards.CARDNAMES)
+
+    # Returns a read-only view of a shoe's card codes, in the order they're dealt
+    def shoe(self, shoe_num: int) -> memoryview:
+        if not 0 <= shoe_num < self.num_shoes:
+            raise IndexError(f'Shoe {shoe_num} isn\'t in the corpus ({self.num_shoes} shoes)')
+        size = self.shoeSize()
+        view = self.view[shoe_num * size:(shoe_num + 1) * size]
+        self.shoe_views.add(view)
+        return view
+
+    # Splits the shoes into the given number of disjoint ranges of (almost) the same size, e.g. one per worker
+    def partition(self, parts: int) -> [range]:
+        if not 1 <= parts <= self.num_shoes:
+            raise ValueError(f'Can\'t split {self.num_shoes} shoes into {parts} parts')
+        bounds = [part * self.num_shoes // parts for part in range(parts + 1)]
+        return [range(bounds[part], bounds[part + 1]) for part in range(parts)]
+
+    # Returns a Cards that deals the given shoes (every shoe by default)
+    def cards(self, shoes: range = None, count_system: CountSystem = None) -> CorpusCards:
+        return CorpusCards(self, shoes, count_system)
+
+    # Closes the file, releasing every shoe view still in use (a Cards dealing from the corpus can't deal after it)
+    def close(self) -> None:
+        for view in list(self.shoe_views):
+            view.release()
+        self.view.release()
+        self.map.close()
+
+
+# Writes a corpus of num_shoes shoes shuffled from the given seed (the same seed always writes the same file)
+def writeShoeCorpus(path: str, num_shoes: int, num_decks: int = Cards.NUMDECKS, seed=None) -> None:
+    rng = random.Random(seed)
+    shoe = list(range(len(Cards.CARDNAMES))) * num_decks
+    with open(path, 'wb') as f:
+        f.write(ShoeCorpus.HEADER.pack(ShoeCorpus.MAGIC, ShoeCorpus.VERSION, num_decks, num_shoes))
+        for _ in range(num_shoes):
+            rng.shuffle(shoe)
+            f.write(array('B', shoe).tobytes())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write a file of pre-shuffled shoes')
+    parser.add_argument('path')
+    parser.add_argument('--shoes', type=int, required=True, help='number of shoes to write')
+    parser.add_argument('--decks', type=int, default=Cards.NUMDECKS, help='decks per shoe')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    writeShoeCorpus(args.path, args.shoes, args.decks, args.seed)
@@ -0,0 +1,102 @@
+import random
+import time
+
+from Cards import Cards
+from Dealer import Dealer
+from Game import Game
+from Player import Player
+from Policy import Policy
+from Rules import Rules
+from Statistics import Statistics
+
+
+class Simulation:
+    """
+    Plays rounds of a headless Game back to back without any input() or print() calls.
+    Every hand is settled by Game.determineWinnings, so the results match the interactive game.
+    Players get topped back up to their starting funds before each round (and re-seated if they
+    went broke) so a long run measures the rules and the policy rather than a single bankroll.
+    Every simulation has its own shoe and dealer, and the same seed always plays the same rounds.
+    A simulation can also be given the shoe to deal from, e.g. a ShoeCorpus' pre-shuffled shoes,
+    and the Rules to play by. Instead of a number of rounds, a run can be given the precision it needs
+    (see runUntil) and stop as soon as the house edge is known that well.
+    Besides the statistics of every hand, a simulation keeps statistics of every round's net winnings and
+    wagers. The hands of a round aren't independent (they share the dealer's hand), so the house edge's
+    confidence interval is taken over rounds.
+    """
+
+    # How many rounds are played between checks of the house edge's confidence interval
+    BATCHROUNDS = 1000
+
+    def __init__(self, policy: Policy = None, num_players: int = 1, output=None, seed=None, cards: Cards = None,
+                 rules: Rules = None):
+        if cards is None:
+            cards = Cards(random.Random(seed), rules=rules)
+        self.stats = Statistics()
+        self.round_stats = Statistics()
+        self.game = Game(headless=True, output=output, cards=cards, dealer=Dealer(), statistics=self.stats, rules=rules)
+        self.players = [Player(f'Player {i+1}', policy) for i in range(num_players)]
+        self.rounds = 0
+
+    # Returns the headless game being simulated
+    def getGame(self) -> Game:
+        return self.game
+
+    # Returns the simulated players
+    def getPlayers(self) -> [Player]:
+        return self.players
+
+    # Tops up each player to their starting funds and seats them again if they were removed for going broke
+    def _refillPlayers(self) -> None:
+        for player in self.players:
+            player.addMoney(player.getStartingFunds() - player.getMoney())
+            if player not in self.game.players:
+                # The game only clears the hands of the players still seated when a round ends
+                player.resetPlayer()
+                self.game.addPlayer(player)
+
+    # Plays a single round (the game adds its settled hands to the running totals)
+    def playRound(self) -> [(Player, int)]:
+        self._refillPlayers()
+        total, wagered = self.stats.getTotal(), self.stats.getWagered()
+        self.game.newRound()
+        self.rounds += 1
+        self.round_stats.add(self.stats.getTotal() - total, wager=self.stats.getWagered() - wagered)
+        return self.game.getLastWinnings()
+
+    # Plays the given number of rounds and returns the running totals
+    def run(self, rounds: int) -> dict:
+        for _ in range(rounds):
+            self.playRound()
+        return self.results()
+
+    # Plays batches of rounds until the house edge's confidence interval (over rounds) reaches no further than the given
+    # precision on either side of it (e.g. 0.0001 for ±0.01%), or until max_rounds rounds or max_seconds seconds have gone
+    # by if either is given. Returns the running totals and whether the run reached the precision ('converged').
+    def runUntil(self, precision: float, max_rounds: int = None, max_seconds: float = None,
+                 batch_rounds: int = BATCHROUNDS, z: float = Statistics.CONFIDENCEZ) -> dict:
+        start = time.monotonic()
+        played = 0
+        while True:
+            converged = self.round_stats.getCount() > 1 and self.round_stats.houseEdgeMargin(z) <= precision
+            if converged or (max_rounds is not None and played >= max_rounds) or \
+                    (max_seconds is not None and time.monotonic() - start >= max_seconds):
+                return {**self.results(), 'converged': converged}
+
+            batch = batch_rounds if max_rounds is None else min(batch_rounds, max_rounds - played)
+            for _ in range(batch):
+                self.playRound()
+            played += batch
+
+    # Returns the statistics of every hand settled so far
+    def getStatistics(self) -> Statistics:
+        return self.stats
+
+    # Returns the statistics of every round played so far: each round's net winnings and amount wagered
+    def getRoundStatistics(self) -> Statistics:
+        return self.round_stats
+
+    # Returns the totals so far. 'net' is from the players' point of view and 'house_edge' is what the house keeps per unit wagered.
+    def results(self) -> dict:
+        return {'rounds': self.rounds, 'hands': self.stats.getCount(), 'net': self.stats.getTotal(),
+                'house_edge': self.stats.getHouseEdge(), 'house_edge_interval': self.round_stats.houseEdgeInterval()}
@@ -0,0 +1,120 @@
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from Policy import Policy
+from ShoeCorpus import ShoeCorpus
+from Simulation import Simulation
+from Statistics import Statistics
+
+
+# Plays one chunk of rounds in a worker process and returns its partial statistics of hands and of rounds.
+# With a corpus the chunk deals its own range of the corpus' shoes instead of shuffling from the seed.
+def _runChunk(policy: Policy, num_players: int, seed: str, rounds: int, corpus_path: str = None,
+              shoes: range = None) -> (Statistics, Statistics):
+    if corpus_path is None:
+        sim = Simulation(policy, num_players, seed=seed)
+        sim.run(rounds)
+        return sim.getStatistics(), sim.getRoundStatistics()
+
+    with ShoeCorpus(corpus_path) as corpus:
+        sim = Simulation(policy, num_players, cards=corpus.cards(shoes))
+        sim.run(rounds)
+    return sim.getStatistics(), sim.getRoundStatistics()
+
+
+class SimulationRunner:
+    """
+    Spreads the rounds of a simulation over a pool of worker processes.
+    The rounds are cut into chunks of CHUNKROUNDS and every chunk plays in its own Simulation (with its own
+    Game, Cards and Dealer) seeded from the run's seed and the chunk's number. The partial statistics are
+    merged in chunk order, so the result only depends on the seed, never on how many workers were used.
+    Given a ShoeCorpus file, every chunk deals its own disjoint range of the corpus' shoes instead, so runs
+    with different policies play exactly the same cards.
+    A run can also be given the precision it needs instead of a number of rounds (see runUntil).
+    The statistics of every round are merged too (see getRoundStatistics), and give the precision of the house edge.
+    """
+
+    CHUNKROUNDS = 10000
+
+    def __init__(self, policy: Policy = None, num_players: int = 1, workers: int = None, seed: int = 0,
+                 chunk_rounds: int = None, corpus_path: str = None):
+        self.policy = policy
+        self.num_players = num_players
+        self.workers = workers
+        self.seed = seed
+        self.chunk_rounds = chunk_rounds if chunk_rounds is not None else self.CHUNKROUNDS
+        self.corpus_path = corpus_path
+        self.round_stats = Statistics()
+
+    # Returns the seed of the given chunk. Seeding with a string hashes it, so neighbouring chunks get unrelated streams.
+    def _chunkSeed(self, chunk: int) -> str:
+        return f'{self.seed}:{chunk}'
+
+    # Plays the given number of rounds over the worker pool and returns the merged statistics
+    def run(self, rounds: int) -> Statistics:
+        chunks = [min(self.chunk_rounds, rounds - start) for start in range(0, rounds, self.chunk_rounds)]
+        seeds = [self._chunkSeed(chunk) for chunk in range(len(chunks))]
+        shoes = [None] * len(chunks)
+        if self.corpus_path is not None:
+            with ShoeCorpus(self.corpus_path) as corpus:
+                shoes = corpus.partition(len(chunks))
+
+        stats = Statistics()
+        self.round_stats = Statistics()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for partial, rounds_partial in pool.map(_runChunk, [self.policy] * len(chunks), [self.num_players] * len(chunks),
+                                                    seeds, chunks, [self.corpus_path] * len(chunks), shoes):
+                stats.merge(partial)
+                self.round_stats.merge(rounds_partial)
+        return stats
+
+    # Plays chunks over the worker pool until the house edge's confidence interval (over rounds) reaches no further than
+    # the given precision on either side of it, or until max_rounds rounds or max_seconds seconds have gone by if either is given.
+    # Chunks are merged and checked in chunk order, so without a time limit the result only depends on the seed and
+    # the chunk size, never on how many workers were used. Only a few chunks per worker are ever queued, and the ones
+    # still queued when the run stops are cancelled. Returns the merged statistics and whether the run reached the precision.
+    # Dealing from a corpus needs max_rounds, to know how to split up the corpus' shoes.
+    def runUntil(self, precision: float, max_rounds: int = None, max_seconds: float = None,
+                 z: float = Statistics.CONFIDENCEZ) -> (Statistics, bool):
+        start = time.monotonic()
+        if max_rounds is not None:
+            chunks = [min(self.chunk_rounds, max_rounds - start_round) for start_round in range(0, max_rounds, self.chunk_rounds)]
+        else:
+            chunks = itertools.repeat(self.chunk_rounds)
+        shoes = itertools.repeat(None)
+        if self.corpus_path is not None:
+            if max_rounds is None:
+                raise ValueError('A run dealing from a corpus needs max_rounds')
+            with ShoeCorpus(self.corpus_path) as corpus:
+                shoes = corpus.partition(len(chunks))
+
+        stats = Statistics()
+        self.round_stats = Statistics()
+        converged = False
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            queue_size = 2 * (self.workers if self.workers is not None else os.cpu_count() or 1)
+            chunks = enumerate(zip(chunks, shoes))
+            pending = []
+            while True:
+                for chunk, (rounds, chunk_shoes) in itertools.islice(chunks, queue_size - len(pending)):
+                    pending.append(pool.submit(_runChunk, self.policy, self.num_players, self._chunkSeed(chunk), rounds,
+                                               self.corpus_path, chunk_shoes))
+                if not pending:
+                    break
+
+                partial, rounds_partial = pending.pop(0).result()
+                stats.merge(partial)
+                self.round_stats.merge(rounds_partial)
+                converged = self.round_stats.getCount() > 1 and self.round_stats.houseEdgeMargin(z) <= precision
+                if converged or (max_seconds is not None and time.monotonic() - start >= max_seconds):
+                    break
+
+            for future in pending:
+                future.cancel()
+        return stats, converged
+
+    # Returns the statistics of every round of the last run: each round's net winnings and amount wagered
+    def getRoundStatistics(self) -> Statistics:
+        return self.round_stats
@@ -0,0 +1,146 @@
+import math
+
+
+class Statistics:
+    """
+    Running statistics over settled hands in constant memory: how many hands were won, lost or pushed,
+    the net winnings, and their mean and variance (Welford's algorithm). When hands are added with their
+    outcome, player and wager it also keeps a histogram of OUTCOMES, every player's net winnings and the
+    amount wagered, which gives the house edge and a confidence interval for it. Partial statistics from
+    separate runs can be merged, which gives the same result as if every hand had been added to a single instance.
+    """
+
+    # How a hand can be settled. A hand lost to a dealer's BlackJack can also win its insurance bet.
+    BLACKJACK = 'blackjack'
+    WIN = 'win'
+    PUSH = 'push'
+    LOSS = 'loss'
+    BUST = 'bust'
+    INSURANCEWIN = 'insurance win'
+    OUTCOMES = (BLACKJACK, WIN, PUSH, LOSS, BUST, INSURANCEWIN)
+
+    # z-score of a 95% confidence interval
+    CONFIDENCEZ = 1.96
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.wins = 0
+        self.losses = 0
+        self.pushes = 0
+        self.wagered = 0
+        self.histogram = dict.fromkeys(self.OUTCOMES, 0)
+        self.player_nets = {}
+
+    # Adds the winnings (or losings) of a single hand, optionally with how it was settled (one of OUTCOMES),
+    # whose hand it was, how much was wagered on it and whether it won an insurance bet
+    def add(self, winning, outcome: str = None, player: str = None, wager: int = 0, insurance_won: bool = False) -> None:
+        self.count += 1
+        self.total += winning
+        delta = winning - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (winning - self.mean)
+
+        if winning > 0:
+            self.wins += 1
+        elif winning < 0:
+            self.losses += 1
+        else:
+            self.pushes += 1
+
+        self.wagered += wager
+        if outcome is not None:
+            self.histogram[outcome] += 1
+        if insurance_won:
+            self.histogram[self.INSURANCEWIN] += 1
+        if player is not None:
+            self.player_nets[player] = self.player_nets.get(player, 0) + winning
+
+    # Merges another set of statistics into this one (Chan et al.'s parallel variance update)
+    def merge(self, other: 'Statistics') -> None:
+        if other.count == 0:
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.wins += other.wins
+        self.losses += other.losses
+        self.pushes += other.pushes
+        self.wagered += other.wagered
+        for outcome, hands in other.histogram.items():
+            self.histogram[outcome] += hands
+        for player, net in other.player_nets.items():
+            self.player_nets[player] = self.player_nets.get(player, 0) + net
+
+    # Returns the number of hands added
+    def getCount(self) -> int:
+        return self.count
+
+    # Returns the net winnings over every hand
+    def getTotal(self):
+        return self.total
+
+    # Returns the mean winnings per hand
+    def getMean(self) -> float:
+        return self.mean
+
+    # Returns the sample variance of the winnings per hand
+    def getVariance(self) -> float:
+        if self.count < 2:
+            return 0.0
+        return self.m2 / (self.count - 1)
+
+    # Returns the standard error of the mean winnings per hand
+    def getStandardError(self) -> float:
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.getVariance() / self.count)
+
+    # Returns the number of hands won, lost and pushed
+    def getOutcomes(self) -> dict:
+        return {'wins': self.wins, 'losses': self.losses, 'pushes': self.pushes}
+
+    # Returns how many hands were settled each way (see OUTCOMES)
+    def getHistogram(self) -> dict:
+        return dict(self.histogram)
+
+    # Returns every player's net winnings
+    def getPlayerNets(self) -> dict:
+        return dict(self.player_nets)
+
+    # Returns the amount wagered over every hand
+    def getWagered(self) -> int:
+        return self.wagered
+
+    # Returns the house edge: what the house keeps per unit wagered
+    def getHouseEdge(self) -> float:
+        if self.wagered == 0:
+            return 0.0
+        return -self.total / self.wagered
+
+    # Returns the (low, high) confidence interval of the mean winnings per hand
+    def confidenceInterval(self, z: float = CONFIDENCEZ) -> (float, float):
+        margin = z * self.getStandardError()
+        return self.mean - margin, self.mean + margin
+
+    # Returns how far the confidence interval of the house edge reaches on either side of it (its half-width).
+    # Like the intervals, it takes every added sample as independent, which hands aren't: the hands of one round
+    # share the dealer's hand (and split hands share a round), so a run is sized with statistics of whole rounds.
+    def houseEdgeMargin(self, z: float = CONFIDENCEZ) -> float:
+        if self.wagered == 0:
+            return 0.0
+        return z * self.getStandardError() * self.count / self.wagered
+
+    # Returns the (low, high) confidence interval of the house edge, taking the average wager per hand as fixed
+    def houseEdgeInterval(self, z: float = CONFIDENCEZ) -> (float, float):
+        if self.wagered == 0:
+            return 0.0, 0.0
+        average_wager = self.wagered / self.count
+        low, high = self.confidenceInterval(z)
+        return -high / average_wager, -low / average_wager
@@ -0,0 +1,83 @@
+class Strategy:
+    """
+    Fixed playing strategy stored as decision tables.
+    The hard and soft tables are indexed [player total][dealer upcard] and the pairs table is indexed
+    [pair card value][dealer upcard]. Card values count an ace as 1, so dealer upcards go from 1 (ace) to 10.
+    The default tables play like the dealer: hit until reaching 17 or more points and never split.
+    Once the tables are filled in, decide() answers any decision with a single lookup in a flat index.
+    """
+
+    # Actions stored in the hard and soft tables. DOUBLE hits and DOUBLESTAND stands once
+    # the hand has more than two cards and can't be doubled anymore.
+    STAND = 0
+    HIT = 1
+    DOUBLE = 2
+    DOUBLESTAND = 3
+
+    # Action returned by decide() for a pair that should be split
+    SPLIT = 4
+
+    # Highest total a table has to cover (a hit on 20 can reach 30)
+    MAXTOTAL = 31
+    MAXCARD = 10
+
+    def __init__(self, hard: [[int]] = None, soft: [[int]] = None, pairs: [[bool]] = None, insurance: bool = False):
+        if hard is None:
+            hard = self._dealerTable()
+        if soft is None:
+            soft = self._dealerTable()
+        if pairs is None:
+            pairs = [[False] * (self.MAXCARD+1) for _ in range(self.MAXCARD+1)]
+
+        self.hard = hard
+        self.soft = soft
+        self.pairs = pairs
+        self.insurance = insurance
+        self.index = None
+
+    # Builds a table that hits on 16 or less and stands on 17 or more, no matter the dealer's upcard
+    def _dealerTable(self) -> [[int]]:
+        return [[self.HIT if total <= 16 else self.STAND] * (self.MAXCARD+1) for total in range(self.MAXTOTAL+1)]
+
+    # Returns the action for a hand with the given total against the dealer's upcard value
+    def action(self, total: int, soft: bool, upcard: int) -> int:
+        if soft:
+            return self.soft[total][upcard]
+        return self.hard[total][upcard]
+
+    # Returns whether a pair of cards with the given value should be split against the dealer's upcard value
+    def shouldSplit(self, card_value: int, upcard: int) -> bool:
+        return self.pairs[card_value][upcard]
+
+    # Returns whether an action doubles down when the hand still has two cards
+    def isDouble(self, action: int) -> bool:
+        return action == self.DOUBLE or action == self.DOUBLESTAND
+
+    # Returns whether an action hits when the hand can't be doubled
+    def isHit(self, action: int) -> bool:
+        return action == self.HIT or action == self.DOUBLE
+
+    # Flattens the tables into one byte per (pair card value, soft flag, total, upcard) key.
+    # Pair card value 0 means the hand isn't a pair.
+    def _buildIndex(self) -> bytes:
+        index = bytearray()
+        for pair in range(self.MAXCARD+1):
+            for soft in (False, True):
+                for total in range(self.MAXTOTAL+1):
+                    for upcard in range(self.MAXCARD+1):
+                        if pair > 0 and self.pairs[pair][upcard]:
+                            index.append(self.SPLIT)
+                        else:
+                            index.append(self.action(total, soft, upcard))
+        return bytes(index)
+
+    # Returns the action for a hand in constant time. pair is the value of the paired cards (0 if the hand
+    # isn't a pair). The index is built on the first call, so the tables shouldn't change after that.
+    def decide(self, total: int, soft: bool, pair: int, upcard: int) -> int:
+        if self.index is None:
+            self.index = self._buildIndex()
+        return self.index[((pair * 2 + soft) * (self.MAXTOTAL+1) + total) * (self.MAXCARD+1) + upcard]
+
+    # Returns whether an insurance bet should be made when the dealer shows an ace
+    def takesInsurance(self) -> bool:
+        return self.insurance
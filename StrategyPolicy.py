@@ -0,0 +1,41 @@
+from Policy import Policy
+from Strategy import Strategy
+from Scoring import Scoring
+
+
+class StrategyPolicy(Policy):
+    """
+    Policy that plays a fixed Strategy: every double down, split and hit/stand decision is looked up
+    in the strategy's decision tables. Insurance is half the wager when the strategy takes it.
+    """
+    SCORING = Scoring()
+
+    def __init__(self, strategy: Strategy = None):
+        self.strategy = strategy if strategy is not None else Strategy()
+
+    # Returns the strategy being played
+    def getStrategy(self) -> Strategy:
+        return self.strategy
+
+    # Returns the dealer's upcard as a card value (an ace counts as 1)
+    def _upcard(self, game) -> int:
+        return self.SCORING.cardValue(game.getDealerUpCard())
+
+    def insurance(self, player, game) -> int:
+        if self.strategy.takesInsurance():
+            return player.getWager() // 2
+        return 0
+
+    def doubleDown(self, player, hand_num: int, game) -> bool:
+        action = self.strategy.decide(player.getTotalScore(hand_num), player.isSoft(hand_num), 0, self._upcard(game))
+        return self.strategy.isDouble(action)
+
+    def split(self, player, hand_num: int, game) -> bool:
+        card_value = self.SCORING.cardValue(player.getHand(hand_num)[0])
+        action = self.strategy.decide(player.getTotalScore(hand_num), player.isSoft(hand_num), card_value, self._upcard(game))
+        return action == Strategy.SPLIT
+
+    # A double down the strategy asks for after the first two cards is played as a hit (or a stand)
+    def hit(self, player, hand_num: int, game) -> bool:
+        action = self.strategy.decide(player.getTotalScore(hand_num), player.isSoft(hand_num), 0, self._upcard(game))
+        return self.strategy.isHit(action)
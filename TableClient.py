@@ -0,0 +1,122 @@
+import argparse
+import asyncio
+
+from TableServer import TableServer
+
+
+class TableClient:
+    """
+    Client for TableServer's line protocol. play() answers the server's questions with a callable, so bots
+    and tests can sit at a table; running this module plays interactively from the terminal.
+    Run it with: python TableClient.py <table> <name> [--host HOST] [--port PORT]
+    """
+
+    def __init__(self, host: str = TableServer.HOST, port: int = TableServer.PORT):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+        self.messages = []
+
+    # Connects to the server and waits for its welcome
+    async def connect(self) -> None:
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        await self.expect('WELCOME')
+
+    # Sends a command to the server
+    async def send(self, line: str) -> None:
+        self.writer.write(f'{line}\n'.encode())
+        await self.writer.drain()
+
+    # Returns the next line from the server split into its kind and the rest ('' when disconnected)
+    async def receive(self) -> (str, str):
+        line = (await self.reader.readline()).decode().rstrip('\n')
+        kind, _, rest = line.partition(' ')
+        return kind, rest
+
+    # Reads lines until one of the given kind arrives and returns the rest of it (table messages are kept)
+    async def expect(self, kind: str) -> str:
+        while True:
+            received, rest = await self.receive()
+            if received == kind:
+                return rest
+            if received == 'MSG':
+                self.messages.append(rest)
+            elif received in ('ERROR', ''):
+                raise ConnectionError(rest or 'Disconnected')
+
+    # Sits at a table and returns the money the player starts with
+    async def join(self, table: str, name: str) -> int:
+        await self.send(f'JOIN {table} {name}')
+        return int((await self.expect('SEATED')).split()[1])
+
+    # Asks the table to deal a round
+    async def start(self) -> None:
+        await self.send('START')
+
+    # Answers the server's questions with answer(question, args) until the round ends.
+    # Returns the player's money after the round, or None if they went broke.
+    async def play(self, answer) -> int:
+        while True:
+            kind, rest = await self.receive()
+            if kind == 'ASK':
+                question, *args = rest.split()
+                await self.send(f'ANSWER {answer(question, [int(arg) for arg in args])}')
+            elif kind == 'MSG':
+                self.messages.append(rest)
+            elif kind == 'ROUNDOVER':
+                return int(rest)
+            elif kind == 'BROKE':
+                return None
+            elif kind in ('ERROR', ''):
+                raise ConnectionError(rest or 'Disconnected')
+
+    # Leaves the server
+    async def close(self) -> None:
+        await self.send('QUIT')
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+# Prompts for the terminal player's answers, the same way Game asks them locally
+PROMPTS = {'WAGER': 'How much would you like to wager? (min {0}, max {1}, you have {2}) ',
+           'INSURANCE': 'How much insurance would you like to take? (up to {0}) ',
+           'DOUBLE': 'Hand {0} ({1} points): would you like to double down? (Y/N) ',
+           'SPLIT': 'Hand {0} ({1} points): would you like to split? (Y/N) ',
+           'HIT': 'Hand {0} ({1} points): hit or stand? '}
+
+
+async def _playFromTerminal(client: TableClient, table: str, name: str) -> None:
+    loop = asyncio.get_running_loop()
+    await client.connect()
+    print(f'Seated at {table} with ${await client.join(table, name)}')
+
+    def answer(question: str, args: [int]) -> str:
+        for message in client.messages:
+            print(message)
+        client.messages.clear()
+        return input(PROMPTS[question].format(*args))
+
+    while True:
+        if (await loop.run_in_executor(None, input, 'Deal a round? (Y/N) ')).upper() != 'Y':
+            break
+        await client.start()
+        money = await client.play(answer)
+        for message in client.messages:
+            print(message)
+        client.messages.clear()
+        if money is None:
+            print('You\'re out of money!')
+            break
+        print(f'You have ${money}')
+    await client.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Play BlackJack at a TableServer')
+    parser.add_argument('table')
+    parser.add_argument('name')
+    parser.add_argument('--host', default=TableServer.HOST)
+    parser.add_argument('--port', type=int, default=TableServer.PORT)
+    args = parser.parse_args()
+    asyncio.run(_playFromTerminal(TableClient(args.host, args.port), args.table, args.name))
@@ -0,0 +1,276 @@
+import argparse
+import asyncio
+
+from Cards import Cards
+from Dealer import Dealer
+from Game import Game
+from Player import Player
+from Round import Round
+
+
+class _Table:
+    """
+    One table: its own headless Game with its own shoe and dealer, and the connections seated at it.
+    Rounds are played with Round, so a table waiting on a player's answer holds nothing but its state
+    and every table shares the event loop's thread.
+    """
+
+    def __init__(self, name: str, answer_timeout: float = None):
+        self.name = name
+        self.answer_timeout = answer_timeout
+        self.game = Game(headless=True, output=self._output, cards=Cards(), dealer=Dealer())
+        self.connections = []
+        self.playing = False
+
+        # The task playing the current round (None before the first round)
+        self.task = None
+
+    # Game's output sink
+    def _output(self, message: str) -> None:
+        self.broadcast(f'MSG {message}')
+
+    # Sends a line to everyone seated at the table
+    def broadcast(self, line: str) -> None:
+        for connection in self.connections:
+            connection.send(line)
+
+    # Seats a connection at the table. Players can only join between rounds.
+    def seat(self, connection: '_Connection', name: str) -> bool:
+        if self.playing:
+            return False
+        player = Player(name)
+        self.game.addPlayer(player)
+        if player not in self.game.players:
+            return False
+        connection.player = player
+        self.connections.append(connection)
+        return True
+
+    # Removes a connection from the table. Someone leaving mid-round is removed once the round is over.
+    def unseat(self, connection: '_Connection') -> None:
+        if connection in self.connections and not self.playing:
+            self.connections.remove(connection)
+            self.game.removePlayer(connection.player)
+
+    # Returns the question asking a player for a round's pending decision
+    def _question(self, decision: str, player: Player, hand_num: int) -> str:
+        if decision == Round.WAGER:
+            return f'WAGER {self.game.getMinBet()} {self.game.getMaxBet()} {player.getMoney()}'
+        if decision == Round.INSURE:
+            return f'INSURANCE {player.getWager() // 2}'
+        return f'{decision.upper()} {hand_num} {player.getTotalScore(hand_num)}'
+
+    # Turns a player's answer into the round's action. A player who disconnected plays like the default policy.
+    def _action(self, decision: str, player: Player, hand_num: int, answer: str) -> object:
+        policy = self.game.DEFAULTPOLICY
+        if decision == Round.WAGER:
+            return int(answer) if answer is not None and answer.isdigit() else policy.wager(player, self.game)
+        if decision == Round.INSURE:
+            return int(answer) if answer is not None and answer.isdigit() else 0
+        if decision == Round.HIT:
+            if answer is None:
+                return policy.hit(player, hand_num, self.game)
+            return answer.lower() == 'hit'
+        return (answer or '').upper() == 'Y'
+
+    # Starts playing a round in its own task. The table is playing from this moment on, so a second
+    # START that arrives before the task first runs is refused instead of starting another round.
+    def startRound(self) -> None:
+        self.playing = True
+        self.task = asyncio.create_task(self.playRound())
+        self.task.add_done_callback(self._roundDone)
+
+    def _roundDone(self, task: asyncio.Task) -> None:
+        """
+        Private helper function that frees the table for the next round. A round that failed is abandoned without
+        settling any hand (see Game.abortRound), the players are told, and anyone who left during it is unseated.
+        """
+        self.playing = False
+        if task.cancelled() or task.exception() is not None:
+            self.game.abortRound()
+            self.broadcast(f'ERROR The round failed: {"cancelled" if task.cancelled() else repr(task.exception())}')
+            for connection in self.connections[:]:
+                if connection.closed:
+                    self.unseat(connection)
+                    connection.table = None
+
+    # Plays one round, asking the players for their decisions, and then tells them how much money they have
+    async def playRound(self) -> None:
+        self.playing = True
+        try:
+            connections = {connection.player: connection for connection in self.connections}
+            game_round = Round(self.game)
+            pending = game_round.start()
+            while pending is not None:
+                answer = await connections[pending[1]].ask(self._question(*pending), self.answer_timeout)
+                pending = game_round.step(self._action(*pending, answer))
+        finally:
+            self.playing = False
+
+        for connection in self.connections[:]:
+            if connection.closed or connection.player not in self.game.players:
+                if connection.player not in self.game.players:
+                    connection.send('BROKE')
+                self.unseat(connection)
+                connection.table = None
+            else:
+                connection.send(f'ROUNDOVER {connection.player.getMoney()}')
+
+
+class _Connection:
+    """
+    One remote player speaking the line protocol (see TableServer).
+    """
+
+    def __init__(self, server: 'TableServer', reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.loop = asyncio.get_running_loop()
+        self.table = None
+        self.player = None
+        self.pending = None
+        self.closed = False
+
+    # Sends a line to the remote player
+    def send(self, line: str) -> None:
+        if not self.closed:
+            self.writer.write(f'{line}\n'.encode())
+
+    # Asks the remote player a question and waits for their answer (None if they disconnect or don't answer
+    # within timeout seconds, which then plays like the default policy)
+    async def ask(self, question: str, timeout: float = None) -> str:
+        if self.closed:
+            return None
+        self.pending = self.loop.create_future()
+        self.send(f'ASK {question}')
+        try:
+            return await asyncio.wait_for(self.pending, timeout)
+        except asyncio.TimeoutError:
+            self.send('MSG No answer in time, so the table decided for you')
+            return None
+
+    # Reads and handles commands until the remote player quits or disconnects
+    async def serve(self) -> None:
+        self.send('WELCOME')
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                command, _, argument = line.decode().strip().partition(' ')
+                if command.upper() == 'QUIT':
+                    break
+                await self.handle(command.upper(), argument.strip())
+        except ConnectionError:
+            pass
+        finally:
+            self.closed = True
+            if self.pending is not None and not self.pending.done():
+                self.pending.set_result(None)
+            if self.table is not None:
+                self.table.unseat(self)
+            self.writer.close()
+
+    async def handle(self, command: str, argument: str) -> None:
+        if command == 'ANSWER':
+            if self.pending is None or self.pending.done():
+                self.send('ERROR Nothing to answer')
+            else:
+                self.pending.set_result(argument)
+
+        elif command == 'JOIN':
+            table_name, _, name = argument.partition(' ')
+            if self.table is not None:
+                self.send('ERROR Already seated')
+            elif not table_name or not name:
+                self.send('ERROR Usage: JOIN <table> <name>')
+            elif not self.server.getTable(table_name).seat(self, name):
+                self.send('ERROR A round is being played at that table')
+            else:
+                self.table = self.server.getTable(table_name)
+                self.send(f'SEATED {table_name} {self.player.getMoney()}')
+
+        elif command == 'START':
+            if self.table is None:
+                self.send('ERROR Not seated')
+            elif self.table.playing:
+                self.send('ERROR A round is already being played')
+            else:
+                self.table.startRound()
+
+        elif command == 'LEAVE':
+            if self.table is None or self.table.playing:
+                self.send('ERROR Can\'t leave right now')
+            else:
+                self.table.unseat(self)
+                self.table = None
+                self.send('LEFT')
+
+        else:
+            self.send(f'ERROR Unknown command {command}')
+
+
+class TableServer:
+    """
+    Hosts any number of independent BlackJack tables in one process with asyncio. Every table has its own
+    Game, shoe and dealer, and all of them are played on the event loop's thread. Remote players talk to
+    it over TCP with one command per line:
+
+        client -> server: JOIN <table> <name> | START | ANSWER <value> | LEAVE | QUIT
+        server -> client: WELCOME | SEATED <table> <money> | MSG <text> | ASK <question> | ROUNDOVER <money>
+                          | BROKE | LEFT | ERROR <text>
+
+    Questions are WAGER <min> <max> <money>, INSURANCE <max>, DOUBLE <hand> <score>, SPLIT <hand> <score>
+    (answered Y or N) and HIT <hand> <score> (answered hit or stand). See TableClient for a client.
+    A player who doesn't answer within answer_timeout seconds (None waits forever) has that decision made for
+    them like the default policy would, so one silent client can't stall a table.
+    Run it with: python TableServer.py [--host HOST] [--port PORT] [--answer-timeout SECONDS]
+    """
+
+    HOST = '127.0.0.1'
+    PORT = 8765
+    ANSWERTIMEOUT = 60
+
+    def __init__(self, host: str = HOST, port: int = PORT, answer_timeout: float = ANSWERTIMEOUT):
+        self.host = host
+        self.port = port
+        self.answer_timeout = answer_timeout
+        self.tables = {}
+        self.server = None
+
+    # Returns the table with the given name, opening it if it doesn't exist yet
+    def getTable(self, name: str) -> _Table:
+        if name not in self.tables:
+            self.tables[name] = _Table(name, self.answer_timeout)
+        return self.tables[name]
+
+    async def _serveConnection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await _Connection(self, reader, writer).serve()
+
+    # Starts listening and returns the port (useful with port 0, which picks a free one)
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._serveConnection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.port
+
+    # Stops listening
+    async def close(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def serveForever(self) -> None:
+        await self.start()
+        print(f'Serving BlackJack tables on {self.host}:{self.port}')
+        async with self.server:
+            await self.server.serve_forever()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Host BlackJack tables over TCP')
+    parser.add_argument('--host', default=TableServer.HOST)
+    parser.add_argument('--port', type=int, default=TableServer.PORT)
+    parser.add_argument('--answer-timeout', type=float, default=TableServer.ANSWERTIMEOUT,
+                        help='seconds a player has to answer before the table decides for them')
+    args = parser.parse_args()
+    asyncio.run(TableServer(args.host, args.port, args.answer_timeout).serveForever())
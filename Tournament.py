@@ -0,0 +1,107 @@
+import math
+import random
+
+from Cards import Cards
+from Policy import Policy
+from Rules import Rules
+from Simulation import Simulation
+from Statistics import Statistics
+
+
+class Tournament:
+    """
+    Plays several policies against exactly the same cards (common random numbers) to compare them with far
+    fewer rounds than separate simulations would need. Every policy plays at its own headless table, and every
+    round all of the tables start from the same shoe: the first policy (the baseline) deals from it as usual and
+    the other tables are put back into the shoe's state from before the round (see Cards.getState) before they
+    play it. The same cards come out in the same order until the policies' choices make the hands differ, and
+    the next round starts from wherever the baseline's shoe ended up.
+    Results are reported as the paired difference of every policy's net winnings per round to the baseline's,
+    with a confidence interval, next to the wider interval the difference would have if the policies had been
+    played on independent shoes. The shoe is shuffled from the seed, or dealt from a ShoeCorpus if given one.
+    """
+
+    def __init__(self, policies: {str: Policy}, num_players: int = 1, seed=None, rules: Rules = None,
+                 corpus=None, shoes: range = None):
+        if len(policies) < 2:
+            raise ValueError('A tournament needs at least two policies')
+        self.names = list(policies)
+        self.baseline = self.names[0]
+        self.sims = {}
+        self.cards = {}
+        for name, policy in policies.items():
+            if corpus is not None:
+                cards = corpus.cards(shoes)
+                if rules is not None and rules.continuous_shuffle:
+                    cards.setContinuous(rules.csm_buffer)
+            else:
+                cards = Cards(random.Random(seed), rules=rules)
+            self.cards[name] = cards
+            self.sims[name] = Simulation(policy, num_players, cards=cards, rules=rules)
+
+        # Every policy's net winnings per round, and every other policy's net winnings minus the baseline's
+        self.round_nets = {name: Statistics() for name in self.names}
+        self.differences = {name: Statistics() for name in self.names[1:]}
+        self.state = self.cards[self.baseline].getState()
+        self.rounds = 0
+
+    # Plays one round at every table from the same shoe and returns each policy's net winnings for the round
+    def playRound(self) -> {str: int}:
+        nets = {self.baseline: self._playTable(self.baseline)}
+        start = self.state
+        self.state = self.cards[self.baseline].getState()
+        for name in self.names[1:]:
+            self.cards[name].setState(start)
+            nets[name] = self._playTable(name)
+        self.rounds += 1
+
+        for name, net in nets.items():
+            self.round_nets[name].add(net)
+        for name, differences in self.differences.items():
+            differences.add(nets[name] - nets[self.baseline])
+        return nets
+
+    def _playTable(self, name: str) -> int:
+        """
+        Private helper function that plays one round at a policy's table and returns the policy's net winnings
+        """
+        return sum(winning for _, winning in self.sims[name].playRound())
+
+    # Plays the given number of rounds and returns the results
+    def run(self, rounds: int) -> dict:
+        for _ in range(rounds):
+            self.playRound()
+        return self.results()
+
+    # Returns the simulation a policy plays in
+    def getSimulation(self, name: str) -> Simulation:
+        return self.sims[name]
+
+    # Returns the name of the policy every other policy is compared to
+    def getBaseline(self) -> str:
+        return self.baseline
+
+    # Returns the statistics of a policy's net winnings per round minus the baseline's
+    def getDifferences(self, name: str) -> Statistics:
+        return self.differences[name]
+
+    # Returns every policy's results: its simulation's results, its mean net winnings per round and their interval,
+    # and for every policy but the baseline the mean difference per round to the baseline with its paired interval,
+    # the interval independent shoes would have given, and how many times more rounds those would have needed
+    def results(self, z: float = Statistics.CONFIDENCEZ) -> {str: dict}:
+        results = {}
+        baseline = self.round_nets[self.baseline]
+        for name in self.names:
+            nets = self.round_nets[name]
+            results[name] = {**self.sims[name].results(), 'mean': nets.getMean(), 'interval': nets.confidenceInterval(z)}
+            if name == self.baseline:
+                continue
+
+            differences = self.differences[name]
+            margin = z * math.sqrt(nets.getStandardError() ** 2 + baseline.getStandardError() ** 2)
+            unpaired_variance = nets.getVariance() + baseline.getVariance()
+            results[name].update({
+                'difference': differences.getMean(), 'difference_interval': differences.confidenceInterval(z),
+                'unpaired_interval': (differences.getMean() - margin, differences.getMean() + margin),
+                'variance_ratio': unpaired_variance / differences.getVariance() if differences.getVariance() > 0 else math.inf})
+        return results
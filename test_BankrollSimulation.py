@@ -0,0 +1,80 @@
+import numpy as np
+from unittest import TestCase
+from BankrollSimulation import BankrollSimulation
+from Dealer import Dealer
+from Game import Game
+from Player import Player
+from Strategy import Strategy
+from StrategyPolicy import StrategyPolicy
+from test_BatchSimulation import FixedCards
+
+
+# Bets a quarter of the player's money
+class QuarterPolicy(StrategyPolicy):
+
+    def wager(self, player, game) -> int:
+        return player.getMoney() // 4
+
+
+class TestBankrollSimulation(TestCase):
+
+    def setUp(self):
+        self.strategy = Strategy(insurance=True)
+        for upcard in range(1, 11):
+            for total in (9, 10, 11):
+                self.strategy.hard[total][upcard] = Strategy.DOUBLE
+            self.strategy.soft[18][upcard] = Strategy.DOUBLESTAND
+
+    # Plays a single path until it goes broke (or 2000 rounds) and replays its shoes in a Game, checking the
+    # player's money after every round
+    def _matchGame(self, bet, policy: StrategyPolicy, starting_funds: int) -> None:
+        sim = BankrollSimulation(self.strategy, bet, num_paths=1, starting_funds=starting_funds, seed=4)
+        shoes = [sim.shoes[0].copy()]
+        shuffled = sim.batch.shuffledShoes
+
+        def shuffledShoes(num_shoes: int) -> np.ndarray:
+            shoes.append(shuffled(num_shoes)[0])
+            return np.array([shoes[-1]])
+        sim.batch.shuffledShoes = shuffledShoes
+
+        money = []
+        while sim.getMoney()[0] > 0 and sim.rounds < 2000:
+            sim.step()
+            money.append(int(sim.getMoney()[0]))
+
+        game = Game(headless=True, cards=FixedCards([shoe.tolist() for shoe in shoes]), dealer=Dealer())
+        player = Player('Player 1', policy)
+        player.addMoney(starting_funds - player.getMoney())
+        game.addPlayer(player)
+        for expected in money:
+            game.newRound()
+            self.assertEqual(player.getMoney(), expected)
+        self.assertEqual(game.getNumPlayers(), 0 if money[-1] <= 0 else 1)
+
+    # Tests that every path's bankroll follows Game exactly, all-in bets, insurance and double downs included
+    def test_matches_game(self):
+        self._matchGame(None, StrategyPolicy(self.strategy), 150)
+        self._matchGame(lambda money: money // 4, QuarterPolicy(self.strategy), 400)
+
+    # Tests that money never goes below 0, broke paths stop playing and the results add up
+    def test_results(self):
+        sim = BankrollSimulation(num_paths=2000, starting_funds=200, seed=1)
+        results = sim.run(300)
+        money = sim.getMoney()
+        ruined = sim.getRuinRounds() > 0
+
+        self.assertEqual(results['rounds'], 300)
+        self.assertTrue((money >= 0).all())
+        self.assertTrue((money[ruined] == 0).all())
+        self.assertTrue((money[~ruined] > 0).all())
+        self.assertAlmostEqual(results['risk_of_ruin'], ruined.mean())
+        self.assertGreater(results['risk_of_ruin'], 0)
+        self.assertEqual(list(results['final_bankroll']), list(BankrollSimulation.PERCENTILES))
+        self.assertTrue(all(1 <= rounds <= 300 for rounds in results['time_to_ruin'].values()))
+        self.assertLess(results['session_length'], 300)
+
+    # Tests that betting the maximum goes broke more often than betting the minimum
+    def test_bet_policies(self):
+        small = BankrollSimulation(num_paths=2000, seed=2).run(200)
+        large = BankrollSimulation(bet=lambda money: np.full(money.shape, Game.MAXBET), num_paths=2000, seed=2).run(200)
+        self.assertGreater(large['risk_of_ruin'], small['risk_of_ruin'])
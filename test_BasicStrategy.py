@@ -0,0 +1,59 @@
+import os
+import tempfile
+from unittest import TestCase
+from BasicStrategy import BasicStrategy
+from Rules import Rules
+from Strategy import Strategy
+
+
+class TestBasicStrategy(TestCase):
+
+    # Tests a few well known basic strategy plays
+    def test_known_plays(self):
+        s = BasicStrategy().build()
+
+        self.assertEqual(s.decide(16, False, 0, 10), Strategy.HIT)
+        self.assertEqual(s.decide(12, False, 4, 4), Strategy.STAND)
+        self.assertEqual(s.decide(11, False, 0, 6), Strategy.DOUBLE)
+        self.assertEqual(s.decide(18, True, 0, 1), Strategy.HIT)
+        self.assertEqual(s.decide(19, True, 0, 6), Strategy.STAND)
+        self.assertEqual(s.decide(16, False, 8, 6), Strategy.SPLIT)
+        self.assertEqual(s.decide(12, True, 1, 10), Strategy.SPLIT)
+        self.assertEqual(s.decide(20, False, 10, 6), Strategy.STAND)
+
+    # Tests that the tables follow the rules: H17, double down limits with and without a split, and no splitting
+    def test_rules(self):
+        s17 = BasicStrategy().build()
+        h17 = BasicStrategy(rules=Rules(dealer_hits_soft_17=True)).build()
+        self.assertEqual(s17.decide(19, True, 0, 6), Strategy.STAND)
+        self.assertEqual(h17.decide(19, True, 0, 6), Strategy.DOUBLESTAND)
+
+        no_das = BasicStrategy(rules=Rules(double_after_split=False)).build()
+        self.assertEqual(s17.decide(8, False, 4, 5), Strategy.SPLIT)
+        self.assertNotEqual(no_das.decide(8, False, 4, 5), Strategy.SPLIT)
+
+        ten_eleven = BasicStrategy(rules=Rules(double_totals=(10, 11))).build()
+        self.assertEqual(ten_eleven.decide(9, False, 0, 5), Strategy.HIT)
+        self.assertEqual(ten_eleven.decide(11, False, 0, 6), Strategy.DOUBLE)
+        self.assertNotEqual(BasicStrategy(rules=Rules(max_hands=1)).build().decide(16, False, 8, 6), Strategy.SPLIT)
+
+    # Tests that the tables are written to the cache and read back from it
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            b = BasicStrategy(num_decks=2)
+            b.CACHEDIR = cache_dir
+            built = b.load()
+
+            self.assertTrue(os.path.exists(b.cachePath()))
+            self.assertIs(b.load(), built)
+
+            BasicStrategy._LOADED.clear()
+            loaded = b.load()
+            self.assertEqual(loaded.hard, built.hard)
+            self.assertEqual(loaded.soft, built.soft)
+            self.assertEqual(loaded.pairs, built.pairs)
+
+            # Different rules never share a cache file
+            h17 = BasicStrategy(num_decks=2, rules=Rules(dealer_hits_soft_17=True))
+            self.assertEqual(h17.num_decks, 2)
+            self.assertNotEqual(h17.cachePath(), b.cachePath())
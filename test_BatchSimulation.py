@@ -0,0 +1,73 @@
+import numpy as np
+from unittest import TestCase
+from BatchSimulation import BatchSimulation
+from Card import Card
+from Cards import Cards
+from Game import Game
+from Simulation import Simulation
+from Strategy import Strategy
+from StrategyPolicy import StrategyPolicy
+
+
+# Deals the given shoes in order instead of shuffling, moving on to the next shoe whenever Game reshuffles
+class FixedCards(Cards):
+
+    def __init__(self, shoes):
+        super().__init__()
+        self.shoes = [[self._cardCode(value) for value in shoe] for shoe in shoes]
+        self.dealt = self.shoes.pop(0)
+
+    def _cardCode(self, value) -> int:
+        return Card.code('A of spades' if value == 1 else f'{value} of spades')
+
+    def getCard(self) -> str:
+        return self.dealt.pop(0)
+
+    def shuffle(self) -> None:
+        if self.shoes:
+            self.dealt = self.shoes.pop(0)
+
+    def deckSize(self) -> int:
+        return len(self.dealt)
+
+
+class TestBatchSimulation(TestCase):
+
+    # Tests that the batch simulator settles the same shoes exactly like the scalar Game path
+    def test_matches_game(self):
+        strategy = Strategy(insurance=True)
+        for upcard in range(1, 11):
+            strategy.hard[11][upcard] = Strategy.DOUBLE
+            strategy.soft[18][upcard] = Strategy.DOUBLE
+
+        batch = BatchSimulation(strategy, seed=7)
+        shoes = batch.shuffledShoes(20)
+        results = batch.playShoes(shoes)
+
+        sim = Simulation(policy=StrategyPolicy(strategy))
+        sim.getGame().CARDS = FixedCards(shoes.tolist())
+        sim.run(results['rounds'])
+
+        self.assertEqual(results['rounds'], sim.results()['rounds'])
+        self.assertEqual(results['net'] * Game.MINBET, sim.results()['net'])
+
+    # Tests that every round ends up as exactly one win, loss or push
+    def test_outcome_counts(self):
+        results = BatchSimulation(num_shoes=100, seed=1).run(1000)
+
+        self.assertGreaterEqual(results['rounds'], 1000)
+        self.assertEqual(results['wins'] + results['losses'] + results['pushes'], results['rounds'])
+        self.assertLess(results['net'], 0)
+
+    # Tests that a shoe running out of cards in the middle of a round raises instead of dealing cards it doesn't have
+    def test_empty_shoe(self):
+        batch = BatchSimulation(num_shoes=2, seed=1)
+        shoes = batch.shuffledShoes(2)
+        playing = np.array([True, False])
+        with self.assertRaises(IndexError):
+            batch.playRound(shoes, np.array([shoes.shape[1] - 3, shoes.shape[1]]), playing)
+
+        # A shoe that isn't playing can sit at the end of its cards
+        cursor = np.array([0, shoes.shape[1]])
+        batch.playRound(shoes, cursor, playing)
+        self.assertEqual(cursor[1], shoes.shape[1])
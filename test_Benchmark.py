@@ -0,0 +1,30 @@
+from unittest import TestCase
+from Benchmark import Benchmark
+
+
+class TestBenchmark(TestCase):
+
+    # Tests that only slowdowns and allocation growth past the threshold are flagged
+    def test_compare(self):
+        b = Benchmark()
+        baseline = {'fast': {'ops_per_sec': 1000, 'peak_bytes': 1000},
+                    'slow': {'ops_per_sec': 1000, 'peak_bytes': 1000},
+                    'hungry': {'ops_per_sec': 1000, 'peak_bytes': 1000}}
+        results = {'fast': {'ops_per_sec': 950, 'peak_bytes': 1050},
+                   'slow': {'ops_per_sec': 800, 'peak_bytes': 1000},
+                   'hungry': {'ops_per_sec': 1200, 'peak_bytes': 2000},
+                   'new': {'ops_per_sec': 1, 'peak_bytes': 1}}
+
+        regressions = b.compare(results, baseline, 0.1)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith('slow'))
+        self.assertTrue(regressions[1].startswith('hungry'))
+
+    # Tests that every case runs and reports its numbers
+    def test_run(self):
+        results = Benchmark(min_time=0.001).run()
+
+        self.assertIn('Cards.getCard', results)
+        for result in results.values():
+            self.assertGreater(result['ops_per_sec'], 0)
+            self.assertGreaterEqual(result['peak_bytes'], 0)
@@ -0,0 +1,36 @@
+from unittest import TestCase
+from BetRampPolicy import BetRampPolicy
+from CountSystem import CountSystem
+from Simulation import Simulation
+
+
+class TestBetRampPolicy(TestCase):
+
+    # Tests the number of units bet at different true counts
+    def test_units(self):
+        b = BetRampPolicy({1: 1, 2: 2, 4: 8})
+
+        self.assertEqual(b.units(-3.5), 1)
+        self.assertEqual(b.units(1.9), 1)
+        self.assertEqual(b.units(2.0), 2)
+        self.assertEqual(b.units(3.7), 2)
+        self.assertEqual(b.units(12), 8)
+
+    # Tests that the wager placed in a headless game is the ramp's units for the true count times the minimum bet
+    def test_headless_wager(self):
+        sim = Simulation(policy=BetRampPolicy(), seed=3)
+        game = sim.getGame()
+        cards = game.CARDS
+        cards.setCountSystem(CountSystem.HILO)
+        wagers = []
+        determine_wager = game._determineWager
+        game._determineWager = lambda player: wagers.append(determine_wager(player)) or wagers[-1]
+
+        # A full shoe has exactly NUMDECKS decks left, so a running count of NUMDECKS times k is a true count of k
+        for true_count, units in ((-3, 1), (0, 1), (1, 1), (2, 2), (3, 4), (4, 6), (5, 8), (9, 8)):
+            cards.shuffle()
+            cards.running_count = true_count * cards.getNumDecks()
+            self.assertEqual(cards.trueCount(), true_count)
+            sim.playRound()
+            self.assertEqual(wagers[-1], units * game.getMinBet())
+        self.assertEqual(len(wagers), 8)
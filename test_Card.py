@@ -0,0 +1,29 @@
+from unittest import TestCase
+from Card import Card
+
+
+class TestCard(TestCase):
+
+    # Tests that every code's rank, value, ace flag and name agree with each other
+    def test_tables(self):
+        self.assertEqual(len(Card.NAMES), 52)
+        for code, name in enumerate(Card.NAMES):
+            rank = name.split(' of ')[0]
+            self.assertEqual(Card.code(name), code)
+            self.assertEqual(Card.name(code), name)
+            self.assertEqual(Card.RANKNAMES[Card.RANKS[code]], rank)
+            self.assertEqual(Card.ISACE[code], rank == 'A')
+            self.assertEqual(Card.VALUES[code], 1 if rank == 'A' else 10 if rank in ('J', 'Q', 'K') else int(rank))
+
+    # Tests that hands are shown exactly like a list of card names
+    def test_hand_str(self):
+        hand = [Card.code('10 of hearts'), Card.code('A of spades'), Card.code('Q of clubs')]
+        self.assertEqual(Card.handStr(hand), str(['10 of hearts', 'A of spades', 'Q of clubs']))
+        self.assertEqual(Card.handStr([]), '[]')
+
+    # Tests that cards of the same rank match whatever their suit, and that different tens don't
+    def test_ranks(self):
+        self.assertEqual(Card.RANKS[Card.code('8 of spades')], Card.RANKS[Card.code('8 of hearts')])
+        self.assertEqual(Card.RANKS[Card.code('10 of spades')], Card.RANKS[Card.code('10 of clubs')])
+        self.assertNotEqual(Card.RANKS[Card.code('10 of spades')], Card.RANKS[Card.code('J of spades')])
+        self.assertEqual(Card.VALUES[Card.code('10 of spades')], Card.VALUES[Card.code('J of spades')])
@@ -1,5 +1,12 @@
+import random
+from collections import Counter
 from unittest import TestCase
+from Card import Card
 from Cards import Cards
+from CountSystem import CountSystem
+from Rules import Rules
+from Scoring import Scoring
+from Simulation import Simulation
 
 
 class TestCards(TestCase):
@@ -9,7 +16,7 @@ class TestCards(TestCase):
 
         c = Cards()
 
-        self.assertEqual(c.FULLDECK, ['2 of spades', '2 of clubs', '2 of diamonds', '2 of hearts',
+        self.assertEqual([Card.name(code) for code in c.FULLDECK], ['2 of spades', '2 of clubs', '2 of diamonds', '2 of hearts',
                                       '3 of spades', '3 of clubs', '3 of diamonds', '3 of hearts',
                                       '4 of spades', '4 of clubs', '4 of diamonds', '4 of hearts',
                                       '5 of spades', '5 of clubs', '5 of diamonds', '5 of hearts',
@@ -22,7 +29,7 @@ class TestCards(TestCase):
                                       'Q of spades', 'Q of clubs', 'Q of diamonds', 'Q of hearts',
                                       'K of spades', 'K of clubs', 'K of diamonds', 'K of hearts',
                                       'A of spades', 'A of clubs', 'A of diamonds', 'A of hearts'] * c.getNumDecks())
-        self.assertEqual(c.FULLDECK, c.currDeck)
+        self.assertEqual(list(c.FULLDECK), c.currDeck)
         self.assertEqual(c.deckSize(), len(c.FULLDECK))
 
     # Tests to see if drawing a card decreases the size of the current deck by one
@@ -31,7 +38,7 @@ class TestCards(TestCase):
         c = Cards()
         c.getCard()
 
-        self.assertNotEqual(c.currDeck, c.FULLDECK)
+        self.assertNotEqual(c.currDeck, list(c.FULLDECK))
         self.assertNotEqual(c.deckSize(), len(c.FULLDECK))
 
     # Tests to see if shuffle brings the deck back to 4 full decks
@@ -41,4 +48,139 @@ class TestCards(TestCase):
         c.getCard()
         c.shuffle()
 
-        self.assertEqual(c.currDeck, c.FULLDECK)
\ No newline at end of file
+        self.assertEqual(c.currDeck, list(c.FULLDECK))
+
+    # Tests that dealing the whole shoe hands out every card exactly once
+    def test_deal_whole_shoe(self):
+
+        c = Cards()
+        dealt = [c.getCard() for _ in range(c.deckSize())]
+
+        self.assertEqual(c.deckSize(), 0)
+        self.assertEqual(sorted(dealt), sorted(c.FULLDECK))
+
+        c.shuffle()
+        self.assertEqual(c.deckSize(), len(c.FULLDECK))
+
+    # Tests that a shoe running out in the middle of a round takes back its discards but not the cards on the table
+    def test_reshuffle_discards(self):
+        cards = Cards(random.Random(3), count_system=CountSystem.HILO, rules=Rules(num_decks=1))
+        for _ in range(40):
+            cards.getCard()
+        cards.startRound()
+        table = [cards.getCard() for _ in range(12)]
+        self.assertEqual(cards.deckSize(), 0)
+
+        table.append(cards.getCard())
+        self.assertEqual(cards.deckSize(), 39)
+        self.assertEqual(Counter(cards.currDeck) + Counter(table), Counter(cards.FULLDECK))
+        self.assertEqual(cards.runningCount(), sum(CountSystem.HILO.tag(Card.VALUES[code]) for code in table))
+
+        # A continuous shuffler mixes in the cards it holds back instead
+        csm = Cards(random.Random(3), rules=Rules(num_decks=1, continuous_shuffle=True))
+        csm.discard([csm.getCard() for _ in range(30)])
+        table = [csm.getCard() for _ in range(csm.deckSize() + 1)]
+        self.assertEqual((csm.deckSize(), csm.bufferedCards()), (Cards.CSMBUFFER - 1, 0))
+        self.assertEqual(Counter(csm.currDeck) + Counter(table), Counter(csm.FULLDECK))
+
+        # With no discards (no round was started since the shuffle) there's nothing to take back
+        shoe = Cards(random.Random(3), rules=Rules(num_decks=1))
+        for _ in range(52):
+            shoe.getCard()
+        with self.assertRaises(IndexError):
+            shoe.getCard()
+
+    # Tests that the value counts follow the cards left in the deck
+    def test_value_counts(self):
+
+        c = Cards()
+        self.assertEqual(c.valueCounts(), [4 * c.getNumDecks()] * 9 + [16 * c.getNumDecks()])
+
+        card = c.getCard()
+        counts = c.valueCounts()
+        self.assertEqual(sum(counts), c.deckSize())
+        value = Scoring().cardValue(card)
+        full_count = 16 * c.getNumDecks() if value == 10 else 4 * c.getNumDecks()
+        self.assertEqual(counts[value-1], full_count - 1)
+
+    # Tests that every shoe shares the same frozen full deck but deals from its own shoe
+    def test_shared_template(self):
+        c1 = Cards()
+        c2 = Cards()
+
+        self.assertIs(c1.FULLDECK, c2.FULLDECK)
+        self.assertIs(c1.FULLDECK, Cards.FULLDECK)
+        self.assertIsInstance(c1.FULLDECK, tuple)
+        self.assertIsNot(c1.shoe, c2.shoe)
+
+        c1.getCard()
+        self.assertEqual(c1.deckSize(), len(c1.FULLDECK) - 1)
+        self.assertEqual(c2.deckSize(), len(c2.FULLDECK))
+        self.assertEqual(len(Cards.FULLDECK), 52 * Cards.NUMDECKS)
+
+    # Tests that a continuous shuffler holds discards back in its buffer and then puts them back in the shoe
+    def test_continuous_shuffle(self):
+        cards = Cards(random.Random(1), count_system=CountSystem.HILO)
+        cards.setContinuous(3)
+        self.assertTrue(cards.isContinuous())
+        shoe = cards.shoe
+
+        dealt = [cards.getCard() for _ in range(5)]
+        self.assertEqual(cards.deckSize(), len(cards.FULLDECK) - 5)
+        with self.assertRaises(ValueError):
+            cards.discard(dealt + dealt[:1])
+        cards.discard(dealt)
+        self.assertEqual(cards.bufferedCards(), 3)
+        self.assertEqual(cards.deckSize(), len(cards.FULLDECK) - 3)
+        self.assertIs(cards.shoe, shoe)
+
+        # The same cards can't come back twice
+        with self.assertRaises(ValueError):
+            cards.discard(dealt[:1])
+
+        # The shoe holds every card that isn't in the buffer, and the running count is of the buffered cards
+        self.assertEqual(Counter(cards.currDeck) + Counter(dealt[2:]), Counter(cards.FULLDECK))
+        self.assertEqual(cards.runningCount(), sum(CountSystem.HILO.tag(Scoring().cardValue(card)) for card in dealt[2:]))
+
+        cards.shuffle()
+        self.assertEqual((cards.deckSize(), cards.bufferedCards(), cards.runningCount()), (len(cards.FULLDECK), 0, 0))
+        cards.setContinuous(None)
+        self.assertFalse(cards.isContinuous())
+        cards.discard(dealt)
+        self.assertEqual(cards.deckSize(), len(cards.FULLDECK))
+
+    # Tests that cards put back into an earlier state deal the same cards again, shoe or continuous shuffler
+    def test_state(self):
+        for buffer_size in (None, 4):
+            cards = Cards(random.Random(6), count_system=CountSystem.HILO)
+            cards.setContinuous(buffer_size)
+            cards.discard([cards.getCard() for _ in range(10)])
+            state = cards.getState()
+            count = cards.runningCount()
+            dealt = [cards.getCard() for _ in range(30)]
+            cards.discard(dealt)
+
+            other = Cards(random.Random(), count_system=CountSystem.HILO)
+            other.setContinuous(buffer_size)
+            for branch in (cards, other):
+                branch.setState(state)
+                self.assertEqual(branch.runningCount(), count)
+                self.assertEqual([branch.getCard() for _ in range(30)], dealt)
+
+    # Tests that a table playing with a continuous shuffler never runs its shoe down
+    def test_continuous_table(self):
+        rules = Rules(continuous_shuffle=True, csm_buffer=30)
+        sim = Simulation(num_players=3, seed=4, rules=rules)
+        cards = sim.getGame().CARDS
+        self.assertTrue(cards.isContinuous())
+        self.assertFalse(Cards(rules=Rules()).isContinuous())
+
+        shuffle = cards.shuffle
+        shuffles = []
+        cards.shuffle = lambda: shuffles.append(shuffle())
+        for _ in range(2000):
+            sim.playRound()
+            self.assertEqual(cards.deckSize() + cards.bufferedCards(), len(cards.FULLDECK))
+            self.assertLessEqual(cards.bufferedCards(), 30)
+        self.assertEqual(cards.bufferedCards(), 30)
+        self.assertEqual(shuffles, [])
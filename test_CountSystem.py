@@ -0,0 +1,34 @@
+from unittest import TestCase
+from Cards import Cards
+from CountSystem import CountSystem
+from Scoring import Scoring
+
+
+class TestCountSystem(TestCase):
+
+    # Tests that balanced systems end a shoe at 0 and KO ends at its key count
+    def test_whole_shoe(self):
+        for system, final_count in [(CountSystem.HILO, 0), (CountSystem.OMEGAII, 0), (CountSystem.KO, 4)]:
+            c = Cards(count_system=system)
+            self.assertEqual(c.runningCount(), system.initialCount(c.getNumDecks()))
+
+            for _ in range(c.deckSize()):
+                c.getCard()
+            self.assertEqual(c.runningCount(), final_count)
+
+            c.shuffle()
+            self.assertEqual(c.runningCount(), system.initialCount(c.getNumDecks()))
+
+    # Tests the running and true count against recounting the dealt cards
+    def test_running_and_true_count(self):
+        s = Scoring()
+        c = Cards(count_system=CountSystem.HILO)
+        dealt = [c.getCard() for _ in range(52)]
+
+        self.assertEqual(c.runningCount(), sum(CountSystem.HILO.tag(s.cardValue(card)) for card in dealt))
+        self.assertEqual(c.decksRemaining(), c.getNumDecks() - 1)
+        self.assertAlmostEqual(c.trueCount(), c.runningCount() / (c.getNumDecks() - 1))
+
+        # Switching systems mid-shoe catches the count up with the cards already dealt
+        c.setCountSystem(CountSystem.OMEGAII)
+        self.assertEqual(c.runningCount(), sum(CountSystem.OMEGAII.tag(s.cardValue(card)) for card in dealt))
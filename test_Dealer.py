@@ -1,8 +1,19 @@
 from unittest import TestCase
+from Card import Card
 from Dealer import Dealer
 from Scoring import Scoring
 
 
+# Returns the code of a card with the given rank (its suit doesn't matter)
+def card(rank: str) -> int:
+    return Card.code(f'{rank} of spades')
+
+
+# Returns the codes of cards with the given ranks
+def hand(*ranks) -> [int]:
+    return [card(rank) for rank in ranks]
+
+
 class TestDealer(TestCase):
 
     # Tests some of the inital conditions of a dealer before the game starts
@@ -19,19 +30,47 @@ class TestDealer(TestCase):
         s = Scoring()
 
         d1 = Dealer()
-        d1.addCard('4')
-        d1.setTotalScore(s.totalScore(['4']))
+        d1.addCard(card('4'))
+        d1.setTotalScore(s.totalScore(hand('4')))
 
-        self.assertEqual(d1.getHand(), ['4'])
+        self.assertEqual(d1.getHand(), hand('4'))
         self.assertEqual(d1.handSize(), 1)
         self.assertEqual(d1.getTotalScore(), 4)
 
         d2 = Dealer()
-        d2.addCard('3')
-        d2.addCard('J')
-        d2.addCard('7')
-        d1.setTotalScore(s.totalScore(['3', 'J', '7']))
+        d2.addCard(card('3'))
+        d2.addCard(card('J'))
+        d2.addCard(card('7'))
+        d1.setTotalScore(s.totalScore(hand('3', 'J', '7')))
 
-        self.assertEqual(d2.getHand(), ['3', 'J', '7'])
+        self.assertEqual(d2.getHand(), hand('3', 'J', '7'))
         self.assertEqual(d2.handSize(), 3)
-        self.assertEqual(d1.getTotalScore(), 20)
\ No newline at end of file
+        self.assertEqual(d1.getTotalScore(), 20)
+
+    # Tests that the dealer's score is kept up to date as cards are added
+    def test_running_score(self):
+        d = Dealer()
+        d.addCard(Card.code('A of spades'))
+        d.addCard(Card.code('6 of hearts'))
+
+        self.assertEqual(d.getTotalScore(), 17)
+        self.assertTrue(d.isSoft())
+
+        d.addCard(Card.code('10 of clubs'))
+        self.assertEqual(d.getTotalScore(), 17)
+        self.assertFalse(d.isSoft())
+
+        d.resetDealer()
+        self.assertEqual(d.getTotalScore(), 0)
+
+    # Tests that the dealer resets in place
+    def test_reset_in_place(self):
+        d = Dealer()
+        hand = d.getHand()
+        d.addCard(Card.code('K of spades'))
+        d.resetDealer()
+
+        self.assertIs(d.getHand(), hand)
+        self.assertEqual(d.handSize(), 0)
+        with self.assertRaises(AttributeError):
+            d.nickname = 'House'
@@ -0,0 +1,44 @@
+from unittest import TestCase
+from DealerOdds import DealerOdds
+from Cards import Cards
+
+
+class TestDealerOdds(TestCase):
+
+    # Tests shoes where the dealer's hand is certain
+    def test_certain_hands(self):
+        d = DealerOdds()
+        only_tens = [0] * 9 + [10]
+
+        self.assertEqual(d.finalTotals(only_tens, 10)[20], 1.0)
+        self.assertEqual(d.finalTotals(only_tens, 1)['blackjack'], 1.0)
+        self.assertEqual(d.finalTotals(only_tens, 6)['bust'], 1.0)
+
+    # Tests that a dealer who hits soft 17 keeps hitting an ace and a 6 (H17) and stands on it otherwise (S17)
+    def test_soft_17(self):
+        only_sixes = [0] * 5 + [10] + [0] * 4
+        self.assertEqual(DealerOdds().finalTotals(only_sixes, 1)[17], 1.0)
+        self.assertEqual(DealerOdds(dealer_hits_soft_17=True).finalTotals(only_sixes, 1)[19], 1.0)
+
+    # Tests a small shoe by hand: upcard 6 with a 10, a 5 and a 2 left
+    def test_small_shoe(self):
+        d = DealerOdds()
+        counts = [0, 1, 0, 0, 1, 0, 0, 0, 0, 1]
+        totals = d.finalTotals(counts, 6)
+
+        # Hole 10 (16) then 5 => 21 or 2 => 18. Hole 5 (11) then 10 => 21 or 2 (13) then 10 => bust.
+        # Hole 2 (8) then 10 (18) or 5 (13) then 10 => bust.
+        self.assertAlmostEqual(totals[21], 1/6 + 1/6)
+        self.assertAlmostEqual(totals[18], 1/6 + 1/6)
+        self.assertAlmostEqual(totals['bust'], 1/6 + 1/6)
+
+    # Tests a full shoe against the well known bust rate for a 6 upcard
+    def test_full_shoe(self):
+        counts = Cards().valueCounts()
+        counts[5] -= 1
+        totals = DealerOdds().finalTotals(counts, 6)
+
+        self.assertAlmostEqual(sum(totals.values()), 1.0)
+        self.assertGreater(totals['bust'], 0.41)
+        self.assertLess(totals['bust'], 0.43)
+        self.assertEqual(totals['blackjack'], 0.0)
@@ -0,0 +1,103 @@
+from unittest import TestCase
+from Card import Card
+from Dealer import Dealer
+from EVCalculator import EVCalculator
+from Game import Game
+from Player import Player
+from Rules import Rules
+
+
+class TestEVCalculator(TestCase):
+
+    # Tests a shoe of only tens, where every outcome is certain. Split tens make up to 4 hands, but only
+    # a ten of the same rank (one in TENRANKS) splits again.
+    def test_only_tens(self):
+        e = EVCalculator()
+        counts = [0] * 9 + [20]
+
+        evs = e.analyze([10, 6], 10, counts)
+        self.assertEqual(evs['stand'], -1.0)
+        self.assertEqual(evs['hit'], -1.0)
+        self.assertEqual(evs['double'], -2.0)
+        self.assertIsNone(evs['split'])
+
+        evs = e.analyze([10, 10], 6, counts)
+        self.assertEqual(evs['stand'], 1.0)
+        one_resplit = 1 + 1 / EVCalculator.TENRANKS
+        self.assertEqual(evs['split'], 1 + (one_resplit + 1) / EVCalculator.TENRANKS + 1 - 1 / EVCalculator.TENRANKS)
+        self.assertIsNone(e.analyze([10, 10], 6, counts, same_rank=False)['split'])
+
+        self.assertEqual(e.analyze([1, 1], 6, counts)['split'], 2 * e.payout)
+
+    # Tests that standing on 18 against an ace in a shoe of sixes beats a dealer who stands on soft 17 and loses to one who hits it
+    def test_soft_17(self):
+        only_sixes = [0] * 5 + [20] + [0] * 4
+        self.assertEqual(EVCalculator().analyze([10, 8], 1, only_sixes)['stand'], 1.0)
+        self.assertEqual(EVCalculator(dealer_hits_soft_17=True).analyze([10, 8], 1, only_sixes)['stand'], -1.0)
+        self.assertEqual(EVCalculator(rules=Rules(dealer_hits_soft_17=True)).analyze([10, 8], 1, only_sixes)['stand'], -1.0)
+
+    # Tests that the payout and the number of hands a pair may be split into come from the Rules
+    def test_rules(self):
+        only_tens = [0] * 9 + [20]
+        self.assertEqual(EVCalculator(rules=Rules(payout_str='6:5')).analyze([1, 1], 6, only_tens)['split'], 2 * 1.2)
+        self.assertEqual(EVCalculator(rules=Rules(max_hands=2)).analyze([10, 10], 6, only_tens)['split'], 2.0)
+        self.assertIsNone(EVCalculator(rules=Rules(max_hands=1)).analyze([10, 10], 6, only_tens)['split'])
+
+    # Tests that a hand only doubles down on the totals the Rules allow, and after a split only if they allow that
+    def test_restricted_doubling(self):
+        full_shoe = [16] * 9 + [64]
+        ten_eleven = EVCalculator(rules=Rules(double_totals=(10, 11)))
+        self.assertIsNone(ten_eleven.analyze([5, 4], 6, full_shoe)['double'])
+        self.assertIsNone(ten_eleven.analyze([1, 6], 6, full_shoe)['double'])
+        self.assertIsNotNone(ten_eleven.analyze([5, 6], 6, full_shoe)['double'])
+
+        no_das = EVCalculator(rules=Rules(double_after_split=False))
+        self.assertIsNotNone(no_das.analyze([5, 6], 6, full_shoe)['double'])
+        self.assertIsNone(no_das.analyze([5, 6], 6, full_shoe, num_hands=2)['double'])
+        self.assertLess(no_das.analyze([8, 8], 6, full_shoe)['split'], EVCalculator().analyze([8, 8], 6, full_shoe)['split'])
+        self.assertLess(ten_eleven.analyze([4, 4], 6, full_shoe)['split'], EVCalculator().analyze([4, 4], 6, full_shoe)['split'])
+
+    # Tests a few well known plays from a full shoe
+    def test_full_shoe(self):
+        e = EVCalculator()
+
+        def shoe(*cards):
+            counts = [16] * 9 + [64]
+            for card in cards:
+                counts[card-1] -= 1
+            return counts
+
+        self.assertEqual(e.bestPlay([5, 6], 6, shoe(5, 6, 6))[0], 'double')
+        self.assertEqual(e.bestPlay([10, 6], 6, shoe(10, 6, 6))[0], 'stand')
+        self.assertEqual(e.bestPlay([8, 8], 6, shoe(8, 8, 6))[0], 'split')
+        self.assertEqual(e.bestPlay([10, 2, 2], 10, shoe(10, 2, 2, 10))[0], 'hit')
+
+    # Tests that a hand of 21 can only stand
+    def test_twenty_one(self):
+        evs = EVCalculator().analyze([10, 5, 6], 10, [16] * 9 + [60])
+
+        self.assertIsNone(evs['hit'])
+        self.assertIsNone(evs['double'])
+
+    # Tests that a hand in a game is only offered a split that Game would allow: a pair of the same rank
+    def test_from_game(self):
+        game = Game(headless=True, dealer=Dealer())
+        player = Player('Player 1')
+        game.addPlayer(player)
+        game.DEALER.addCard(Card.code('6 of hearts'))
+        game.DEALER.addCard(Card.code('9 of hearts'))
+        e = EVCalculator()
+
+        for second, splits in (('10 of clubs', True), ('K of clubs', False)):
+            player.resetPlayer()
+            player.addCard(Card.code('10 of spades'), 1)
+            player.addCard(Card.code(second), 1)
+            self.assertEqual(e.fromGame(game, player)['split'] is not None, splits)
+            self.assertEqual(game._canSplit(player, 1), splits)
+
+        # A game played with other rules needs a calculator made with them
+        six_five = Game(headless=True, dealer=game.DEALER, rules=Rules(payout_str='6:5', max_hands=2))
+        six_five.addPlayer(player)
+        with self.assertRaises(ValueError):
+            e.fromGame(six_five, player)
+        self.assertIsNotNone(EVCalculator(rules=six_five.getRules()).fromGame(six_five, player)['stand'])
@@ -1,3 +1,4 @@
+import tracemalloc
 from unittest import TestCase
 from Game import Game
 from Player import Player
@@ -22,4 +23,21 @@ class TestGame(TestCase):
         self.assertEqual(g.getNumPlayers(), 2)
 
         g.removePlayer(p1)
-        self.assertEqual(g.getNumPlayers(), 1)
\ No newline at end of file
+        self.assertEqual(g.getNumPlayers(), 1)
+
+    # Tests that every game gets its own shoe and dealer, and that games stay small
+    def test_own_shoe_and_dealer(self):
+        g1 = Game(headless=True)
+        g2 = Game(headless=True)
+        self.assertIsNot(g1.CARDS, g2.CARDS)
+        self.assertIsNot(g1.DEALER, g2.DEALER)
+
+        g1.CARDS.getCard()
+        self.assertEqual(g2.CARDS.deckSize(), len(g2.CARDS.FULLDECK))
+
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        games = [Game(headless=True) for _ in range(1000)]
+        per_game = (tracemalloc.get_traced_memory()[0] - before) / len(games)
+        tracemalloc.stop()
+        self.assertLess(per_game, 4096)
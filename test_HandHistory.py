@@ -0,0 +1,141 @@
+import os
+import tempfile
+from unittest import TestCase
+from Card import Card
+from HandHistory import HandHistory
+from HandHistoryReader import HandHistoryReader
+from HandHistoryWriter import HandHistoryWriter
+from Rules import Rules
+from Simulation import Simulation
+from Strategy import Strategy
+from StrategyPolicy import StrategyPolicy
+
+
+class TestHandHistory(TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.bjhh')
+        os.close(fd)
+        os.remove(self.path)
+
+        # Doubles on 9-11, splits every pair but tens and takes insurance, so every kind of action gets recorded
+        strategy = Strategy(insurance=True)
+        for upcard in range(1, 11):
+            for total in (9, 10, 11):
+                strategy.hard[total][upcard] = Strategy.DOUBLE
+            for card in range(1, 10):
+                strategy.pairs[card][upcard] = True
+        self.policy = StrategyPolicy(strategy)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    # Records rounds of a simulation and returns each round's (player name, winning) pairs and the cards dealt
+    def _record(self, rounds: int, chunk_rounds: int, num_players: int = 3, rules: Rules = None,
+                writer_class=HandHistoryWriter) -> ([[(str, int)]], [str]):
+        sim = Simulation(policy=self.policy, num_players=num_players, seed=5, rules=rules)
+        game = sim.getGame()
+        dealt = []
+        get_card = game.CARDS.getCard
+
+        def getCard() -> str:
+            dealt.append(get_card())
+            return dealt[-1]
+        game.CARDS.getCard = getCard
+
+        played = []
+        with writer_class(self.path, chunk_rounds) as writer:
+            game.setHistory(writer)
+            for _ in range(rounds):
+                played.append([(player.getName(), winning) for player, winning in sim.playRound()])
+            game.setHistory(None)
+        return played, dealt
+
+    # Tests that every round is read back with its seats, cards, actions and winnings
+    def test_round_trip(self):
+        played, dealt = self._record(500, 64)
+        reader = HandHistoryReader(self.path)
+        rounds = list(reader.rounds())
+
+        self.assertEqual(reader.skipped_chunks, 0)
+        self.assertEqual(len(rounds), 500)
+        self.assertEqual([card for record in rounds for card in record['cards']], dealt)
+        for record, winnings in zip(rounds, played):
+            names = [name for name, _, _ in record['seats']]
+            self.assertEqual([(names[seat], winning) for seat, _, winning in record['winnings']], winnings)
+            for name, wager, insurance in record['seats']:
+                self.assertGreaterEqual(wager, 20)
+                self.assertLessEqual(insurance, wager // 2)
+
+        totals = reader.aggregate()
+        self.assertEqual(totals['rounds'], 500)
+        self.assertEqual(totals['hands'], sum(len(winnings) for winnings in played))
+        self.assertEqual(sum(totals['cards']), len(dealt))
+        ace = Card.code('A of spades')
+        self.assertEqual(totals['cards'][ace], dealt.count(ace))
+        for name in ('Player 1', 'Player 2', 'Player 3'):
+            self.assertEqual(totals['net'][name], sum(winning for winnings in played for player, winning in winnings if player == name))
+        for action in HandHistory.ACTIONNAMES:
+            self.assertGreater(totals['actions'][action], 0, action)
+        self.assertGreater(totals['insurance'], 0)
+
+    # Tests that writing again appends to the same file
+    def test_append(self):
+        self._record(10, 4)
+        self._record(10, 4)
+        self.assertEqual(HandHistoryReader(self.path).aggregate()['rounds'], 20)
+
+    # Tests that rounds with more than 255 seats are read back with every seat and hand
+    def test_many_seats(self):
+        played, dealt = self._record(2, 1, num_players=300, rules=Rules(num_decks=40))
+        reader = HandHistoryReader(self.path)
+        rounds = list(reader.rounds())
+
+        self.assertEqual(reader.skipped_chunks, 0)
+        self.assertEqual([card for record in rounds for card in record['cards']], dealt)
+        for record, winnings in zip(rounds, played):
+            self.assertEqual(len(record['seats']), 300)
+            names = [name for name, _, _ in record['seats']]
+            self.assertEqual([(names[seat], winning) for seat, _, winning in record['winnings']], winnings)
+        self.assertEqual(reader.aggregate()['hands'], sum(len(winnings) for winnings in played))
+
+    # Tests that version 1 files are still read but can't be appended to
+    def test_version_1(self):
+        class V1Writer(HandHistoryWriter):
+            VERSION = 1
+            COLUMNS = HandHistory.V1COLUMNS
+
+        played, dealt = self._record(20, 8, writer_class=V1Writer)
+        rounds = list(HandHistoryReader(self.path).rounds())
+        self.assertEqual([card for record in rounds for card in record['cards']], dealt)
+        for record, winnings in zip(rounds, played):
+            names = [name for name, _, _ in record['seats']]
+            self.assertEqual([(names[seat], winning) for seat, _, winning in record['winnings']], winnings)
+        with self.assertRaises(ValueError):
+            HandHistoryWriter(self.path)
+
+    # Tests that a damaged chunk and a cut-off tail are skipped while the other chunks are still read
+    def test_damaged_chunks(self):
+        self._record(100, 10)
+        with open(self.path, 'rb') as f:
+            data = bytearray(f.read())
+
+        # Flip a byte inside the second chunk's payload and cut the last chunk in half
+        second = data.find(HandHistory.CHUNKMAGIC, HandHistory.FILEHEADER.size + 1)
+        data[second + HandHistory.CHUNKHEADER.size + 5] ^= 0xFF
+        last = data.rfind(HandHistory.CHUNKMAGIC)
+        del data[last + (len(data) - last) // 2:]
+        with open(self.path, 'wb') as f:
+            f.write(data)
+
+        reader = HandHistoryReader(self.path)
+        self.assertEqual(reader.aggregate()['rounds'], 80)
+        self.assertEqual(reader.skipped_chunks, 2)
+
+    # Tests that files from a newer version of the format are refused
+    def test_version(self):
+        with open(self.path, 'wb') as f:
+            f.write(HandHistory.FILEHEADER.pack(HandHistory.MAGIC, HandHistory.VERSION + 1))
+        with self.assertRaises(ValueError):
+            list(HandHistoryReader(self.path).chunks())
@@ -0,0 +1,65 @@
+from unittest import TestCase
+from Instrumentation import Instrumentation
+from Rules import Rules
+from Simulation import Simulation
+from Strategy import Strategy
+from StrategyPolicy import StrategyPolicy
+
+
+class TestInstrumentation(TestCase):
+
+    # Tests the counters and phase calls over a few hundred rounds
+    def test_counters(self):
+        strategy = Strategy()
+        for upcard in range(1, 11):
+            strategy.hard[11][upcard] = Strategy.DOUBLE
+            strategy.pairs[8][upcard] = True
+
+        sim = Simulation(policy=StrategyPolicy(strategy), num_players=2, seed=1)
+        game = sim.getGame()
+        shuffles = []
+        shuffle = game.CARDS.shuffle
+        game.CARDS.shuffle = lambda: shuffles.append(shuffle())
+        instrumentation = Instrumentation()
+        game.setInstrumentation(instrumentation)
+        sim.run(300)
+        snapshot = instrumentation.snapshot()
+
+        self.assertEqual(snapshot['rounds'], 300)
+        for phase in Instrumentation.PHASES:
+            self.assertEqual(snapshot['phases'][phase]['calls'], 300)
+            self.assertGreaterEqual(snapshot['phases'][phase]['seconds'], 0)
+        self.assertGreater(snapshot['reshuffles'], 0)
+        self.assertEqual(snapshot['reshuffles'], len(shuffles))
+        self.assertGreater(snapshot['splits'], 0)
+        self.assertGreater(snapshot['doubles'], 0)
+        self.assertGreater(snapshot['cards_drawn'], 300 * 6)
+
+    # Tests that a continuous shuffler taking back each round's cards isn't counted as a reshuffle
+    def test_continuous_shuffle(self):
+        sim = Simulation(num_players=3, seed=5, rules=Rules(continuous_shuffle=True))
+        cards = sim.getGame().CARDS
+        shuffles = []
+        shuffle = cards.shuffle
+        cards.shuffle = lambda: shuffles.append(shuffle())
+        instrumentation = Instrumentation()
+        sim.getGame().setInstrumentation(instrumentation)
+        sim.run(50)
+        self.assertEqual(instrumentation.snapshot()['reshuffles'], 0)
+        self.assertEqual(shuffles, [])
+
+    # Tests periodic dumps and that turning instrumentation off puts back the original methods
+    def test_dump_and_detach(self):
+        dumps = []
+        sim = Simulation(seed=2)
+        game = sim.getGame()
+        game.setInstrumentation(Instrumentation(dump_every=10, dump=dumps.append))
+        sim.run(25)
+
+        self.assertEqual([dump['rounds'] for dump in dumps], [10, 20])
+
+        game.setInstrumentation(None)
+        self.assertNotIn('newRound', vars(game))
+        self.assertNotIn('shuffle', vars(game.CARDS))
+        sim.run(5)
+        self.assertEqual(len(dumps), 2)
@@ -1,7 +1,18 @@
 from unittest import TestCase
+from Card import Card
 from Player import Player
 
 
+# Returns the code of a card with the given rank (its suit doesn't matter)
+def card(rank: str) -> int:
+    return Card.code(f'{rank} of spades')
+
+
+# Returns the codes of cards with the given ranks
+def hand(*ranks) -> [int]:
+    return [card(rank) for rank in ranks]
+
+
 class TestPlayer(TestCase):
 
     # Tests that the simple methods return their correct information
@@ -21,30 +32,82 @@ class TestPlayer(TestCase):
     def test_add_methods(self):
         p1 = Player('Preston')
         p1.addMoney(45)
-        p1.addCard('4')
+        p1.addCard(card('4'))
 
         self.assertEqual(p1.getMoney(), p1.STARTINGFUNDS + 45)
-        self.assertEqual(p1.getHand(), ['4'])
+        self.assertEqual(p1.getHand(), hand('4'))
         self.assertEqual(p1.handSize(), 1)
 
         p2 = Player('Nicholas')
         p2.addMoney(45)
         p2.addMoney(-45)
-        p2.addCard('4')
-        p2.addCard('J')
-        p2.addCard('A')
+        p2.addCard(card('4'))
+        p2.addCard(card('J'))
+        p2.addCard(card('A'))
 
         self.assertEqual(p2.getMoney(), p2.STARTINGFUNDS)
-        self.assertEqual(p2.getHand(), ['4', 'J', 'A'])
+        self.assertEqual(p2.getHand(), hand('4', 'J', 'A'))
         self.assertEqual(p2.handSize(), 3)
 
     # Tests split method
     def test_split(self):
         p = Player('Preston')
-        p.addCard('8')
-        p.addCard('8')
+        p.addCard(card('8'))
+        p.addCard(card('8'))
         p.split()
 
-        self.assertEqual(p.getHand(), ['8'])
-        self.assertEqual(p.getHand(1), ['8'])
-        self.assertEqual(p.getHand(2), ['8'])
\ No newline at end of file
+        self.assertEqual(p.getHand(), hand('8'))
+        self.assertEqual(p.getHand(1), hand('8'))
+        self.assertEqual(p.getHand(2), hand('8'))
+
+    # Tests that the score is kept up to date as cards are added and after splitting
+    def test_running_score(self):
+        p = Player('Preston')
+        p.addCard(card('A'))
+        p.addCard(card('6'))
+
+        self.assertEqual(p.getTotalScore(), 17)
+        self.assertTrue(p.isSoft())
+
+        p.addCard(card('9'))
+        self.assertEqual(p.getTotalScore(), 16)
+        self.assertFalse(p.isSoft())
+
+        p2 = Player('Nicholas')
+        p2.addCard(card('A'))
+        p2.addCard(card('A'))
+        p2.split()
+        p2.addCard(card('K'), 2)
+
+        self.assertEqual(p2.getTotalScore(1), 11)
+        self.assertEqual(p2.getTotalScore(2), 21)
+
+        p2.resetPlayer()
+        self.assertEqual(p2.getTotalScore(), 0)
+
+    # Tests that a player resets in place and can't split into more than MAXHANDS hands
+    def test_reset_in_place(self):
+        p = Player('Preston')
+        hands = [p.getHand(hand_num) for hand_num in range(1, Player.MAXHANDS+1)]
+        with self.assertRaises(AttributeError):
+            p.nickname = 'P'
+
+        for _ in range(2):
+            p.setWager(20)
+            p.addCard(card('8'))
+            p.addCard(card('8'))
+            for _ in range(Player.MAXHANDS-1):
+                p.split()
+                p.addCard(card('8'))
+            with self.assertRaises(ValueError):
+                p.split()
+            p.doubleDown(4)
+            self.assertEqual(p.getNumHands(), Player.MAXHANDS)
+            self.assertEqual(p.totalWager(), 100)
+
+            p.resetPlayer()
+            self.assertEqual(p.getNumHands(), 1)
+            self.assertEqual(p.totalWager(), 0)
+            self.assertFalse(p.hasDoubledDown(4))
+            self.assertEqual([p.getHand(hand_num) for hand_num in range(1, Player.MAXHANDS+1)], [[]] * Player.MAXHANDS)
+            self.assertTrue(all(p.getHand(hand_num) is hands[hand_num-1] for hand_num in range(1, Player.MAXHANDS+1)))
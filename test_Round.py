@@ -0,0 +1,121 @@
+import random
+from unittest import TestCase
+from Cards import Cards
+from Dealer import Dealer
+from Game import Game
+from Player import Player
+from Round import Round
+from Rules import Rules
+from Strategy import Strategy
+from StrategyPolicy import StrategyPolicy
+
+
+# Returns a policy that doubles on 9-11, splits every pair and takes insurance, so every decision comes up
+def busyPolicy() -> StrategyPolicy:
+    strategy = Strategy()
+    strategy.insurance = True
+    for upcard in range(1, 11):
+        for total in (9, 10, 11):
+            strategy.hard[total][upcard] = Strategy.DOUBLE
+        for card in range(1, 11):
+            strategy.pairs[card][upcard] = True
+    return StrategyPolicy(strategy)
+
+
+# Returns the policy's answer to a round's pending decision
+def answer(policy, game: Game, pending) -> object:
+    decision, player, hand_num = pending
+    if decision == Round.WAGER:
+        return policy.wager(player, game)
+    if decision == Round.INSURE:
+        return policy.insurance(player, game)
+    if decision == Round.DOUBLE:
+        return policy.doubleDown(player, hand_num, game)
+    if decision == Round.SPLIT:
+        return policy.split(player, hand_num, game)
+    return policy.hit(player, hand_num, game)
+
+
+class TestRound(TestCase):
+
+    def _game(self, seed: int, messages: list, policy, rules: Rules = None) -> Game:
+        game = Game(headless=True, output=messages.append, cards=Cards(random.Random(seed), rules=rules), dealer=Dealer(),
+                    rules=rules)
+        for i in range(3):
+            game.addPlayer(Player(f'Player {i}', policy))
+        return game
+
+    # Plays the same rounds with Game.newRound and by stepping through a Round, checks that they deal, settle
+    # and print exactly the same, and returns the decisions that came up
+    def _playBoth(self, rules: Rules = None) -> set:
+        policy = busyPolicy()
+        decisions = set()
+        game_messages, round_messages = [], []
+        game = self._game(7, game_messages, policy, rules)
+        stepped = self._game(7, round_messages, policy, rules)
+
+        for _ in range(300):
+            game.newRound()
+
+            game_round = Round(stepped)
+            pending = game_round.start()
+            while pending is not None:
+                decisions.add(pending[0])
+                self.assertEqual(game_round.getPending(), pending)
+                pending = game_round.step(answer(policy, stepped, pending))
+            self.assertTrue(game_round.isOver())
+            self.assertTrue(stepped.isRoundOver())
+
+            self.assertEqual([winning for _, winning in game.getLastWinnings()],
+                             [winning for _, winning in stepped.getLastWinnings()])
+        self.assertEqual(game_messages, round_messages)
+        self.assertEqual([player.getMoney() for player in game.players], [player.getMoney() for player in stepped.players])
+        return decisions
+
+    # Tests that stepping through rounds deals, settles and prints exactly what Game.newRound does
+    def test_matches_game(self):
+        self.assertEqual(self._playBoth(), {Round.WAGER, Round.INSURE, Round.DOUBLE, Round.SPLIT, Round.HIT})
+
+    # Tests that a round follows other rules exactly like Game does
+    def test_matches_game_with_rules(self):
+        rules = Rules(num_decks=2, dealer_hits_soft_17=True, payout_str='6:5', max_hands=2, double_totals=(10, 11),
+                      double_after_split=False)
+        self.assertEqual(self._playBoth(rules), {Round.WAGER, Round.INSURE, Round.DOUBLE, Round.SPLIT, Round.HIT})
+
+    # Tests the states a round goes through and that it only steps when waiting for a decision
+    def test_states(self):
+        game = self._game(1, [], None)
+        game_round = Round(game)
+        self.assertIsNone(game_round.getState())
+        with self.assertRaises(ValueError):
+            game_round.step(20)
+
+        decision, player, hand_num = game_round.start()
+        self.assertEqual(game_round.getState(), Round.BETTING)
+        self.assertEqual((decision, player, hand_num), (Round.WAGER, game.players[0], 1))
+        self.assertFalse(game.isRoundOver())
+        with self.assertRaises(ValueError):
+            game_round.start()
+
+        # An amount that isn't a number raises and leaves the same decision pending
+        with self.assertRaises(ValueError):
+            game_round.step('lots')
+        self.assertEqual(game_round.getPending(), (Round.WAGER, game.players[0], 1))
+
+        # Wagers are kept within the min/max bet
+        game_round.step(10000)
+        self.assertEqual(game.players[0].getWager(), Game.MAXBET)
+        game_round.step(1)
+        game_round.step(50)
+        self.assertNotEqual(game_round.getState(), Round.BETTING)
+
+        pending = game_round.getPending()
+        while pending is not None:
+            pending = game_round.step(False)
+        self.assertEqual(game_round.getState(), Round.OVER)
+        self.assertEqual(len(game.getLastWinnings()), 3)
+
+    # Tests that a round can't drive a game that would block on input()
+    def test_interactive_game(self):
+        with self.assertRaises(ValueError):
+            Round(Game())
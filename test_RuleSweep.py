@@ -0,0 +1,45 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from Rules import Rules
+from RuleSweep import RuleSweep
+from Simulation import Simulation
+
+
+class TestRuleSweep(TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    # Tests that every combination of the options is swept
+    def test_grid(self):
+        grid = RuleSweep.grid(num_decks=[1, 6], payout_str=['3:2', '6:5'], dealer_hits_soft_17=[False, True])
+        self.assertEqual(len(set(grid)), 8)
+        self.assertIn(Rules(num_decks=6, payout_str='6:5', dealer_hits_soft_17=True), grid)
+        self.assertEqual(RuleSweep.grid(Rules(min_bet=10), num_decks=[2])[0], Rules(min_bet=10, num_decks=2))
+
+    # Tests that every rule set is played once, and later sweeps only play the rule sets that aren't cached
+    def test_cache(self):
+        grid = RuleSweep.grid(num_decks=[1, 6], payout_str=['3:2', '6:5'])
+        sweep = RuleSweep(num_players=2, rounds=300, workers=2, seed=1, cache_dir=self.cache_dir)
+        results = sweep.run(grid)
+        self.assertEqual(sweep.getPlayed(), 4)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 4)
+        self.assertEqual(sweep.run(grid[:2]), {rules: results[rules] for rules in grid[:2]})
+        self.assertEqual(sweep.getPlayed(), 4)
+
+        # A new sweep over the same cache only plays the new point
+        again = RuleSweep(num_players=2, rounds=300, workers=2, seed=1, cache_dir=self.cache_dir)
+        extended = again.run(grid + [Rules(dealer_hits_soft_17=True)])
+        self.assertEqual(again.getPlayed(), 1)
+        self.assertEqual({rules: extended[rules] for rules in grid}, results)
+
+        # Each point matches a simulation played alone with the same rules and seed
+        rules = grid[3]
+        alone = Simulation(num_players=2, seed=f'1:{rules.digest()}', rules=rules).run(300)
+        self.assertEqual(results[rules]['net'], alone['net'])
+        self.assertEqual(results[rules]['hands'], alone['hands'])
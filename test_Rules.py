@@ -0,0 +1,114 @@
+import random
+from unittest import TestCase
+from Card import Card
+from Cards import Cards
+from Dealer import Dealer
+from Game import Game
+from Player import Player
+from Policy import Policy
+from Rules import Rules
+from Simulation import Simulation
+
+
+# Doubles down and splits whenever it's offered
+class EagerPolicy(Policy):
+
+    def doubleDown(self, player, hand_num: int, game) -> bool:
+        return True
+
+    def split(self, player, hand_num: int, game) -> bool:
+        return True
+
+
+class TestRules(TestCase):
+
+    # Tests that the default rules are the ones Game has always been played with
+    def test_defaults(self):
+        rules = Rules()
+        self.assertEqual(rules, Game.RULES)
+        self.assertEqual((Game.MINBET, Game.MAXBET, Game.BLACKJACKPAYOUTSTR, Game.BLACKJACKPAYOUT), (20, 500, '3:2', 1.5))
+        self.assertEqual(Game.WHENTOSHUFFLE, (Cards.NUMDECKS * 52) // 3)
+        self.assertEqual(rules.num_decks, Cards.NUMDECKS)
+        self.assertEqual(rules.max_hands, Player.MAXHANDS)
+
+    # Tests that rules can't be changed, only copied with changes, and that equal rules hash the same
+    def test_immutable(self):
+        rules = Rules()
+        with self.assertRaises(AttributeError):
+            rules.num_decks = 6
+
+        six_five = rules.replace(payout_str='6:5', num_decks=6)
+        self.assertEqual(rules.payout_str, '3:2')
+        self.assertEqual((six_five.payout, six_five.num_decks, six_five.when_to_shuffle), (1.2, 6, 104))
+        self.assertEqual(six_five, Rules(num_decks=6, payout_str='6:5'))
+        self.assertEqual(len({rules, six_five, Rules()}), 2)
+        self.assertEqual(six_five.digest(), Rules(num_decks=6, payout_str='6:5').digest())
+        self.assertNotEqual(rules.digest(), six_five.digest())
+
+        with self.assertRaises(TypeError):
+            rules.replace(decks=6)
+        for bad in ({'num_decks': 0}, {'payout_str': '3-2'}, {'penetration': 1}, {'min_bet': 600}, {'max_hands': 5}):
+            with self.assertRaises(ValueError):
+                Rules(**bad)
+
+        # A single deck dealt almost to the end to a full table runs out in the middle of rounds and keeps going
+        self.assertEqual(Rules(num_decks=1).when_to_shuffle, 17)
+        results = Simulation(None, 7, seed=2, rules=Rules(num_decks=1, penetration=0.99)).run(300)
+        self.assertEqual(results['rounds'], 300)
+
+    # Tests when the dealer hits and when a player may double down
+    def test_decisions(self):
+        s17 = Rules()
+        h17 = Rules(dealer_hits_soft_17=True)
+        self.assertTrue(s17.dealerHits(16, False))
+        self.assertFalse(s17.dealerHits(17, True))
+        self.assertTrue(h17.dealerHits(17, True))
+        self.assertFalse(h17.dealerHits(17, False))
+
+        restricted = Rules(double_totals=(11, 10), double_after_split=False)
+        self.assertTrue(Rules().canDoubleDown(8, True))
+        self.assertTrue(restricted.canDoubleDown(10, False))
+        self.assertFalse(restricted.canDoubleDown(9, False))
+        self.assertFalse(restricted.canDoubleDown(11, True))
+
+    # Tests that a game and its shoe are played with the given rules
+    def test_game(self):
+        rules = Rules(num_decks=2, payout_str='6:5', min_bet=10, max_bet=100, penetration=0.75)
+        game = Game(headless=True, rules=rules)
+        self.assertIs(game.getRules(), rules)
+        self.assertEqual((game.getMinBet(), game.getMaxBet(), game.getPayout()), (10, 100, 1.2))
+        self.assertEqual(game.CARDS.getNumDecks(), 2)
+        self.assertEqual(game.CARDS.deckSize(), 104)
+        self.assertEqual(game.WHENTOSHUFFLE, 26)
+        self.assertEqual(Game.MINBET, 20)
+
+        # The dealer hits a soft 17 only under H17
+        for hits_soft_17 in (False, True):
+            game = Game(headless=True, cards=Cards(random.Random(0)), dealer=Dealer(),
+                        rules=Rules(dealer_hits_soft_17=hits_soft_17))
+            game.DEALER.addCard(Card.code('A of spades'))
+            game.DEALER.addCard(Card.code('6 of hearts'))
+            game._playDealerHand()
+            self.assertEqual(game.DEALER.handSize() > 2, hits_soft_17)
+
+    # Tests that players are held to the rules' split and double down limits
+    def test_limits(self):
+        rules = Rules(max_hands=2, double_totals=(11,), double_after_split=False)
+        sim = Simulation(EagerPolicy(), num_players=3, seed=2, rules=rules)
+        game = sim.getGame()
+        hands = []
+        distribute = game.distributeWinnings
+
+        def distributeWinnings() -> None:
+            for player in game.players:
+                for hand_num in range(1, player.getNumHands()+1):
+                    hands.append((player.getNumHands(), player.hasDoubledDown(hand_num), list(player.getHand(hand_num))))
+            distribute()
+        game.distributeWinnings = distributeWinnings
+        sim.run(3000)
+
+        self.assertEqual(max(num_hands for num_hands, _, _ in hands), 2)
+        doubled = [hand for num_hands, doubled, hand in hands if doubled]
+        self.assertGreater(len(doubled), 0)
+        self.assertTrue(all(num_hands == 1 for num_hands, doubled, _ in hands if doubled))
+        self.assertTrue(all(game.SCORING.totalScore(hand[:2]) == 11 for hand in doubled))
@@ -1,7 +1,18 @@
 from unittest import TestCase
+from Card import Card
 from Scoring import Scoring
 
 
+# Returns the code of a card with the given rank (its suit doesn't matter)
+def card(rank: str) -> int:
+    return Card.code(f'{rank} of spades')
+
+
+# Returns the codes of cards with the given ranks
+def hand(*ranks) -> [int]:
+    return [card(rank) for rank in ranks]
+
+
 class TestScoring(TestCase):
 
     # Tests to see if it returns a score of 0 for an empty hand
@@ -13,25 +24,27 @@ class TestScoring(TestCase):
     def test_hands_without_ace(self):
         s = Scoring()
 
-        self.assertEqual(s.totalScore(['3']), 3)
-        self.assertEqual(s.totalScore(['J']), 10)
-        self.assertEqual(s.totalScore(['10', 'Q']), 20)
-        self.assertEqual(s.totalScore(['Q', '10']), 20)
-        self.assertEqual(s.totalScore(['4', '8', 'K']), 22)
+        self.assertEqual(s.totalScore(hand('3')), 3)
+        self.assertEqual(s.totalScore(hand('J')), 10)
+        self.assertEqual(s.totalScore(hand('10', 'Q')), 20)
+        self.assertEqual(s.totalScore(hand('Q', '10')), 20)
+        self.assertEqual(s.totalScore(hand('4', '8', 'K')), 22)
 
     # Tests a few hands with an ace in it
     def test_hands_with_ace(self):
         s = Scoring()
 
-        self.assertEqual(s.totalScore(['A']), 11)
-        self.assertEqual(s.totalScore(['4', 'A']), 15)
-        self.assertEqual(s.totalScore(['A', 'K']), 21)
-        self.assertEqual(s.totalScore(['7', '6', 'A']), 14)
-        self.assertEqual(s.totalScore(['J', '10', 'A']), 21)
-        self.assertEqual(s.totalScore(['9', 'A', '9']), 19)
-        self.assertEqual(s.totalScore(['9', 'A', '9', 'J']), 29)
-        self.assertEqual(s.totalScore(['9', 'A', 'A']), 21)
-        self.assertEqual(s.totalScore(['9', 'A', '9', 'A']), 20)
-        self.assertEqual(s.totalScore(['9', 'A', '7', 'A', '5']), 23)
-        self.assertEqual(s.totalScore(['9', 'A', '9', 'A', 'A']), 21)
-        self.assertEqual(s.totalScore(['A', 'A', 'A', 'A']), 14)
\ No newline at end of file
+        self.assertEqual(s.totalScore(hand('A')), 11)
+        self.assertEqual(s.totalScore(hand('4', 'A')), 15)
+        self.assertEqual(s.totalScore(hand('A', 'K')), 21)
+        self.assertEqual(s.totalScore(hand('7', '6', 'A')), 14)
+        self.assertEqual(s.totalScore(hand('J', '10', 'A')), 21)
+        self.assertEqual(s.totalScore(hand('9', 'A', '9')), 19)
+        self.assertEqual(s.totalScore(hand('9', 'A', '9', 'J')), 29)
+        self.assertEqual(s.totalScore(hand('9', 'A', 'A')), 21)
+        self.assertEqual(s.totalScore(hand('9', 'A', '9', 'A')), 20)
+        self.assertEqual(s.totalScore(hand('9', 'A', '7', 'A', '5')), 23)
+        self.assertEqual(s.totalScore(hand('9', 'A', '9', 'A', 'A')), 21)
+        self.assertEqual(s.totalScore(hand('A', 'A', 'A', 'A')), 14)
+        self.assertEqual(s.totalScore(hand('10', 'A', 'A')), 12)
+        self.assertEqual(s.totalScore(hand('9', 'A', 'A', 'A', 'A')), 13)
@@ -0,0 +1,56 @@
+from unittest import TestCase
+from Settlement import Settlement
+from Simulation import Simulation
+from Statistics import Statistics
+from Strategy import Strategy
+from StrategyPolicy import StrategyPolicy
+
+
+class TestSettlement(TestCase):
+
+    # Tests every rule on hand-made hands against one dealer
+    def test_rules(self):
+        settlement = Settlement(1.5)
+
+        # BlackJack, win, push, loss, bust, doubled win, and BlackJack with a bonus that gets rounded down
+        winnings, outcomes = settlement.settle(
+            [21, 20, 19, 18, 22, 20, 21], [2, 3, 2, 2, 3, 3, 2], [20, 20, 20, 20, 20, 20, 25],
+            [0, 0, 0, 0, 0, 0, 0], [False, False, False, False, False, True, False], 19, 3)
+        self.assertEqual(winnings.tolist(), [30, 20, 0, -20, -20, 40, 37])
+        self.assertEqual([Statistics.OUTCOMES[outcome] for outcome in outcomes],
+                         [Statistics.BLACKJACK, Statistics.WIN, Statistics.PUSH, Statistics.LOSS, Statistics.BUST,
+                          Statistics.WIN, Statistics.BLACKJACK])
+
+        # A dealer's BlackJack only pushes with a BlackJack, and pays insurance twice over
+        winnings, outcomes = settlement.settle([21, 21, 20], [2, 3, 2], [20, 20, 20], [10, 0, 10],
+                                               [False, False, False], 21, 2)
+        self.assertEqual(winnings.tolist(), [20, -20, 0])
+        self.assertEqual(outcomes.tolist(), [Settlement.PUSH, Settlement.LOSS, Settlement.LOSS])
+
+        # One dealer per hand, a busted dealer, and float wagers paid exactly
+        winnings, _ = settlement.settle([18, 18, 21], [2, 2, 2], [1.0, 1.0, 1.0], [0.5, 0.0, 0.0],
+                                        [False, False, False], [17, 22, 20], [3, 4, 2])
+        self.assertEqual(winnings.tolist(), [0.5, 1.0, 1.5])
+
+    # Tests that settling a game's hands in one pass matches Game.determineWinnings for every round
+    def test_matches_game(self):
+        strategy = Strategy(insurance=True)
+        for upcard in range(1, 11):
+            strategy.hard[11][upcard] = Strategy.DOUBLE
+            for card in range(1, 10):
+                strategy.pairs[card][upcard] = True
+        sim = Simulation(policy=StrategyPolicy(strategy), num_players=3, seed=11)
+        game = sim.getGame()
+        settlement = Settlement(game.getPayout())
+        settled = []
+        distribute = game.distributeWinnings
+
+        def distributeWinnings() -> None:
+            hands, winnings, _ = settlement.settleGame(game)
+            settled.append([(player, int(winning)) for (player, _), winning in zip(hands, winnings)])
+            distribute()
+        game.distributeWinnings = distributeWinnings
+
+        for _ in range(2000):
+            self.assertEqual(sim.playRound(), settled[-1])
+        self.assertEqual(len(settled), 2000)
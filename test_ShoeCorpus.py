@@ -0,0 +1,103 @@
+import os
+import tempfile
+from collections import Counter
+from unittest import TestCase
+from Cards import Cards
+from CountSystem import CountSystem
+from Policy import Policy
+from Rules import Rules
+from ShoeCorpus import ShoeCorpus, writeShoeCorpus
+from Simulation import Simulation
+from SimulationRunner import SimulationRunner
+from Tournament import Tournament
+
+
+class TestShoeCorpus(TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.bjsc')
+        os.close(fd)
+        writeShoeCorpus(self.path, 40, seed=3)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    # Tests that every shoe is a full shuffled shoe and the same seed writes the same file
+    def test_write(self):
+        with ShoeCorpus(self.path) as corpus:
+            self.assertEqual(corpus.numShoes(), 40)
+            self.assertEqual(corpus.getNumDecks(), Cards.NUMDECKS)
+            full_shoe = Counter(list(range(len(Cards.CARDNAMES))) * Cards.NUMDECKS)
+            for shoe_num in range(corpus.numShoes()):
+                shoe = corpus.shoe(shoe_num)
+                self.assertEqual(Counter(shoe), full_shoe)
+            self.assertNotEqual(bytes(corpus.shoe(0)), bytes(corpus.shoe(1)))
+            with self.assertRaises(IndexError):
+                corpus.shoe(40)
+
+        fd, other = tempfile.mkstemp()
+        os.close(fd)
+        writeShoeCorpus(other, 40, seed=3)
+        with open(self.path, 'rb') as f, open(other, 'rb') as g:
+            self.assertEqual(f.read(), g.read())
+        os.remove(other)
+
+    # Tests that the shoes are split into disjoint ranges that cover the whole corpus
+    def test_partition(self):
+        with ShoeCorpus(self.path) as corpus:
+            parts = corpus.partition(7)
+            self.assertEqual([shoe for part in parts for shoe in part], list(range(40)))
+            self.assertTrue(all(5 <= len(part) <= 6 for part in parts))
+            with self.assertRaises(ValueError):
+                corpus.partition(41)
+
+    # Tests that Cards deals a range of shoes in order, moves on to the next one on every shuffle and keeps the count
+    def test_cards(self):
+        with ShoeCorpus(self.path) as corpus:
+            cards = corpus.cards(range(10, 12), count_system=CountSystem.HILO)
+            first = [cards.getCard() for _ in range(corpus.shoeSize())]
+            self.assertEqual(first, list(corpus.shoe(10)))
+            self.assertEqual(cards.deckSize(), 0)
+            self.assertEqual(cards.runningCount(), 0)
+            with self.assertRaisesRegex(IndexError, 'Shoe 10 of the corpus ran out'):
+                cards.getCard()
+
+            cards.shuffle()
+            self.assertEqual(cards.getShoeNum(), 11)
+            self.assertEqual(cards.deckSize(), corpus.shoeSize())
+            self.assertEqual(cards.getCard(), corpus.shoe(11)[0])
+            self.assertEqual(sum(cards.valueCounts()), corpus.shoeSize() - 1)
+
+            cards.shuffle()
+            self.assertEqual(cards.getShoeNum(), 10)
+
+            # The shoes are read-only, so they can't be dealt from a continuous shuffling machine
+            with self.assertRaisesRegex(ValueError, 'continuous shuffling machine'):
+                cards.setContinuous()
+            self.assertFalse(cards.isContinuous())
+            with self.assertRaises(ValueError):
+                Tournament({'one': Policy(), 'two': Policy()}, rules=Rules(continuous_shuffle=True), corpus=corpus)
+
+    # Tests that the corpus closes while Cards and shoes from it are still around, and they can't deal after it
+    def test_close(self):
+        corpus = ShoeCorpus(self.path)
+        cards = corpus.cards(range(5, 7))
+        shoe = corpus.shoe(3)
+        cards.getCard()
+        corpus.close()
+        with self.assertRaises(ValueError):
+            cards.getCard()
+        with self.assertRaises(ValueError):
+            shoe[0]
+
+    # Tests that simulations dealing from the corpus are reproducible, alone or spread over workers
+    def test_simulations(self):
+        with ShoeCorpus(self.path) as corpus:
+            first = Simulation(num_players=2, cards=corpus.cards()).run(200)
+            second = Simulation(num_players=2, cards=corpus.cards()).run(200)
+            self.assertEqual(first, second)
+
+        one_worker = SimulationRunner(num_players=2, workers=1, chunk_rounds=100, corpus_path=self.path).run(400)
+        two_workers = SimulationRunner(num_players=2, workers=2, chunk_rounds=100, corpus_path=self.path).run(400)
+        self.assertEqual(one_worker.getTotal(), two_workers.getTotal())
+        self.assertEqual(one_worker.getCount(), two_workers.getCount())
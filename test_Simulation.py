@@ -0,0 +1,101 @@
+from unittest import TestCase
+from unittest.mock import patch
+from Simulation import Simulation
+from Player import Player
+from Policy import Policy
+from Rules import Rules
+from Statistics import Statistics
+
+
+class TestSimulation(TestCase):
+
+    # Tests that headless rounds never prompt the player and settle at least one hand per player
+    def test_headless_rounds(self):
+        with patch('builtins.input', side_effect=AssertionError('input() called')):
+            sim = Simulation(num_players=2)
+            results = sim.run(50)
+
+        self.assertEqual(results['rounds'], 50)
+        self.assertGreaterEqual(results['hands'], 100)
+        self.assertTrue(sim.getGame().isRoundOver())
+
+    # Tests that messages go to the output sink instead of the console
+    def test_output_sink(self):
+        messages = []
+        sim = Simulation(output=messages.append)
+
+        with patch('builtins.print', side_effect=AssertionError('print() called')):
+            sim.run(1)
+
+        self.assertIn('The round is over! Good game everyone!', messages)
+
+    # Tests that a policy's wager is kept within the min/max bet
+    def test_policy_wager_is_clamped(self):
+        class BigBetter(Policy):
+            def wager(self, player, game):
+                return 10 ** 6
+
+        sim = Simulation(policy=BigBetter())
+        winnings = sim.playRound()
+        game = sim.getGame()
+
+        for _, winning in winnings:
+            self.assertLessEqual(abs(winning), game.getMaxBet() * 2)
+
+    # Tests that a player who went broke is seated again with their money back and none of their last round's hands
+    def test_broke_player_is_refilled(self):
+        test = self
+
+        class AllIn(Policy):
+            def wager(self, player, game):
+                test.assertEqual((player.getMoney(), player.getNumHands(), player.getHand(), player.totalWager(),
+                                  player.hasDoubledDown()), (Player.STARTINGFUNDS, 1, [], 0, False))
+                return player.getMoney()
+
+        sim = Simulation(policy=AllIn(), seed=2, rules=Rules(max_bet=Player.STARTINGFUNDS))
+        player = sim.getPlayers()[0]
+        broke = 0
+        for _ in range(50):
+            (_, winning), = sim.playRound()
+            self.assertGreaterEqual(winning, -Player.STARTINGFUNDS)
+            broke += player not in sim.getGame().players
+        self.assertGreater(broke, 0)
+
+    # Tests that the game adds every settled hand to the simulation's statistics with its outcome and player
+    def test_statistics(self):
+        sim = Simulation(num_players=2, seed=4)
+        results = sim.run(500)
+        stats = sim.getStatistics()
+        histogram = stats.getHistogram()
+
+        self.assertEqual(sum(histogram.values()) - histogram[Statistics.INSURANCEWIN], results['hands'])
+        self.assertEqual(sum(stats.getPlayerNets().values()), results['net'])
+        self.assertEqual(set(stats.getPlayerNets()), {'Player 1', 'Player 2'})
+        self.assertGreaterEqual(stats.getWagered(), results['hands'] * 20)
+        low, high = results['house_edge_interval']
+        self.assertTrue(low < results['house_edge'] < high)
+
+    # Tests that a run stops at the first batch where the house edge is known to the given precision, or at its caps
+    def test_run_until(self):
+        sim = Simulation(num_players=5, seed=6)
+        results = sim.runUntil(0.05, batch_rounds=100)
+        rounds = sim.getRoundStatistics()
+        self.assertTrue(results['converged'])
+        self.assertEqual(results['rounds'] % 100, 0)
+        self.assertLessEqual(rounds.houseEdgeMargin(), 0.05)
+        self.assertAlmostEqual(rounds.houseEdgeMargin(), (results['house_edge_interval'][1] - results['house_edge_interval'][0]) / 2)
+
+        # The rounds add up to the hands, and players sharing the dealer's hand make the interval over rounds wider
+        self.assertEqual((rounds.getCount(), rounds.getTotal(), rounds.getWagered()),
+                         (results['rounds'], results['net'], sim.getStatistics().getWagered()))
+        self.assertGreater(rounds.houseEdgeMargin(), sim.getStatistics().houseEdgeMargin() * 1.1)
+
+        # One batch less wasn't enough, and the same seed stops at the same round
+        shorter = Simulation(num_players=5, seed=6)
+        shorter.run(results['rounds'] - 100)
+        self.assertGreater(shorter.getRoundStatistics().houseEdgeMargin(), 0.05)
+        self.assertEqual(Simulation(num_players=5, seed=6).runUntil(0.05, batch_rounds=100), results)
+
+        capped = Simulation(seed=6).runUntil(0.0001, max_rounds=250, batch_rounds=100)
+        self.assertEqual((capped['rounds'], capped['converged']), (250, False))
+        self.assertEqual(Simulation(seed=6).runUntil(0.0001, max_seconds=0)['rounds'], 0)
@@ -0,0 +1,42 @@
+from unittest import TestCase
+from SimulationRunner import SimulationRunner
+from Simulation import Simulation
+
+
+class TestSimulationRunner(TestCase):
+
+    # Tests that the merged statistics don't depend on the number of workers
+    def test_independent_of_workers(self):
+        one = SimulationRunner(workers=1, seed=3, chunk_rounds=200).run(1000)
+        three = SimulationRunner(workers=3, seed=3, chunk_rounds=200).run(1000)
+
+        self.assertEqual(one.getCount(), three.getCount())
+        self.assertEqual(one.getTotal(), three.getTotal())
+        self.assertEqual(one.getVariance(), three.getVariance())
+        self.assertEqual(one.getOutcomes(), three.getOutcomes())
+
+    # Tests that the same seed plays the same rounds
+    def test_seeded_simulation(self):
+        self.assertEqual(Simulation(seed=5).run(300), Simulation(seed=5).run(300))
+
+    # Tests that an adaptive run stops at the first chunk that reaches the precision, whatever the number of workers
+    def test_run_until(self):
+        runner = SimulationRunner(num_players=3, workers=1, seed=3, chunk_rounds=200)
+        one, converged = runner.runUntil(0.05)
+        self.assertTrue(converged)
+        self.assertLessEqual(runner.getRoundStatistics().houseEdgeMargin(), 0.05)
+        rounds = runner.getRoundStatistics().getCount()
+        self.assertEqual(rounds % 200, 0)
+
+        three, _ = SimulationRunner(num_players=3, workers=3, seed=3, chunk_rounds=200).runUntil(0.05)
+        self.assertEqual((three.getCount(), three.getTotal()), (one.getCount(), one.getTotal()))
+
+        # It's the same as a run of the chunks it played, and one chunk less wasn't precise enough
+        runner = SimulationRunner(num_players=3, workers=2, seed=3, chunk_rounds=200)
+        self.assertEqual(runner.run(rounds).getTotal(), one.getTotal())
+        runner.run(rounds - 200)
+        self.assertGreater(runner.getRoundStatistics().houseEdgeMargin(), 0.05)
+
+        capped, converged = SimulationRunner(workers=2, seed=3, chunk_rounds=200).runUntil(0.0001, max_rounds=500)
+        self.assertFalse(converged)
+        self.assertEqual(capped.getCount(), SimulationRunner(workers=2, seed=3, chunk_rounds=200).run(500).getCount())
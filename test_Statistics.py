@@ -0,0 +1,70 @@
+from unittest import TestCase
+from Statistics import Statistics
+
+
+class TestStatistics(TestCase):
+
+    # Tests that merging partial statistics matches adding every hand to one instance
+    def test_merge(self):
+        values = [20, -20, 0, 30, -40, 20, -20, -10]
+        whole = Statistics()
+        first = Statistics()
+        second = Statistics()
+        for i, value in enumerate(values):
+            whole.add(value)
+            (first if i < 3 else second).add(value)
+        first.merge(second)
+
+        self.assertEqual(first.getCount(), whole.getCount())
+        self.assertEqual(first.getTotal(), whole.getTotal())
+        self.assertAlmostEqual(first.getVariance(), whole.getVariance())
+        self.assertEqual(first.getOutcomes(), whole.getOutcomes())
+
+    # Tests the mean and variance of a few hands
+    def test_mean_and_variance(self):
+        s = Statistics()
+        for value in [20, -20, 0, 40]:
+            s.add(value)
+
+        self.assertEqual(s.getTotal(), 40)
+        self.assertAlmostEqual(s.getMean(), 10.0)
+        self.assertAlmostEqual(s.getVariance(), 2000 / 3)
+        self.assertEqual(s.getOutcomes(), {'wins': 2, 'losses': 1, 'pushes': 1})
+
+    # Tests the outcome histogram, per-player nets and amount wagered, and that they merge
+    def test_outcomes_and_players(self):
+        hands = [(30, Statistics.BLACKJACK, 'Ann', 20, False), (-20, Statistics.BUST, 'Bob', 20, False),
+                 (0, Statistics.LOSS, 'Ann', 20, True), (40, Statistics.WIN, 'Bob', 40, False),
+                 (0, Statistics.PUSH, 'Ann', 20, False)]
+        whole = Statistics()
+        first = Statistics()
+        second = Statistics()
+        for i, hand in enumerate(hands):
+            whole.add(*hand)
+            (first if i < 2 else second).add(*hand)
+        first.merge(second)
+
+        for s in (whole, first):
+            self.assertEqual(s.getHistogram(), {Statistics.BLACKJACK: 1, Statistics.WIN: 1, Statistics.PUSH: 1,
+                                                Statistics.LOSS: 1, Statistics.BUST: 1, Statistics.INSURANCEWIN: 1})
+            self.assertEqual(s.getPlayerNets(), {'Ann': 30, 'Bob': 20})
+            self.assertEqual(s.getWagered(), 120)
+            self.assertAlmostEqual(s.getHouseEdge(), -50 / 120)
+
+    # Tests that the confidence intervals are centered on the estimates and shrink with more hands
+    def test_confidence_intervals(self):
+        s = Statistics()
+        self.assertEqual(s.houseEdgeInterval(), (0.0, 0.0))
+        widths = []
+        for hands in (100, 10000):
+            s = Statistics()
+            for i in range(hands):
+                s.add(20 if i % 3 == 0 else -20, wager=20)
+            low, high = s.confidenceInterval()
+            self.assertAlmostEqual((low + high) / 2, s.getMean())
+            low, high = s.houseEdgeInterval()
+            self.assertAlmostEqual((low + high) / 2, s.getHouseEdge())
+            self.assertLess(low, s.getHouseEdge())
+            self.assertAlmostEqual(s.houseEdgeMargin(), (high - low) / 2)
+            widths.append(high - low)
+        self.assertAlmostEqual(widths[0] / widths[1], 10, delta=0.1)
@@ -0,0 +1,25 @@
+from unittest import TestCase
+from Strategy import Strategy
+
+
+class TestStrategy(TestCase):
+
+    # Tests the default tables, which play like the dealer
+    def test_default_tables(self):
+        s = Strategy()
+
+        self.assertEqual(s.action(16, False, 10), Strategy.HIT)
+        self.assertEqual(s.action(17, True, 10), Strategy.STAND)
+        self.assertFalse(s.shouldSplit(8, 6))
+        self.assertFalse(s.takesInsurance())
+
+    # Tests that decide() agrees with the tables
+    def test_decide(self):
+        s = Strategy()
+        s.hard[11][6] = Strategy.DOUBLE
+        s.pairs[8][6] = True
+
+        self.assertEqual(s.decide(11, False, 0, 6), Strategy.DOUBLE)
+        self.assertEqual(s.decide(16, False, 8, 6), Strategy.SPLIT)
+        self.assertEqual(s.decide(16, False, 8, 10), Strategy.HIT)
+        self.assertEqual(s.decide(18, True, 0, 1), Strategy.STAND)
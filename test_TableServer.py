@@ -0,0 +1,150 @@
+import asyncio
+from unittest import TestCase
+from TableClient import TableClient
+from TableServer import TableServer
+
+
+# Bot that bets the minimum and stands on 17 like the dealer
+def dealerBot(question: str, args: [int]) -> str:
+    if question == 'WAGER':
+        return str(args[0])
+    if question == 'INSURANCE':
+        return '0'
+    if question == 'HIT':
+        return 'hit' if args[1] < 17 else 'stand'
+    return 'N'
+
+
+class TestTableServer(TestCase):
+
+    def _run(self, coroutine):
+        return asyncio.run(asyncio.wait_for(coroutine, 30))
+
+    # Tests rounds played on several tables at once, with two players sharing a table
+    def test_tables(self):
+        async def scenario():
+            server = TableServer(port=0)
+            port = await server.start()
+            clients = [TableClient(port=port) for _ in range(4)]
+            for client in clients:
+                await client.connect()
+            seats = [('one', 'Alice'), ('one', 'Bob'), ('two', 'Carol'), ('three', 'Dave')]
+            for client, (table, name) in zip(clients, seats):
+                self.assertEqual(await client.join(table, name), 1000)
+
+            money = []
+            for _ in range(3):
+                for client in (clients[0], clients[2], clients[3]):
+                    await client.start()
+                money = await asyncio.gather(*(client.play(dealerBot) for client in clients))
+
+            self.assertEqual(len(server.tables), 3)
+            self.assertIsNot(server.tables['one'].game.CARDS, server.tables['two'].game.CARDS)
+            self.assertIsNot(server.tables['one'].game.DEALER, server.tables['two'].game.DEALER)
+            self.assertEqual(server.tables['one'].game.getNumPlayers(), 2)
+            for client, amount in zip(clients, money):
+                self.assertTrue(amount is None or 0 < amount <= 1000 + 3 * 30)
+                self.assertTrue(client.messages)
+
+            for client in clients:
+                await client.close()
+            await server.close()
+
+        self._run(scenario())
+
+    # Tests that protocol mistakes are answered with errors and players can leave between rounds
+    def test_errors(self):
+        async def scenario():
+            server = TableServer(port=0)
+            port = await server.start()
+            client = TableClient(port=port)
+            await client.connect()
+
+            await client.send('START')
+            self.assertEqual(await client.receive(), ('ERROR', 'Not seated'))
+            await client.send('ANSWER 5')
+            self.assertEqual(await client.receive(), ('ERROR', 'Nothing to answer'))
+            await client.send('FOLD')
+            self.assertEqual(await client.receive(), ('ERROR', 'Unknown command FOLD'))
+
+            # A second START sent before the round's task first runs is refused and only one round is played
+            await client.join('one', 'Alice')
+            await client.send('START\nSTART')
+            received = []
+            while not received or received[-1][0] != 'ROUNDOVER':
+                received.append(await client.receive())
+                if received[-1][0] == 'ASK':
+                    question, *args = received[-1][1].split()
+                    await client.send(f'ANSWER {dealerBot(question, [int(arg) for arg in args])}')
+            self.assertEqual([rest for kind, rest in received if kind == 'ERROR'], ['A round is already being played'])
+            self.assertEqual(len([rest for kind, rest in received if rest.startswith('WAGER')]), 1)
+            self.assertFalse(server.tables['one'].playing)
+
+            # A round that fails partway through the deal is reported to the table and abandoned, so the next round
+            # starts from an empty table with the money everyone had before it
+            game = server.tables['one'].game
+            money = game.players[0].getMoney()
+            get_card = game.CARDS.getCard
+            dealt = []
+
+            def failingGetCard() -> int:
+                if len(dealt) == 3:
+                    raise RuntimeError('The shoe jammed')
+                dealt.append(get_card())
+                return dealt[-1]
+            game.CARDS.getCard = failingGetCard
+            await client.start()
+            with self.assertRaisesRegex(ConnectionError, 'The round failed'):
+                await client.play(dealerBot)
+            self.assertFalse(server.tables['one'].playing)
+            self.assertTrue(game.isRoundOver())
+            self.assertEqual(game.players[0].getHand(), [])
+            self.assertEqual(game.DEALER.getHand(), [])
+            self.assertEqual(game.players[0].getMoney(), money)
+
+            game.CARDS.getCard = get_card
+            await client.start()
+            self.assertLessEqual(abs(await client.play(dealerBot) - money), game.getMinBet() * 2)
+            self.assertTrue(game.isRoundOver())
+
+            # Nobody can join a game that's still in the middle of a round
+            other = TableClient(port=port)
+            await other.connect()
+            game.roundOver = False
+            with self.assertRaisesRegex(ConnectionError, 'A round is being played'):
+                await other.join('one', 'Bob')
+            game.roundOver = True
+            self.assertEqual(game.getNumPlayers(), 1)
+            await other.close()
+
+            await client.send('LEAVE')
+            self.assertEqual(await client.receive(), ('LEFT', ''))
+            self.assertEqual(server.tables['one'].game.getNumPlayers(), 0)
+
+            await client.close()
+            await server.close()
+
+        self._run(scenario())
+
+    # Tests that a player who doesn't answer has their decisions made for them instead of stalling the table
+    def test_answer_timeout(self):
+        async def scenario():
+            server = TableServer(port=0, answer_timeout=0.05)
+            port = await server.start()
+            client = TableClient(port=port)
+            await client.connect()
+            await client.join('one', 'Alice')
+
+            await client.start()
+            kinds = []
+            while not kinds or kinds[-1] != 'ROUNDOVER':
+                kinds.append((await client.receive())[0])
+            self.assertIn('ASK', kinds)
+            game = server.tables['one'].game
+            self.assertLessEqual(abs(game.players[0].getMoney() - 1000), game.getMinBet() * 2)
+            self.assertTrue(game.isRoundOver())
+
+            await client.close()
+            await server.close()
+
+        self._run(scenario())
@@ -0,0 +1,59 @@
+import os
+import tempfile
+from unittest import TestCase
+from Policy import Policy
+from ShoeCorpus import ShoeCorpus, writeShoeCorpus
+from Simulation import Simulation
+from Strategy import Strategy
+from StrategyPolicy import StrategyPolicy
+from Tournament import Tournament
+
+
+class TestTournament(TestCase):
+
+    # Tests that the baseline plays exactly like a simulation of its own and that the same policy gets the same cards
+    def test_same_cards(self):
+        tournament = Tournament({'dealer': Policy(), 'again': Policy()}, num_players=2, seed=8)
+        results = tournament.run(1500)
+        self.assertEqual(results['dealer']['net'], Simulation(Policy(), 2, seed=8).run(1500)['net'])
+        self.assertEqual(results['again']['net'], results['dealer']['net'])
+        self.assertEqual(tournament.getDifferences('again').getVariance(), 0.0)
+        self.assertEqual(results['again']['difference_interval'], (0.0, 0.0))
+
+    # Tests that pairing the rounds gives a narrower interval for the difference than independent shoes would
+    def test_paired_differences(self):
+        doubler = Strategy()
+        for upcard in range(1, 11):
+            doubler.hard[11][upcard] = Strategy.DOUBLE
+            doubler.hard[16][upcard] = Strategy.STAND
+        tournament = Tournament({'dealer': Policy(), 'doubler': StrategyPolicy(doubler)}, seed=2)
+        self.assertEqual(tournament.getBaseline(), 'dealer')
+        results = tournament.run(3000)['doubler']
+
+        dealer = tournament.getSimulation('dealer').results()['net']
+        self.assertAlmostEqual(results['difference'] * 3000, results['net'] - dealer)
+        low, high = results['difference_interval']
+        unpaired_low, unpaired_high = results['unpaired_interval']
+        self.assertLess(unpaired_low, low)
+        self.assertLess(high, unpaired_high)
+        self.assertGreater(results['variance_ratio'], 1)
+
+        with self.assertRaises(ValueError):
+            Tournament({'dealer': Policy()})
+
+    # Tests that every table deals the corpus' shoes in the same order as a simulation dealing from the corpus
+    def test_corpus(self):
+        fd, path = tempfile.mkstemp(suffix='.bjsc')
+        os.close(fd)
+        writeShoeCorpus(path, 5, seed=4)
+        corpus = ShoeCorpus(path)
+        tournament = Tournament({'dealer': Policy(), 'again': Policy()}, num_players=3, corpus=corpus)
+        sim = Simulation(Policy(), 3, cards=corpus.cards())
+        for _ in range(300):
+            nets = tournament.playRound()
+            self.assertEqual(nets['dealer'], sum(winning for _, winning in sim.playRound()))
+            self.assertEqual(nets['again'], nets['dealer'])
+
+        del tournament, sim
+        corpus.close()
+        os.remove(path)